@@ -22,6 +22,8 @@ from sqlmodel import SQLModel  # noqa
 from app.models.tryouts import Tryout
 from app.models.users import User
 from app.models.reservations import Reservation
+from app.models.waitlist import WaitlistEntry
+from app.models.idempotency import IdempotencyRecord
 from app.core.config import settings  # noqa
 
 target_metadata = SQLModel.metadata
@@ -0,0 +1,29 @@
+"""drop redundant active reservation index
+
+Revision ID: 18ccfd5ecb05
+Revises: 3b01fa2e6b30
+Create Date: 2026-10-18 10:42:16.381554
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '18ccfd5ecb05'
+down_revision: Union[str, None] = '3b01fa2e6b30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # uq_user_tryout (user_id, tryout_id) 인덱스가 같은 조회를 처리합니다.
+    op.drop_index('ix_reservations_user_id_tryout_id_active', table_name='reservations', postgresql_where=sa.text("status <> 'deleted'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_reservations_user_id_tryout_id_active', 'reservations', ['user_id', 'tryout_id'], unique=False, postgresql_where=sa.text("status <> 'deleted'"))
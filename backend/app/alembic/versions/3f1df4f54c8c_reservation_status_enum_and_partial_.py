@@ -0,0 +1,48 @@
+"""reservation status enum and partial indexes
+
+Revision ID: 3f1df4f54c8c
+Revises: 0bdeea37cbd5
+Create Date: 2026-10-18 09:17:53.070802
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1df4f54c8c'
+down_revision: Union[str, None] = '0bdeea37cbd5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+reservation_status = sa.Enum('pending', 'confirmed', 'deleted', name='reservation_status')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 상태 컬럼을 바꾸기 전에 인덱스를 먼저 삭제해 다시 만들지 않도록 합니다.
+    op.drop_index('ix_reservations_user_id_status', table_name='reservations')
+    reservation_status.create(op.get_bind(), checkfirst=True)
+    op.alter_column('reservations', 'status',
+               existing_type=sa.VARCHAR(),
+               type_=reservation_status,
+               existing_nullable=False,
+               postgresql_using='status::reservation_status')
+    op.create_index('ix_reservations_tryout_id_status_active', 'reservations', ['tryout_id', 'status'], unique=False, postgresql_include=['reserved_seats'], postgresql_where=sa.text("status <> 'deleted'"))
+    op.create_index('ix_reservations_user_id_tryout_id_active', 'reservations', ['user_id', 'tryout_id'], unique=False, postgresql_where=sa.text("status <> 'deleted'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reservations_user_id_tryout_id_active', table_name='reservations', postgresql_where=sa.text("status <> 'deleted'"))
+    op.drop_index('ix_reservations_tryout_id_status_active', table_name='reservations', postgresql_include=['reserved_seats'], postgresql_where=sa.text("status <> 'deleted'"))
+    op.alter_column('reservations', 'status',
+               existing_type=reservation_status,
+               type_=sa.VARCHAR(),
+               existing_nullable=False,
+               postgresql_using='status::text')
+    reservation_status.drop(op.get_bind(), checkfirst=True)
+    op.create_index('ix_reservations_user_id_status', 'reservations', ['user_id', 'status'], unique=False)
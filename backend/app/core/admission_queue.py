@@ -0,0 +1,211 @@
+import math
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.core.config import settings
+from app.core.exceptions import NotFoundError, QueuedError, ServiceUnavailableError
+
+
+@dataclass
+class QueueTicket:
+    id: str
+    owner: str
+    payload: Any
+    seq: int
+    expires_at: float
+    # 마지막으로 발급/재요청된 시각
+    last_seen: float
+
+
+@dataclass
+class _Lane:
+    active: int = 0
+    next_seq: int = 0
+    waiting: "OrderedDict[str, QueueTicket]" = field(default_factory=OrderedDict)
+    by_owner: dict[str, str] = field(default_factory=dict)
+    # 대기 번호 만료 시각의 하한. 이 시각 전에는 만료된 대기 번호를 찾지 않습니다.
+    next_expiry: float = math.inf
+
+
+class VirtualQueue:
+    """
+    키(tryout id)별로 동시에 처리하는 요청 수를 `concurrency`개로 제한하는 가상 대기열.
+
+    한도를 넘은 요청은 기다리지 않고 대기 번호(QueueTicket)를 받아 QueuedError(202)로
+    응답하고, 클라이언트가 대기 번호로 다시 요청(`redeem`)하면 앞선 대기 번호부터
+    처리합니다. `ticket_ttl` 동안 다시 요청하지 않은 대기 번호는 버려집니다.
+    대기열은 워커 프로세스마다 따로 존재하며, `concurrency`가 0이면 제한하지 않습니다.
+
+    `stale_after` 동안 다시 요청하지 않은 대기 번호는 만료 전까지 유지하되 빈 슬롯을
+    차지하지 않으므로, 떠난 클라이언트의 대기 번호 때문에 처리 중인 요청이 없는데도
+    새 요청이 대기 번호를 받는 일이 없습니다.
+    """
+
+    def __init__(
+        self,
+        concurrency: int,
+        max_waiting: int,
+        ticket_ttl: float,
+        retry_after: int = 1,
+        stale_after: float = 3,
+    ):
+        self.concurrency = concurrency
+        self.max_waiting = max_waiting
+        self.ticket_ttl = ticket_ttl
+        self.retry_after = retry_after
+        self.stale_after = stale_after
+        self._lanes: dict[Hashable, _Lane] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def enter(self, key: Hashable, owner: str, payload: Any = None) -> Iterator[None]:
+        """
+        처리 슬롯을 얻어 블록을 실행합니다. 슬롯이 없거나 앞선 대기 번호가 있으면
+        대기 번호를 발급하고 QueuedError를 발생시킵니다.
+        """
+        if self.concurrency <= 0:
+            yield
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            lane = self._lanes.setdefault(key, _Lane())
+            self._drop_expired(lane, now)
+            if not self._has_slot(lane, now, ticket=None):
+                ticket = self._issue(lane, owner, payload)
+                raise self._queued(lane, ticket)
+            lane.active += 1
+
+        try:
+            yield
+        finally:
+            self._release(key)
+
+    @contextmanager
+    def redeem(self, key: Hashable, ticket_id: str, owner: str) -> Iterator[Any]:
+        """
+        대기 번호 차례가 되었으면 슬롯을 얻어 발급 시 저장한 payload로 블록을 실행하고,
+        아니면 현재 순번과 함께 QueuedError를 발생시킵니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            lane = self._lanes.get(key)
+            if lane is not None:
+                self._drop_expired(lane, now)
+            ticket = lane.waiting.get(ticket_id) if lane else None
+            if lane is None or ticket is None or ticket.owner != owner:
+                raise NotFoundError("대기 번호를 찾을 수 없습니다.")
+
+            ticket.last_seen = now
+            if not self._has_slot(lane, now, ticket=ticket):
+                ticket.expires_at = now + self.ticket_ttl
+                raise self._queued(lane, ticket)
+
+            del lane.waiting[ticket.id]
+            lane.by_owner.pop(ticket.owner, None)
+            lane.active += 1
+
+        try:
+            yield ticket.payload
+        finally:
+            self._release(key)
+
+    def waiting(self, key: Hashable) -> int:
+        with self._lock:
+            lane = self._lanes.get(key)
+            return len(lane.waiting) if lane else 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lanes.clear()
+
+    def _issue(self, lane: _Lane, owner: str, payload: Any) -> QueueTicket:
+        # 같은 사용자가 다시 요청하면 기존 대기 번호를 돌려줘 순서를 앞당기지 못하게 합니다.
+        now = time.monotonic()
+        existing = lane.by_owner.get(owner)
+        if existing is not None:
+            ticket = lane.waiting[existing]
+            ticket.payload = payload
+            ticket.expires_at = now + self.ticket_ttl
+            ticket.last_seen = now
+            return ticket
+
+        if len(lane.waiting) >= self.max_waiting:
+            raise ServiceUnavailableError(
+                "예약 대기 인원이 많습니다. 잠시 후 다시 시도해주세요."
+            )
+
+        ticket = QueueTicket(
+            id=uuid.uuid4().hex,
+            owner=owner,
+            payload=payload,
+            seq=lane.next_seq,
+            expires_at=now + self.ticket_ttl,
+            last_seen=now,
+        )
+        lane.next_seq += 1
+        lane.next_expiry = min(lane.next_expiry, ticket.expires_at)
+        lane.waiting[ticket.id] = ticket
+        lane.by_owner[owner] = ticket.id
+        return ticket
+
+    def _queued(self, lane: _Lane, ticket: QueueTicket) -> QueuedError:
+        return QueuedError(
+            ticket_id=ticket.id,
+            position=self._position(lane, ticket),
+            retry_after=self.retry_after,
+        )
+
+    @staticmethod
+    def _position(lane: _Lane, ticket: QueueTicket) -> int:
+        # 발급 순번의 차이로 계산하므로, 중간의 대기 번호가 빠진 경우 실제보다 클 수 있습니다.
+        head = next(iter(lane.waiting.values()))
+        return ticket.seq - head.seq + 1
+
+    def _has_slot(self, lane: _Lane, now: float, ticket: QueueTicket | None) -> bool:
+        """
+        빈 슬롯이 앞선 대기 번호(ticket이 None이면 대기 중인 모든 번호) 중 최근에 다시
+        요청한 번호보다 많은지 확인합니다. 빈 슬롯 수만큼만 세고 멈춥니다.
+        """
+        free = self.concurrency - lane.active
+        ahead = 0
+        for other in lane.waiting.values():
+            if ahead >= free or other is ticket:
+                break
+            if now - other.last_seen <= self.stale_after:
+                ahead += 1
+        return ahead < free
+
+    @staticmethod
+    def _drop_expired(lane: _Lane, now: float) -> None:
+        # 재요청하면 만료 시각이 늦춰지므로 대기열 순서와 만료 순서가 다를 수 있습니다.
+        # 가장 이른 만료 시각이 지났을 때만 전체에서 만료된 대기 번호를 정리합니다.
+        if now < lane.next_expiry:
+            return
+        for ticket in [t for t in lane.waiting.values() if t.expires_at <= now]:
+            del lane.waiting[ticket.id]
+            lane.by_owner.pop(ticket.owner, None)
+        lane.next_expiry = min(
+            (ticket.expires_at for ticket in lane.waiting.values()), default=math.inf
+        )
+
+    def _release(self, key: Hashable) -> None:
+        with self._lock:
+            lane = self._lanes[key]
+            lane.active -= 1
+            if lane.active == 0 and not lane.waiting:
+                del self._lanes[key]
+
+
+# 시험 예약 신청(POST /tryouts/{id}/reserve) 앞단의 대기열
+reserve_queue = VirtualQueue(
+    concurrency=settings.RESERVE_QUEUE_CONCURRENCY,
+    max_waiting=settings.RESERVE_QUEUE_MAX_WAITING,
+    ticket_ttl=settings.RESERVE_QUEUE_TICKET_TTL_SECONDS,
+)
@@ -0,0 +1,204 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.transaction import run_after_commit
+
+if TYPE_CHECKING:
+    from app.core.idempotency import StoredResponse
+    from app.core.schedule import UserSchedule
+    from app.models.tryouts import Tryout
+    from app.models.users import UserPrincipal
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    프로세스 단위의 스레드 안전한 TTL + LRU 캐시.
+
+    `max_size`를 넘으면 가장 오래 사용하지 않은 항목부터 제거하고,
+    `ttl`이 0 이하이면 아무것도 저장하지 않습니다.
+
+    `generation`은 `invalidate`/`clear`마다 증가합니다. 조회 전에 읽어 둔 값을
+    `set(..., generation=)`으로 넘기면, 조회 도중 같은 키가 무효화되었을 때 이전
+    결과를 저장하지 않습니다.
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.generation = 0
+        self._items: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        # 최근 무효화된 키 -> 무효화 시점의 generation (최대 max_size개)
+        self._invalidated: OrderedDict[K, int] = OrderedDict()
+        # _invalidated에서 밀려난 기록 중 가장 최근 generation
+        self._floor = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(
+        self, key: K, value: V, ttl: float | None = None, generation: int | None = None
+    ) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            if generation is not None and (
+                generation < self._floor or self._invalidated.get(key, 0) > generation
+            ):
+                return
+            self._items[key] = (time.monotonic() + ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self.generation += 1
+            self._items.pop(key, None)
+            self._invalidated[key] = self.generation
+            self._invalidated.move_to_end(key)
+            while len(self._invalidated) > self.max_size:
+                _, self._floor = self._invalidated.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._items.clear()
+            self._invalidated.clear()
+            self._floor = self.generation
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class VersionedCache(Generic[K, V]):
+    """
+    버전 번호를 키에 포함하는 캐시.
+
+    `bump()`로 버전을 올리면 이전 버전의 항목은 더 이상 조회되지 않고
+    LRU/TTL에 의해 자연스럽게 밀려납니다. 조회 전에 읽어 둔 `version`으로
+    저장하므로, 조회 도중 무효화되면 이전 결과가 새 버전으로 저장되지 않습니다.
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        self.version = 0
+        self._cache: TTLCache[tuple[int, K], V] = TTLCache(ttl, max_size)
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        return self._cache.get((self.version, key))
+
+    def set(self, version: int, key: K, value: V) -> None:
+        self._cache.set((version, key), value)
+
+    def bump(self) -> None:
+        with self._lock:
+            self.version += 1
+
+
+# 인증 캐시 (app.dependencies.get_current_user에서 사용)
+# - token_cache: 원본 토큰 -> 디코딩된 subject. 토큰 만료 시각을 넘겨 보관하지 않습니다.
+# - principal_cache: subject(사용자 id) -> UserPrincipal
+token_cache: TTLCache[str, str] = TTLCache(
+    ttl=settings.AUTH_CACHE_TTL_SECONDS, max_size=settings.AUTH_CACHE_MAX_SIZE
+)
+principal_cache: "TTLCache[str, UserPrincipal]" = TTLCache(
+    ttl=settings.AUTH_CACHE_TTL_SECONDS, max_size=settings.AUTH_CACHE_MAX_SIZE
+)
+
+
+def invalidate_user(user_id: uuid.UUID | str) -> None:
+    """
+    사용자 비활성화/권한 변경 시 캐시된 principal을 제거합니다.
+
+    User 엔티티의 ORM update/delete가 커밋되면 자동으로 호출되며,
+    벌크 UPDATE처럼 ORM 이벤트를 거치지 않는 변경은 직접 호출해야 합니다.
+    캐시는 프로세스 단위이므로 다른 워커에는 최대 TTL만큼 이전 값이 남을 수 있습니다.
+    """
+    principal_cache.invalidate(str(user_id))
+
+
+# 시험 목록 캐시 (app.services.tryouts에서 사용)
+# - tryout_page_cache: 사용자와 무관한 공개 시험 목록 페이지. 시험 정보나 확정 인원이
+#   바뀌면 버전을 올려 전체를 무효화합니다.
+tryout_page_cache: VersionedCache[Hashable, Any] = VersionedCache(
+    ttl=settings.TRYOUT_LIST_CACHE_TTL_SECONDS,
+    max_size=settings.TRYOUT_LIST_CACHE_MAX_SIZE,
+)
+
+# 사용자별 시간표 캐시 (app.services.reservations에서 사용)
+# - user_schedule_cache: 사용자 id -> 예약(삭제 제외)한 시험의 시간표(UserSchedule).
+#   예약 신청의 사전 검증(중복/동시간대)과 목록의 isApplied에 사용합니다.
+user_schedule_cache: "TTLCache[uuid.UUID, UserSchedule]" = TTLCache(
+    ttl=settings.USER_SCHEDULE_CACHE_TTL_SECONDS,
+    max_size=settings.USER_SCHEDULE_CACHE_MAX_SIZE,
+)
+
+# 시험 스냅샷 캐시 (app.services.tryouts에서 사용)
+# - tryout_snapshot_cache: tryout id -> 세션에 연결되지 않은 Tryout.
+#   예약 신청을 대기열과 tryout 행 잠금 전에 미리 검증할 때 사용합니다.
+tryout_snapshot_cache: "TTLCache[int, Tryout]" = TTLCache(
+    ttl=settings.TRYOUT_SNAPSHOT_CACHE_TTL_SECONDS,
+    max_size=settings.TRYOUT_SNAPSHOT_CACHE_MAX_SIZE,
+)
+
+# 멱등 키 캐시 (app.core.idempotency에서 사용)
+# - idempotency_cache: (사용자 id, Idempotency-Key) -> 저장된 응답.
+#   idempotency_keys 테이블 앞단의 LRU로, 재시도 요청을 DB 조회 없이 응답합니다.
+idempotency_cache: "TTLCache[tuple[uuid.UUID, str], StoredResponse]" = TTLCache(
+    ttl=settings.IDEMPOTENCY_TTL_SECONDS,
+    max_size=settings.IDEMPOTENCY_CACHE_MAX_SIZE,
+)
+
+
+def invalidate_tryouts(session: Session, tryout_id: int | None) -> None:
+    """
+    시험 정보 또는 확정 인원이 바뀐 트랜잭션이 커밋되면 목록 캐시와 해당 시험의
+    스냅샷을 무효화합니다.
+    """
+
+    def invalidate() -> None:
+        tryout_page_cache.bump()
+        if tryout_id is not None:
+            tryout_snapshot_cache.invalidate(tryout_id)
+
+    run_after_commit(session, invalidate)
+
+
+def invalidate_user_principal(session: Session, user_id: uuid.UUID) -> None:
+    """사용자 변경이 커밋되면 캐시된 principal을 제거합니다."""
+    run_after_commit(session, lambda: invalidate_user(user_id))
+
+
+def invalidate_user_reservations(session: Session, user_id: uuid.UUID) -> None:
+    run_after_commit(session, lambda: user_schedule_cache.invalidate(user_id))
+
+
+def reset_caches() -> None:
+    """벌크 DELETE처럼 ORM 이벤트를 거치지 않는 변경 이후 캐시를 모두 비웁니다."""
+    tryout_page_cache.bump()
+    user_schedule_cache.clear()
+    tryout_snapshot_cache.clear()
+    principal_cache.clear()
+    token_cache.clear()
+    idempotency_cache.clear()
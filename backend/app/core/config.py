@@ -62,9 +62,129 @@ class Settings(BaseSettings):
             path=self.POSTGRES_DB,
         )
 
+    # 커넥션 풀 설정 (워커 프로세스마다 별도의 풀을 가집니다)
+    WEB_CONCURRENCY: int = 1
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # 설정 시 워커 수(WEB_CONCURRENCY)로 나눈 값을 워커당 최대 커넥션 수로 사용합니다.
+    DB_MAX_CONNECTIONS: int | None = None
+    # 0이면 statement_timeout을 설정하지 않습니다.
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    # PgBouncer(transaction pooling) 등 외부 풀러 사용 시 앱 내부 풀과
+    # 서버 측 prepared statement를 사용하지 않습니다.
+    DB_EXTERNAL_POOLER: bool = False
+
+    # 요청 지표: 엔드포인트별 처리 시간, SQL 수, DB/행 잠금/커밋 시간을 집계해
+    # GET /metrics(Prometheus 형식)로 노출합니다. SERVER_TIMING_ENABLED이면
+    # 같은 값을 응답의 Server-Timing 헤더로도 반환합니다.
+    # GET /metrics는 METRICS_TOKEN을 Bearer 토큰으로 보낸 요청에만 응답하며,
+    # 설정하지 않으면(기본) 모든 요청을 거절합니다.
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: str | None = None
+    SERVER_TIMING_ENABLED: bool = False
+
+    # SQL 프로파일러 (staging 등에서만 사용): fingerprint별 지연 시간 분포 집계,
+    # 요청 내 반복 쿼리(N+1) 경고, SLOW_MS 이상인 쿼리의 EXPLAIN 로그.
+    # 결과는 GET /api/v1/utils/query-profile/ 및 app.profiler 로거로 확인합니다.
+    # EXPLAIN_ANALYZE이면 잠금 없는 SELECT를 실제로 다시 실행해(EXPLAIN ANALYZE)
+    # 실행 통계를 남기므로, 부수 효과가 있는 함수를 호출하는 SELECT가 없을 때만 켭니다.
+    QUERY_PROFILER_ENABLED: bool = False
+    QUERY_PROFILER_SLOW_MS: float = 100
+    QUERY_PROFILER_N_PLUS_ONE_THRESHOLD: int = 3
+    QUERY_PROFILER_EXPLAIN_ANALYZE: bool = False
+
+    # 인증 캐시: 토큰 디코딩 결과와 사용자 정보(id, is_active, is_superuser)를
+    # 프로세스 메모리에 보관합니다. TTL이 0이면 캐시하지 않습니다.
+    AUTH_CACHE_TTL_SECONDS: float = 60
+    AUTH_CACHE_MAX_SIZE: int = 10_000
+
+    # 시험 목록 캐시: 공개 목록 페이지를 보관합니다.
+    # 변경 시 같은 프로세스에서는 커밋 직후 무효화되며, 다른 워커에는 최대 TTL만큼
+    # 이전 값이 남을 수 있습니다. TTL이 0이면 캐시하지 않습니다.
+    TRYOUT_LIST_CACHE_TTL_SECONDS: float = 30
+    TRYOUT_LIST_CACHE_MAX_SIZE: int = 1_000
+
+    # 사용자별 시간표 캐시: 예약 신청의 사전 검증(중복/동시간대)과 목록의 isApplied에 사용합니다.
+    # 같은 프로세스에서는 예약 변경 커밋 직후 무효화되며, 다른 워커에서 변경된 예약은
+    # 최대 TTL만큼 늦게 반영됩니다. TTL이 0이면 매번 DB에서 조회합니다.
+    USER_SCHEDULE_CACHE_TTL_SECONDS: float = 30
+    USER_SCHEDULE_CACHE_MAX_SIZE: int = 10_000
+
+    # 시험 스냅샷 캐시: 예약 신청을 잠금 없이 미리 검증(신청 기간, 정원)할 때 사용합니다.
+    # 같은 프로세스에서는 시험 변경 커밋 직후 무효화되며, 다른 워커에서 확정된 좌석은
+    # 최대 TTL만큼 늦게 반영되므로 TTL을 짧게 둡니다. TTL이 0이면 매번 DB에서 조회합니다.
+    TRYOUT_SNAPSHOT_CACHE_TTL_SECONDS: float = 1
+    TRYOUT_SNAPSHOT_CACHE_MAX_SIZE: int = 10_000
+
+    # 비밀번호 해시: bcrypt 비용과 해시 전용 프로세스 풀 크기.
+    # 실행 중 + 대기 중인 해시 작업이 WORKERS + QUEUE_SIZE를 넘으면 503으로 거절합니다.
+    # PASSWORD_HASH_WORKERS=0이면 요청 스레드에서 바로 계산합니다.
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_SIZE: int = 8
+
     FIRST_SUPERUSER: EmailStr
     FIRST_SUPERUSER_PASSWORD: str
 
+    # sync: 스레드풀에서 동기 Session으로 처리 (기본값)
+    # async: 시험 조회/신청, 예약 조회 API를 AsyncSession 기반 async 라우터로 처리
+    DATABASE_MODE: Literal["sync", "async"] = "sync"
+
+    # row_lock: tryout 행을 SELECT ... FOR UPDATE로 잠근 뒤 확정 인원을 갱신
+    # conditional_update: 조건부 UPDATE ... RETURNING 한 번으로 확정 인원을 갱신
+    # ledger: 프로세스 메모리의 좌석 원장에서 확정 인원을 관리하고 주기적으로 기록
+    ADMISSION_ENGINE: Literal["row_lock", "conditional_update", "ledger"] = (
+        "conditional_update"
+    )
+    # 좌석 원장(ADMISSION_ENGINE=ledger): 커밋된 확정 인원을 FLUSH_INTERVAL_MS마다
+    # tryouts 테이블에 기록합니다. tryout별 단일 writer는 advisory lock
+    # (LOCK_NAMESPACE, tryout id)으로 보장합니다.
+    CAPACITY_LEDGER_FLUSH_INTERVAL_MS: int = 50
+    CAPACITY_LEDGER_LOCK_NAMESPACE: int = 7_402
+
+    # 예약 신청 가상 대기열: tryout별 동시 예약 신청을 CONCURRENCY개로 제한하고,
+    # 넘는 요청에는 대기 번호를 발급해 202로 응답합니다. 워커 프로세스 단위로
+    # 적용되며 CONCURRENCY가 0(기본)이면 제한하지 않습니다. 대기 인원이 MAX_WAITING을
+    # 넘으면 503으로 거절합니다.
+    RESERVE_QUEUE_CONCURRENCY: int = 0
+    RESERVE_QUEUE_MAX_WAITING: int = 10_000
+    RESERVE_QUEUE_TICKET_TTL_SECONDS: float = 30
+
+    # 예약 일괄 신청(POST /reservations/import): 업로드 파일을 BATCH_SIZE행씩 한
+    # 트랜잭션으로 검증하고 신청합니다.
+    RESERVATION_IMPORT_BATCH_SIZE: int = 1_000
+    # 예약 내보내기(GET /reservations/export): 서버 측 커서에서 한 번에 가져와
+    # 응답 청크 하나로 쓰는 행 수.
+    RESERVATION_EXPORT_CHUNK_SIZE: int = 1_000
+
+    # 멱등 키(Idempotency-Key 헤더): 예약 신청/확정/수정/삭제 응답을 TTL_SECONDS 동안
+    # idempotency_keys 테이블에 보관하고, 같은 키로 재시도하면 저장된 응답을 반환합니다.
+    # 최근 응답은 CACHE_MAX_SIZE개까지 프로세스 메모리(LRU)에서 먼저 찾고, 만료된 행은
+    # PURGE_INTERVAL_SECONDS마다 삭제합니다.
+    IDEMPOTENCY_TTL_SECONDS: int = 60 * 60 * 24
+    IDEMPOTENCY_CACHE_MAX_SIZE: int = 10_000
+    IDEMPOTENCY_PURGE_INTERVAL_SECONDS: float = 300
+
+    # 확정 인원 정합성 보정(python -m app.reconcile): tryout 행 잠금을 기다리는 최대 시간.
+    # 넘으면 해당 tryout은 건너뛰고 다음 실행에서 다시 확인합니다.
+    RECONCILE_LOCK_TIMEOUT_MS: int = 100
+
+    # 대기열 승격 워커: 좌석이 반환된 tryout의 대기자를 FIFO 순서로 BATCH_SIZE건씩
+    # 확정 예약으로 승격합니다. 다른 워커 프로세스에서 반환된 좌석도 처리하도록
+    # POLL_SECONDS마다 대기자가 있는 tryout을 다시 확인합니다.
+    WAITLIST_WORKER_ENABLED: bool = True
+    WAITLIST_BATCH_SIZE: int = 100
+    WAITLIST_POLL_SECONDS: float = 5
+
+    # 신청 기간 스케줄러: 아직 시작하지 않은 시험의 신청 기간을 메모리에 두고,
+    # 신청 시작/마감 시각마다 신청 가능 여부를 바꿉니다. 예약 신청은 신청 기간이 아닌
+    # 시험을 tryout 행 잠금 전에 거절합니다. 신청 기간은 REFRESH_SECONDS마다 다시 읽습니다.
+    REGISTRATION_WINDOW_SCHEDULER_ENABLED: bool = True
+    REGISTRATION_WINDOW_REFRESH_SECONDS: float = 60
+
     def _check_default_secret(self, var_name: str, value: str | None) -> None:
         if value == "changethis":
             message = (
@@ -1,14 +1,39 @@
 from datetime import datetime, timedelta
+from typing import Any
 
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, create_engine
 
 from app.core.config import settings
+from app.core.metrics import instrument_engine
+from app.core.pool import engine_options, pool_status
+from app.core.profiler import query_profiler
 from app.models.tryouts import TryoutCreate
 from app.models.users import UserCreate
 from app.repository.tryouts import TryoutRepository
 from app.repository.users import UserRepository
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI), **engine_options(is_async=False)
+)
+async_engine = create_async_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI), **engine_options(is_async=True)
+)
+
+if settings.METRICS_ENABLED:
+    instrument_engine(engine)
+    instrument_engine(async_engine.sync_engine)
+
+if settings.QUERY_PROFILER_ENABLED:
+    query_profiler.instrument(engine, explain_engine=engine)
+    query_profiler.instrument(async_engine.sync_engine, explain_engine=engine)
+
+
+def get_pool_status() -> dict[str, Any]:
+    return {
+        "sync": pool_status(engine.pool),
+        "async": pool_status(async_engine.sync_engine.pool),
+    }
 
 
 def init_db(session: Session) -> None:
@@ -62,3 +87,4 @@ def init_db(session: Session) -> None:
                 confirmed_reserved_count=i * 5000,
             )
             tryout_repo.create(tryouts_create=tryout)
+        session.commit()
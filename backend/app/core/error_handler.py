@@ -7,7 +7,9 @@ from app.core.exceptions import (
     BadRequestError,
     InvalidReservationPeriodError,
     NotFoundError,
+    QueuedError,
     ReservationNotFoundError,
+    ServiceUnavailableError,
     TryoutFullError,
 )
 
@@ -67,3 +69,26 @@ def register_error_handlers(app: FastAPI) -> None:
             status_code=400,
             content={"detail": str(exc) or "잘못된 요청입니다."},
         )
+
+    @app.exception_handler(ServiceUnavailableError)
+    async def service_unavailable_handler(
+        _: Request, exc: ServiceUnavailableError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=503,
+            content={"detail": str(exc) or "잠시 후 다시 시도해주세요."},
+            headers={"Retry-After": "1"},
+        )
+
+    @app.exception_handler(QueuedError)
+    async def queued_handler(_: Request, exc: QueuedError) -> JSONResponse:
+        return JSONResponse(
+            status_code=202,
+            content={
+                "detail": str(exc),
+                "ticket_id": exc.ticket_id,
+                "position": exc.position,
+                "retry_after": exc.retry_after,
+            },
+            headers={"Retry-After": str(exc.retry_after)},
+        )
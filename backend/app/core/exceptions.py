@@ -24,3 +24,19 @@ class AuthorizationError(Exception):
 
 class BadRequestError(Exception):
     pass
+
+
+class ServiceUnavailableError(Exception):
+    pass
+
+
+class QueuedError(Exception):
+    """처리 한도를 넘어 대기 번호를 발급한 경우. 202와 함께 대기 번호를 반환합니다."""
+
+    def __init__(self, ticket_id: str, position: int, retry_after: int):
+        super().__init__(
+            "대기열에 등록되었습니다. 잠시 후 대기 번호로 다시 요청해주세요."
+        )
+        self.ticket_id = ticket_id
+        self.position = position
+        self.retry_after = retry_after
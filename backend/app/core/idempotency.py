@@ -0,0 +1,341 @@
+import hashlib
+import logging
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+from fastapi import HTTPException
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import idempotency_cache
+from app.core.config import settings
+from app.core.db import async_engine, engine
+from app.dependencies import decode_token
+from app.models.idempotency import IdempotencyRecord
+from app.repository.idempotency import (
+    AsyncIdempotencyRepository,
+    IdempotencyRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_KEY_HEADER = "idempotency-key"
+REPLAYED_HEADER = "idempotent-replayed"
+MAX_KEY_LENGTH = 255
+
+# 멱등 키를 적용하는 요청: 예약 신청, 확정, 수정, 삭제
+_IDEMPOTENT_ROUTES = [
+    (method, re.compile(f"^{re.escape(settings.API_V1_STR)}{pattern}$"))
+    for method, pattern in (
+        ("POST", r"/tryouts/\d+/reserve"),
+        ("POST", r"/reservations/\d+/confirm"),
+        ("PATCH", r"/reservations/\d+"),
+        ("DELETE", r"/reservations/\d+/delete"),
+    )
+]
+
+
+class StoredResponse(NamedTuple):
+    fingerprint: str
+    status_code: int
+    content_type: str | None
+    body: bytes
+    expires_at: datetime
+
+
+def _is_idempotent_route(method: str, path: str) -> bool:
+    return any(
+        method == route_method and pattern.match(path)
+        for route_method, pattern in _IDEMPOTENT_ROUTES
+    )
+
+
+def _fingerprint(scope: Scope, body: bytes) -> str:
+    digest = hashlib.sha256()
+    for part in (scope["method"], scope["path"], scope["query_string"], body):
+        digest.update(part if isinstance(part, bytes) else part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _is_storable(status_code: int) -> bool:
+    # 대기열 등록(202)과 서버 오류(5xx)는 재시도하면 결과가 달라질 수 있어 저장하지 않습니다.
+    return status_code < 500 and status_code != 202
+
+
+class IdempotencyStore:
+    """
+    멱등 키별 응답 저장소. 프로세스 메모리의 LRU(idempotency_cache)를 먼저 확인하고,
+    없으면 idempotency_keys 테이블에서 찾습니다.
+
+    같은 프로세스에서 처리 중인 키는 `claim`으로 표시해 동시에 들어온 재시도가
+    요청을 한 번 더 실행하지 않도록 합니다.
+
+    DB는 DATABASE_MODE의 엔진으로 접근합니다. sync 모드에서 async 엔진을 쓰면
+    커넥션 예산(DB_MAX_CONNECTIONS)에 포함되지 않는 풀이 하나 더 생기므로, 동기
+    엔진을 스레드풀에서 사용합니다.
+    """
+
+    def __init__(self, ttl: float, purge_interval: float):
+        self.ttl = ttl
+        self.purge_interval = purge_interval
+        self._in_flight: set[tuple[uuid.UUID, str]] = set()
+        self._lock = threading.Lock()
+        self._last_purge = 0.0
+
+    def claim(self, cache_key: tuple[uuid.UUID, str]) -> bool:
+        with self._lock:
+            if cache_key in self._in_flight:
+                return False
+            self._in_flight.add(cache_key)
+            return True
+
+    def release(self, cache_key: tuple[uuid.UUID, str]) -> None:
+        with self._lock:
+            self._in_flight.discard(cache_key)
+
+    async def get(self, cache_key: tuple[uuid.UUID, str]) -> StoredResponse | None:
+        stored = idempotency_cache.get(cache_key)
+        if stored is not None:
+            return stored
+
+        now = datetime.now()
+        if settings.DATABASE_MODE == "async":
+            async with AsyncSession(async_engine) as session:
+                repo = AsyncIdempotencyRepository(session)
+                record = await repo.get(*cache_key, now=now)
+        else:
+            record = await run_in_threadpool(self._get_sync, cache_key, now)
+        if record is None:
+            return None
+        stored = StoredResponse(
+            fingerprint=record.fingerprint,
+            status_code=record.status_code,
+            content_type=record.content_type,
+            body=record.body,
+            expires_at=record.expires_at,
+        )
+        self._remember(cache_key, stored, now)
+        return stored
+
+    async def save(
+        self,
+        cache_key: tuple[uuid.UUID, str],
+        fingerprint: str,
+        status_code: int,
+        content_type: str | None,
+        body: bytes,
+    ) -> None:
+        now = datetime.now()
+        stored = StoredResponse(
+            fingerprint=fingerprint,
+            status_code=status_code,
+            content_type=content_type,
+            body=body,
+            expires_at=now + timedelta(seconds=self.ttl),
+        )
+        user_id, key = cache_key
+        record = IdempotencyRecord(
+            user_id=user_id, key=key, created_at=now, **stored._asdict()
+        )
+        purge = self._should_purge()
+        if settings.DATABASE_MODE == "async":
+            async with AsyncSession(async_engine) as session:
+                repo = AsyncIdempotencyRepository(session)
+                await repo.save(record)
+                if purge:
+                    await repo.purge_expired(now)
+                await session.commit()
+        else:
+            await run_in_threadpool(self._save_sync, record, purge, now)
+        self._remember(cache_key, stored, now)
+
+    @staticmethod
+    def _get_sync(
+        cache_key: tuple[uuid.UUID, str], now: datetime
+    ) -> IdempotencyRecord | None:
+        with Session(engine) as session:
+            return IdempotencyRepository(session).get(*cache_key, now=now)
+
+    @staticmethod
+    def _save_sync(record: IdempotencyRecord, purge: bool, now: datetime) -> None:
+        with Session(engine) as session:
+            repo = IdempotencyRepository(session)
+            repo.save(record)
+            if purge:
+                repo.purge_expired(now)
+            session.commit()
+
+    def _remember(
+        self, cache_key: tuple[uuid.UUID, str], stored: StoredResponse, now: datetime
+    ) -> None:
+        idempotency_cache.set(
+            cache_key, stored, ttl=(stored.expires_at - now).total_seconds()
+        )
+
+    def _should_purge(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_purge < self.purge_interval:
+                return False
+            self._last_purge = now
+            return True
+
+
+idempotency_store = IdempotencyStore(
+    ttl=settings.IDEMPOTENCY_TTL_SECONDS,
+    purge_interval=settings.IDEMPOTENCY_PURGE_INTERVAL_SECONDS,
+)
+
+
+def _subject(headers: Headers) -> uuid.UUID | None:
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return uuid.UUID(decode_token(token))
+    except (HTTPException, ValueError):
+        # 인증 실패는 라우터의 인증 의존성이 응답하도록 그대로 넘깁니다.
+        return None
+
+
+class IdempotencyMiddleware:
+    """
+    `Idempotency-Key` 헤더가 있는 예약 신청/확정/수정/삭제 요청의 응답을 저장하고,
+    같은 사용자가 같은 키로 다시 요청하면 라우터(트랜잭션, tryout 잠금)를 거치지 않고
+    저장된 응답을 `Idempotent-Replayed: true` 헤더와 함께 반환합니다.
+
+    - 같은 키로 메서드, 경로, 쿼리, 본문이 다른 요청을 보내면 422로 거절합니다.
+    - 같은 키의 요청이 처리 중이면 409로 거절합니다. (같은 워커 프로세스 기준)
+    - 대기열 등록(202)과 서버 오류(5xx) 응답은 저장하지 않아 다시 시도할 수 있습니다.
+    """
+
+    def __init__(self, app: ASGIApp, store: IdempotencyStore = idempotency_store):
+        self.app = app
+        self.store = store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _is_idempotent_route(
+            scope["method"], scope["path"]
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        key = headers.get(IDEMPOTENCY_KEY_HEADER)
+        user_id = _subject(headers) if key is not None else None
+        if key is None or user_id is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not key or len(key) > MAX_KEY_LENGTH:
+            response: Response = JSONResponse(
+                status_code=400,
+                content={
+                    "detail": f"Idempotency-Key는 1~{MAX_KEY_LENGTH}자여야 합니다."
+                },
+            )
+            await response(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        fingerprint = _fingerprint(scope, body)
+        cache_key = (user_id, key)
+
+        stored = await self.store.get(cache_key)
+        if stored is not None:
+            await self._replay(stored, fingerprint)(scope, receive, send)
+            return
+
+        if not self.store.claim(cache_key):
+            response = JSONResponse(
+                status_code=409,
+                content={"detail": "같은 Idempotency-Key의 요청을 처리 중입니다."},
+                headers={"Retry-After": "1"},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self._handle(scope, body, receive, send, cache_key, fingerprint)
+        finally:
+            self.store.release(cache_key)
+
+    async def _handle(
+        self,
+        scope: Scope,
+        body: bytes,
+        receive: Receive,
+        send: Send,
+        cache_key: tuple[uuid.UUID, str],
+        fingerprint: str,
+    ) -> None:
+        status_code = 500
+        content_type: str | None = None
+        chunks: list[bytes] = []
+        body_sent = False
+
+        async def receive_body() -> Message:
+            nonlocal body_sent
+            # 이미 읽은 본문을 한 번 전달하고, 이후에는 원래 receive로 연결 종료를 기다립니다.
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, content_type
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                content_type = Headers(raw=message["headers"]).get("content-type")
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, receive_body, send_wrapper)
+
+        if not _is_storable(status_code):
+            return
+        try:
+            await self.store.save(
+                cache_key, fingerprint, status_code, content_type, b"".join(chunks)
+            )
+        except Exception:
+            # 응답은 이미 전송되었으므로 저장에 실패해도 요청은 실패로 처리하지 않습니다.
+            logger.exception("멱등 키 응답 저장 중 오류가 발생했습니다.")
+
+    @staticmethod
+    def _replay(stored: StoredResponse, fingerprint: str) -> Response:
+        if stored.fingerprint != fingerprint:
+            return JSONResponse(
+                status_code=422,
+                content={
+                    "detail": "같은 Idempotency-Key로 다른 요청을 보낼 수 없습니다."
+                },
+            )
+        headers = {REPLAYED_HEADER: "true"}
+        if stored.content_type is not None:
+            headers["content-type"] = stored.content_type
+        return Response(
+            content=stored.body, status_code=stored.status_code, headers=headers
+        )
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
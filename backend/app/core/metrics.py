@@ -0,0 +1,222 @@
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+# 초 단위 히스토그램 버킷
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class RequestStats:
+    """요청 하나에서 실행된 SQL 수와 DB/잠금 대기/커밋 시간."""
+
+    sql_count: int = 0
+    db_seconds: float = 0.0
+    # 행 잠금을 잡는 문장(SELECT ... FOR UPDATE, UPDATE, DELETE)의 실행 시간.
+    # 잠금 대기가 대부분을 차지하므로 잠금 대기 시간의 근사값으로 사용합니다.
+    lock_seconds: float = 0.0
+    commit_seconds: float = 0.0
+    _commit_started: float | None = field(default=None, repr=False)
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def current_request_stats() -> RequestStats | None:
+    return _request_stats.get()
+
+
+def _is_locking_statement(statement: str) -> bool:
+    head = statement.lstrip()[:6].upper()
+    return head in ("UPDATE", "DELETE") or "FOR UPDATE" in statement
+
+
+def _before_cursor_execute(conn: Any, _cursor: Any, _statement: str, *_: Any) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, _cursor: Any, statement: str, *_: Any) -> None:
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    stats = _request_stats.get()
+    if stats is None:
+        return
+    stats.sql_count += 1
+    stats.db_seconds += elapsed
+    if _is_locking_statement(statement):
+        stats.lock_seconds += elapsed
+
+
+def _on_commit(_conn: Any) -> None:
+    stats = _request_stats.get()
+    if stats is not None:
+        stats._commit_started = time.perf_counter()
+
+
+def _after_session_commit(_session: Session) -> None:
+    stats = _request_stats.get()
+    if stats is not None and stats._commit_started is not None:
+        stats.commit_seconds += time.perf_counter() - stats._commit_started
+        stats._commit_started = None
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진에서 실행되는 SQL을 현재 요청의 RequestStats에 기록합니다."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "commit", _on_commit)
+
+
+event.listen(Session, "after_commit", _after_session_commit)
+
+
+class _Histogram:
+    def __init__(self) -> None:
+        self.counts = [0] * len(BUCKETS)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.total += 1
+        self.sum += value
+        for i, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class MetricsRegistry:
+    """엔드포인트별 요청 지표. 프로세스(워커) 단위로 집계됩니다."""
+
+    HISTOGRAMS = {
+        "http_request_duration_seconds": "요청 처리 시간",
+        "http_request_db_seconds": "요청당 SQL 실행 시간 합계",
+        "http_request_lock_wait_seconds": "요청당 행 잠금 문장 실행 시간 합계",
+        "http_request_commit_seconds": "요청당 커밋 시간 합계",
+    }
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._requests: dict[tuple[str, str, int], int] = {}
+        self._sql_statements: dict[tuple[str, str], int] = {}
+        self._histograms: dict[str, dict[tuple[str, str], _Histogram]] = {
+            name: {} for name in self.HISTOGRAMS
+        }
+
+    def record(
+        self, method: str, route: str, status: int, duration: float, stats: RequestStats
+    ) -> None:
+        key = (method, route)
+        with self._lock:
+            request_key = (method, route, status)
+            self._requests[request_key] = self._requests.get(request_key, 0) + 1
+            self._sql_statements[key] = (
+                self._sql_statements.get(key, 0) + stats.sql_count
+            )
+            for name, value in (
+                ("http_request_duration_seconds", duration),
+                ("http_request_db_seconds", stats.db_seconds),
+                ("http_request_lock_wait_seconds", stats.lock_seconds),
+                ("http_request_commit_seconds", stats.commit_seconds),
+            ):
+                self._histograms[name].setdefault(key, _Histogram()).observe(value)
+
+    def render(self) -> str:
+        """Prometheus text exposition format으로 출력합니다."""
+        lines = [
+            "# HELP http_requests_total 처리한 요청 수",
+            "# TYPE http_requests_total counter",
+        ]
+        with self._lock:
+            for (method, route, status), count in sorted(self._requests.items()):
+                labels = f'method="{method}",route="{route}",status="{status}"'
+                lines.append(f"http_requests_total{{{labels}}} {count}")
+
+            lines += [
+                "# HELP http_request_sql_statements_total 실행한 SQL 문장 수",
+                "# TYPE http_request_sql_statements_total counter",
+            ]
+            for (method, route), count in sorted(self._sql_statements.items()):
+                labels = f'method="{method}",route="{route}"'
+                lines.append(f"http_request_sql_statements_total{{{labels}}} {count}")
+
+            for name, description in self.HISTOGRAMS.items():
+                lines += [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+                for (method, route), hist in sorted(self._histograms[name].items()):
+                    labels = f'method="{method}",route="{route}"'
+                    for bound, count in zip(BUCKETS, hist.counts, strict=True):
+                        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {hist.total}')
+                    lines.append(f"{name}_sum{{{labels}}} {hist.sum}")
+                    lines.append(f"{name}_count{{{labels}}} {hist.total}")
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+def _server_timing(stats: RequestStats, duration: float) -> str:
+    return ", ".join(
+        [
+            f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.sql_count} queries"',
+            f"lock;dur={stats.lock_seconds * 1000:.1f}",
+            f"commit;dur={stats.commit_seconds * 1000:.1f}",
+            f"app;dur={duration * 1000:.1f}",
+        ]
+    )
+
+
+class MetricsMiddleware:
+    """
+    요청마다 RequestStats를 만들어 SQL 이벤트가 기록되도록 하고, 처리가 끝나면
+    엔드포인트(라우트 경로) 단위로 집계합니다. SERVER_TIMING_ENABLED이면
+    `Server-Timing` 응답 헤더도 추가합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if settings.SERVER_TIMING_ENABLED:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        _server_timing(stats, time.perf_counter() - started),
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_stats.reset(token)
+            route = scope.get("route")
+            metrics_registry.record(
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                status,
+                time.perf_counter() - started,
+                stats,
+            )
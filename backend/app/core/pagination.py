@@ -0,0 +1,23 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from app.core.exceptions import BadRequestError
+
+
+def encode_cursor(key: dict[str, Any]) -> str:
+    raw = json.dumps(key, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise BadRequestError("잘못된 커서입니다.")
+
+    if not isinstance(key, dict):
+        raise BadRequestError("잘못된 커서입니다.")
+    return key
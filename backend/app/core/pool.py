@@ -0,0 +1,127 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    NullPool,
+    Pool,
+    PoolProxiedConnection,
+    QueuePool,
+)
+
+from app.core.config import settings
+
+
+@dataclass
+class PoolWaitStats:
+    """커넥션을 얻기까지 기다린 시간과 타임아웃 횟수."""
+
+    checkouts: int = 0
+    timeouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, waited: float, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "total_wait_seconds": self.total_wait_seconds,
+                "max_wait_seconds": self.max_wait_seconds,
+            }
+
+
+class _WaitTimingMixin:
+    wait_stats: PoolWaitStats
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore[misc]
+        except Exception:
+            self.wait_stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - started, timed_out=False)
+        return connection  # type: ignore[no-any-return]
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+
+def pool_limits(engines: int) -> tuple[int, int]:
+    """
+    워커 하나의 엔진 하나가 사용할 (pool_size, max_overflow)를 계산합니다.
+
+    `DB_MAX_CONNECTIONS`가 설정되어 있으면 워커 수와 엔진 수로 나눈 값을 넘지 않습니다.
+    """
+    pool_size = settings.DB_POOL_SIZE
+    max_overflow = settings.DB_MAX_OVERFLOW
+    if settings.DB_MAX_CONNECTIONS is not None:
+        budget = settings.DB_MAX_CONNECTIONS // (settings.WEB_CONCURRENCY * engines)
+        budget = max(1, budget)
+        pool_size = min(pool_size, budget)
+        max_overflow = max(0, min(max_overflow, budget - pool_size))
+    return pool_size, max_overflow
+
+
+def engine_options(is_async: bool) -> dict[str, Any]:
+    connect_args: dict[str, Any] = {}
+    if settings.DB_EXTERNAL_POOLER:
+        # transaction pooling에서는 다음 트랜잭션이 다른 서버 커넥션에서 실행될 수 있으므로
+        # 서버 측 prepared statement와 세션 단위 설정(options)을 사용하지 않습니다.
+        # statement_timeout은 DB role 설정(ALTER ROLE ... SET statement_timeout)으로 지정합니다.
+        connect_args["prepare_threshold"] = None
+        return {"poolclass": NullPool, "connect_args": connect_args}
+
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        connect_args["options"] = (
+            f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+        )
+
+    # async 모드에서는 동기 엔진(대체되지 않은 라우트)과 async 엔진이 함께 커넥션을 사용합니다.
+    engines = 2 if settings.DATABASE_MODE == "async" else 1
+    pool_size, max_overflow = pool_limits(engines)
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
+
+
+def pool_status(pool: Pool) -> dict[str, Any]:
+    status: dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    if isinstance(pool, InstrumentedQueuePool | InstrumentedAsyncQueuePool):
+        status.update(pool.wait_stats.snapshot())
+    return status
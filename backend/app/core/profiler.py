@@ -0,0 +1,233 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.profiler")
+
+_PARAM = re.compile(r"%\(\w+\)s(::\w+)?|\$\d+|'(?:[^']|'')*'|\b\d+\b")
+_PARAM_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_LOCKING_CLAUSE = re.compile(
+    r"\bFOR\s+(?:UPDATE|NO\s+KEY\s+UPDATE|SHARE|KEY\s+SHARE)\b", re.IGNORECASE
+)
+
+# 밀리초 단위 히스토그램 버킷
+BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+def fingerprint(statement: str) -> str:
+    """파라미터, 리터럴, IN 목록 길이를 지워 같은 모양의 SQL을 하나로 묶습니다."""
+    normalized = _PARAM.sub("?", statement)
+    normalized = _PARAM_LIST.sub("(?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+@dataclass
+class FingerprintStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    # BUCKETS_MS 경계별 누적 개수
+    buckets: list[int] = field(default_factory=lambda: [0] * len(BUCKETS_MS))
+
+
+@dataclass
+class RequestProfile:
+    """요청 하나에서 실행된 문장. 같은 모양/같은 값의 반복을 찾는 데 사용합니다."""
+
+    name: str
+    fingerprints: Counter[str] = field(default_factory=Counter)
+    statements: Counter[tuple[str, str]] = field(default_factory=Counter)
+
+    def repeated_fingerprints(self, threshold: int) -> dict[str, int]:
+        return {fp: n for fp, n in self.fingerprints.items() if n >= threshold}
+
+    def duplicate_statements(self) -> dict[str, int]:
+        return {sql: n for (sql, _), n in self.statements.items() if n > 1}
+
+
+_current_profile: ContextVar[RequestProfile | None] = ContextVar(
+    "request_profile", default=None
+)
+
+
+class QueryProfiler:
+    """
+    opt-in SQL 프로파일러 (QUERY_PROFILER_ENABLED).
+
+    - 문장 fingerprint별 실행 횟수와 지연 시간 분포를 집계합니다.
+    - 요청 하나에서 같은 fingerprint가 N_PLUS_ONE_THRESHOLD번 이상 실행되거나
+      같은 문장이 같은 값으로 두 번 이상 실행되면 경고 로그를 남깁니다.
+    - SLOW_MS를 넘은 문장은 요청 경로 밖의 스레드에서 실행 없이 `EXPLAIN`한 결과를
+      로그로 남기고 항상 롤백합니다. SELECT도 advisory lock처럼 부수 효과가 있는 함수를
+      호출할 수 있으므로, `EXPLAIN (ANALYZE, BUFFERS)`는 QUERY_PROFILER_EXPLAIN_ANALYZE를
+      켰을 때 잠금 없는 SELECT에만 사용합니다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[str, FingerprintStats] = {}
+        self._explained: set[str] = set()
+        self._explain_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="explain"
+        )
+        self._engine: Engine | None = None
+
+    # --- SQLAlchemy 이벤트 ---
+
+    def _before_cursor_execute(self, conn: Any, *_: Any) -> None:
+        conn.info.setdefault("profiler_started", []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self,
+        conn: Any,
+        _cursor: Any,
+        statement: str,
+        parameters: Any,
+        _context: Any,
+        _executemany: bool,
+    ) -> None:
+        elapsed = time.perf_counter() - conn.info["profiler_started"].pop()
+        fp = fingerprint(statement)
+        self.observe(fp, elapsed)
+
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.fingerprints[fp] += 1
+            profile.statements[(statement, repr(parameters))] += 1
+
+        if elapsed * 1000 >= settings.QUERY_PROFILER_SLOW_MS:
+            logger.warning(
+                "slow query (%.1fms) in %s: %s",
+                elapsed * 1000,
+                profile.name if profile else "-",
+                fp,
+            )
+            self._schedule_explain(fp, statement, parameters)
+
+    def instrument(self, engine: Engine, explain_engine: Engine) -> None:
+        self._engine = explain_engine
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def remove(self, engine: Engine) -> None:
+        event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    # --- 집계 ---
+
+    def observe(self, fp: str, elapsed: float) -> None:
+        elapsed_ms = elapsed * 1000
+        with self._lock:
+            stats = self._stats.setdefault(fp, FingerprintStats())
+            stats.count += 1
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+            for i, bound in enumerate(BUCKETS_MS):
+                if elapsed_ms <= bound:
+                    stats.buckets[i] += 1
+
+    def snapshot(self, limit: int = 50) -> list[dict[str, Any]]:
+        """총 실행 시간이 큰 순서로 fingerprint별 통계를 반환합니다."""
+        with self._lock:
+            items = sorted(
+                self._stats.items(),
+                key=lambda item: item[1].total_seconds,
+                reverse=True,
+            )[:limit]
+            return [
+                {
+                    "fingerprint": fp,
+                    "count": stats.count,
+                    "total_ms": stats.total_seconds * 1000,
+                    "avg_ms": stats.total_seconds * 1000 / stats.count,
+                    "max_ms": stats.max_seconds * 1000,
+                    "histogram_ms": dict(
+                        zip(map(str, BUCKETS_MS), stats.buckets, strict=True)
+                    ),
+                }
+                for fp, stats in items
+            ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._explained.clear()
+
+    # --- EXPLAIN ---
+
+    def _schedule_explain(self, fp: str, statement: str, parameters: Any) -> None:
+        with self._lock:
+            if fp in self._explained or self._engine is None:
+                return
+            self._explained.add(fp)
+        self._explain_executor.submit(self._log_explain, fp, statement, parameters)
+
+    def _log_explain(self, fp: str, statement: str, parameters: Any) -> None:
+        try:
+            logger.warning("plan for %s\n%s", fp, self.explain(statement, parameters))
+        except Exception:
+            logger.exception("EXPLAIN failed for %s", fp)
+
+    def explain(self, statement: str, parameters: Any) -> str:
+        if self._engine is None:
+            raise RuntimeError("query profiler is not instrumented")
+        analyze = (
+            settings.QUERY_PROFILER_EXPLAIN_ANALYZE
+            and statement.lstrip()[:6].upper() == "SELECT"
+            and _LOCKING_CLAUSE.search(statement) is None
+        )
+        prefix = "EXPLAIN (ANALYZE, BUFFERS) " if analyze else "EXPLAIN "
+        with self._engine.connect() as conn:
+            try:
+                rows = conn.exec_driver_sql(prefix + statement, parameters).all()
+                return "\n".join(row[0] for row in rows)
+            finally:
+                conn.rollback()
+
+
+query_profiler = QueryProfiler()
+
+
+@contextmanager
+def profile_request(name: str) -> Iterator[RequestProfile]:
+    """블록 안에서 실행된 SQL을 모아, 반복 실행된 문장이 있으면 경고 로그를 남깁니다."""
+    profile = RequestProfile(name=name)
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+        threshold = settings.QUERY_PROFILER_N_PLUS_ONE_THRESHOLD
+        for fp, count in profile.repeated_fingerprints(threshold).items():
+            logger.warning("possible N+1 in %s: %d x %s", name, count, fp)
+        for statement, count in profile.duplicate_statements().items():
+            logger.warning(
+                "duplicate query in %s: %d x %s", name, count, fingerprint(statement)
+            )
+
+
+class QueryProfilerMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with profile_request(f"{scope['method']} {scope['path']}"):
+            await self.app(scope, receive, send)
@@ -0,0 +1,44 @@
+from collections.abc import Iterable
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def dumps(content: Any) -> bytes:
+    """
+    dict/list/str/int/None과 datetime, UUID, Enum 값을 pydantic의 JSON 응답과 같은
+    형식으로 인코딩합니다.
+    """
+    return orjson.dumps(content)
+
+
+def encode_page(
+    items: Iterable[bytes], total: int | None, next_cursor: str | None
+) -> bytes:
+    """이미 인코딩된 항목으로 `PaginatedResponse`와 같은 형식의 JSON을 만듭니다."""
+    return b"".join(
+        (
+            b'{"total":',
+            dumps(total),
+            b',"items":[',
+            b",".join(items),
+            b'],"next_cursor":',
+            dumps(next_cursor),
+            b"}",
+        )
+    )
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    `response_model` 검증 없이 내용을 한 번만 인코딩하는 JSON 응답.
+
+    SQL 조회 결과로 만든 dict/list나 `encode_page`로 미리 인코딩한 bytes를 그대로
+    받으므로, 라우터의 `response_model`은 문서(OpenAPI)에만 사용됩니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
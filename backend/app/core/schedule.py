@@ -0,0 +1,33 @@
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import datetime
+from itertools import accumulate
+
+
+class UserSchedule:
+    """
+    사용자가 예약(삭제 제외)한 시험의 tryout id 집합과 `[start_time, end_time)` 구간 목록.
+
+    구간은 시작 시각 순으로 정렬하고 종료 시각의 누적 최댓값을 함께 보관하므로,
+    중복 신청은 집합 조회, 동시간대 예약은 이분 탐색 한 번으로 확인합니다.
+    생성 후에는 바뀌지 않으며, 예약이 바뀌면 캐시에서 제거한 뒤 다시 만듭니다.
+    """
+
+    __slots__ = ("tryout_ids", "_starts", "_max_ends")
+
+    def __init__(self, entries: Iterable[tuple[int, datetime, datetime]]):
+        items = sorted(entries, key=lambda entry: entry[1])
+        self.tryout_ids = frozenset(tryout_id for tryout_id, _, _ in items)
+        self._starts = [start for _, start, _ in items]
+        self._max_ends = list(accumulate((end for _, _, end in items), max))
+
+    def has_tryout(self, tryout_id: int) -> bool:
+        return tryout_id in self.tryout_ids
+
+    def overlaps(self, start_time: datetime, end_time: datetime) -> bool:
+        # end_time 전에 시작하는 구간 중 가장 늦게 끝나는 구간이 start_time 뒤에 끝나면 겹침
+        i = bisect_left(self._starts, end_time)
+        return i > 0 and self._max_ends[i - 1] > start_time
+
+    def __len__(self) -> int:
+        return len(self._starts)
@@ -1,16 +1,83 @@
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, TypeVar
 
 import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableError
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# min/max rounds를 기본값과 같게 두어, BCRYPT_ROUNDS를 바꾸면 기존 해시가
+# 다음 로그인 때 새 비용으로 다시 해시되도록 합니다. (verify_and_update 참고)
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
 
 
 ALGORITHM = "HS256"
 
+T = TypeVar("T")
+
+
+class PasswordHashPool:
+    """
+    bcrypt 연산을 요청 스레드 밖의 프로세스 풀에서 실행합니다.
+
+    실행 중 + 대기 중인 작업이 `workers + queue_size`를 넘으면 기다리지 않고
+    ServiceUnavailableError(503)로 거절해, 로그인 폭주가 다른 API의 스레드를
+    잠식하지 않도록 합니다. `workers`가 0이면 호출한 스레드에서 바로 실행합니다.
+    """
+
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        self._slots = threading.BoundedSemaphore(max(workers + queue_size, 1))
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        if self.workers <= 0:
+            return fn(*args)
+        if not self._slots.acquire(blocking=False):
+            raise ServiceUnavailableError(
+                "로그인 요청이 많습니다. 잠시 후 다시 시도해주세요."
+            )
+        try:
+            future: Future[T] = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+password_hash_pool = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_size=settings.PASSWORD_HASH_QUEUE_SIZE,
+)
+
 
 def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
     expire = datetime.now(timezone.utc) + expires_delta
@@ -19,9 +86,34 @@ def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
     return encoded_jwt
 
 
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    return bool(pwd_context.verify(plain_password, hashed_password))
+
+
+def _verify_and_update(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    verified, new_hash = pwd_context.verify_and_update(plain_password, hashed_password)
+    return bool(verified), new_hash
+
+
+def _get_password_hash(password: str) -> str:
+    return str(pwd_context.hash(password))
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hash_pool.run(_verify_password, plain_password, hashed_password)
+
+
+def verify_and_update(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    비밀번호를 검증하고, 해시가 현재 설정(BCRYPT_ROUNDS 등)과 다르면
+    새 해시를 함께 반환합니다. 호출한 쪽에서 새 해시를 저장해야 합니다.
+    """
+    return password_hash_pool.run(_verify_and_update, plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hash_pool.run(_get_password_hash, password)
@@ -1,17 +1,94 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import TypeVar
 
+from sqlalchemy import event
+from sqlalchemy.orm import Session as OrmSession
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 T = TypeVar("T")
 
+_UNIT_OF_WORK = "unit_of_work"
+_AFTER_COMMIT_CALLBACKS = "after_commit_callbacks"
+_AFTER_ROLLBACK_CALLBACKS = "after_rollback_callbacks"
+
+
+def run_after_commit(session: OrmSession, callback: Callable[[], None]) -> None:
+    """
+    트랜잭션이 커밋된 뒤에 callback을 실행하도록 예약합니다.
+
+    캐시 무효화처럼 커밋 전에 실행하면 다른 요청이 커밋 전의 값을 볼 수 있는 작업에
+    사용합니다. 롤백되면 예약한 callback은 버립니다.
+    """
+    session.info.setdefault(_AFTER_COMMIT_CALLBACKS, []).append(callback)
+
+
+def run_after_rollback(session: OrmSession, callback: Callable[[], None]) -> None:
+    """
+    트랜잭션이 롤백되면 callback을 실행하도록 예약합니다. 커밋되면 버립니다.
+
+    DB 밖의 상태(메모리 등)를 트랜잭션과 함께 되돌려야 할 때 사용합니다.
+    """
+    session.info.setdefault(_AFTER_ROLLBACK_CALLBACKS, []).append(callback)
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _run_after_commit_callbacks(session: OrmSession) -> None:
+    session.info.pop(_AFTER_ROLLBACK_CALLBACKS, None)
+    for callback in session.info.pop(_AFTER_COMMIT_CALLBACKS, []):
+        callback()
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _run_after_rollback_callbacks(session: OrmSession) -> None:
+    session.info.pop(_AFTER_COMMIT_CALLBACKS, None)
+    for callback in session.info.pop(_AFTER_ROLLBACK_CALLBACKS, []):
+        callback()
+
 
 class TransactionHelper:
+    """
+    서비스 작업 하나를 하나의 트랜잭션으로 실행합니다.
+
+    리포지토리는 flush만 하고, 커밋은 가장 바깥의 run()이 작업이 끝난 뒤 한 번만
+    수행합니다. 실패하면 전체를 롤백합니다. run() 안에서 다시 run()을 호출하면
+    바깥 트랜잭션에 합류합니다.
+    """
+
     def __init__(self, session: Session):
         self.session = session
 
     def run(self, operation: Callable[[], T]) -> T:
-        if self.session.in_transaction():
-            return operation()
-        with self.session.begin():
+        if self.session.info.get(_UNIT_OF_WORK):
             return operation()
+
+        self.session.info[_UNIT_OF_WORK] = True
+        try:
+            result = operation()
+            self.session.commit()
+            return result
+        except Exception:
+            self.session.rollback()
+            raise
+        finally:
+            self.session.info.pop(_UNIT_OF_WORK, None)
+
+
+class AsyncTransactionHelper:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def run(self, operation: Callable[[], Awaitable[T]]) -> T:
+        if self.session.info.get(_UNIT_OF_WORK):
+            return await operation()
+
+        self.session.info[_UNIT_OF_WORK] = True
+        try:
+            result = await operation()
+            await self.session.commit()
+            return result
+        except Exception:
+            await self.session.rollback()
+            raise
+        finally:
+            self.session.info.pop(_UNIT_OF_WORK, None)
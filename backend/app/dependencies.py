@@ -1,4 +1,5 @@
-from collections.abc import Generator
+import time
+from collections.abc import AsyncGenerator, Generator
 from typing import Annotated
 
 import jwt
@@ -7,11 +8,13 @@ from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core import security
+from app.core.cache import principal_cache, token_cache
 from app.core.config import settings
-from app.core.db import engine
-from app.models.users import TokenPayload, User
+from app.core.db import async_engine, engine
+from app.models.users import TokenPayload, User, UserPrincipal
 
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/utils/login/access-token"
@@ -19,15 +22,28 @@ reusable_oauth2 = OAuth2PasswordBearer(
 
 
 def get_db() -> Generator[Session, None, None]:
-    with Session(engine) as session:
+    # 커밋 직후 응답 직렬화 시 만료된 속성을 다시 조회(SELECT)하지 않도록 합니다.
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    # 커밋 이후 속성 접근 시 암묵적인 lazy load(동기 IO)가 일어나지 않도록 합니다.
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
         yield session
 
 
 SessionDep = Annotated[Session, Depends(get_db)]
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 
-def get_current_user(session: SessionDep, token: TokenDep) -> User:
+def decode_token(token: str) -> str:
+    """토큰의 subject를 반환합니다. 디코딩 결과는 토큰 만료 전까지 캐시됩니다."""
+    subject = token_cache.get(token)
+    if subject is not None:
+        return subject
+
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
@@ -38,18 +54,56 @@ def get_current_user(session: SessionDep, token: TokenDep) -> User:
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    user = session.get(User, token_data.sub)
+    if token_data.sub is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    expires_in = payload["exp"] - time.time() if "exp" in payload else None
+    token_cache.set(token, token_data.sub, ttl=expires_in)
+    return token_data.sub
+
+
+def _to_principal(subject: str, user: User | None, generation: int) -> UserPrincipal:
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    if not user.is_active:
+    principal = UserPrincipal(
+        id=user.id, is_active=user.is_active, is_superuser=user.is_superuser
+    )
+    # 조회 도중 사용자가 변경(무효화)되었다면 이전 값을 캐시하지 않습니다.
+    principal_cache.set(subject, principal, generation=generation)
+    return principal
+
+
+def _ensure_active_user(principal: UserPrincipal) -> UserPrincipal:
+    if not principal.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
-    return user
+    return principal
+
+
+def get_current_user(session: SessionDep, token: TokenDep) -> UserPrincipal:
+    subject = decode_token(token)
+    generation = principal_cache.generation
+    principal = principal_cache.get(subject)
+    if principal is None:
+        principal = _to_principal(subject, session.get(User, subject), generation)
+    return _ensure_active_user(principal)
+
+
+async def get_current_user_async(
+    session: AsyncSessionDep, token: TokenDep
+) -> UserPrincipal:
+    subject = decode_token(token)
+    generation = principal_cache.generation
+    principal = principal_cache.get(subject)
+    if principal is None:
+        principal = _to_principal(subject, await session.get(User, subject), generation)
+    return _ensure_active_user(principal)
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[UserPrincipal, Depends(get_current_user)]
+AsyncCurrentUser = Annotated[UserPrincipal, Depends(get_current_user_async)]
 
 
-def get_current_active_superuser(current_user: CurrentUser) -> User:
+def get_current_active_superuser(current_user: CurrentUser) -> UserPrincipal:
     if not current_user.is_superuser:
         raise HTTPException(
             status_code=403, detail="The user doesn't have enough privileges"
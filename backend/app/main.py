@@ -1,21 +1,60 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
 
 from app.core.config import settings
+from app.core.db import async_engine
 from app.core.error_handler import register_error_handlers
+from app.core.idempotency import IdempotencyMiddleware
+from app.core.metrics import MetricsMiddleware
+from app.core.profiler import QueryProfilerMiddleware
+from app.core.security import password_hash_pool
+from app.routers import metrics
 from app.routers.main import api_router
+from app.services.capacity_ledger import capacity_ledger
+from app.services.registration_window import registration_windows
+from app.services.waitlist import waitlist_worker
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.tags[0]}-{route.name}"
 
 
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    if settings.ADMISSION_ENGINE == "ledger":
+        capacity_ledger.start()
+    if settings.WAITLIST_WORKER_ENABLED:
+        waitlist_worker.start()
+    if settings.REGISTRATION_WINDOW_SCHEDULER_ENABLED:
+        registration_windows.start()
+    yield
+    registration_windows.stop()
+    waitlist_worker.stop()
+    capacity_ledger.stop()
+    password_hash_pool.shutdown()
+    await async_engine.dispose()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
 )
 
 register_error_handlers(app)
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
+
+# 재시도 요청도 지표에 포함되도록 MetricsMiddleware 안쪽에 둡니다.
+app.add_middleware(IdempotencyMiddleware)
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics.router)
+
+if settings.QUERY_PROFILER_ENABLED:
+    app.add_middleware(QueryProfilerMiddleware)
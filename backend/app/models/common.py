@@ -6,5 +6,7 @@ T = TypeVar("T")
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
-    total: int
+    # 커서 방식 조회에서는 전체 개수를 세지 않으므로 None입니다.
+    total: int | None = None
     items: list[T]
+    next_cursor: str | None = None
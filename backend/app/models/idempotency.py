@@ -0,0 +1,20 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Column, LargeBinary
+from sqlmodel import Field, SQLModel
+
+
+class IdempotencyRecord(SQLModel, table=True):
+    """`Idempotency-Key`로 처리한 요청의 응답. 키는 사용자별로 구분합니다."""
+
+    __tablename__ = "idempotency_keys"
+    user_id: uuid.UUID = Field(primary_key=True)
+    key: str = Field(primary_key=True, max_length=255)
+    # 같은 키로 다른 요청을 보냈는지 확인하기 위한 요청(메서드, 경로, 본문) 해시
+    fingerprint: str = Field(max_length=64)
+    status_code: int
+    content_type: str | None = Field(default=None, max_length=255)
+    body: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+    created_at: datetime = Field(default_factory=datetime.now)
+    expires_at: datetime = Field(index=True)
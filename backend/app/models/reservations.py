@@ -1,9 +1,15 @@
 import uuid
 from enum import Enum
+from typing import Any, Literal
 
-from pydantic import BaseModel
-from sqlalchemy import UniqueConstraint
+from pydantic import BaseModel, EmailStr, model_validator
+from sqlalchemy import Column, Index, UniqueConstraint, event, text
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.orm import object_session
 from sqlmodel import Field, SQLModel
+from typing_extensions import Self
+
+from app.core.cache import invalidate_user_reservations
 
 
 class ReservationStatus(str, Enum):
@@ -12,11 +18,19 @@ class ReservationStatus(str, Enum):
     deleted = "deleted"
 
 
+# 부분 인덱스 조건. 쿼리도 같은 상수 비교(`status <> 'deleted'`)로 작성해야 플래너가
+# 파라미터 값과 무관하게 부분 인덱스를 사용할 수 있습니다.
+ACTIVE_RESERVATION_PREDICATE = "status <> 'deleted'"
+
+# 예약 상태 컬럼의 PostgreSQL enum 타입 (값당 4바이트)
+RESERVATION_STATUS_TYPE = SAEnum(ReservationStatus, name="reservation_status")
+
+
 class ReservationBase(SQLModel):
     user_id: uuid.UUID = Field(foreign_key="users.id")
     tryout_id: int = Field(foreign_key="tryouts.id")
     reserved_seats: int = Field(ge=1)
-    status: str = Field(default=ReservationStatus.pending)
+    status: ReservationStatus = Field(default=ReservationStatus.pending)
     model_config = {"from_attributes": True}
 
 
@@ -27,7 +41,35 @@ class ReservationCreate(ReservationBase):
 class Reservation(ReservationBase, table=True):
     __tablename__ = "reservations"
     id: int = Field(default=None, primary_key=True)
-    __table_args__ = (UniqueConstraint("user_id", "tryout_id", name="uq_user_tryout"),)
+    status: ReservationStatus = Field(
+        default=ReservationStatus.pending,
+        sa_column=Column(RESERVATION_STATUS_TYPE, nullable=False),
+    )
+    __table_args__ = (
+        UniqueConstraint("user_id", "tryout_id", name="uq_user_tryout"),
+        Index("ix_reservations_user_id_id", "user_id", "id"),
+        # 삭제된 예약은 다시 신청할 때 재사용하므로 지우지 않고 남습니다.
+        # 사용자별 조회(중복/동시간대 검사)는 사용자당 행이 적어 uq_user_tryout을 그대로
+        # 사용하고, 확정 좌석 합계는 삭제되지 않은 행만 담은 부분 인덱스를 사용합니다.
+        Index(
+            "ix_reservations_tryout_id_status_active",
+            "tryout_id",
+            "status",
+            postgresql_include=["reserved_seats"],
+            postgresql_where=text(ACTIVE_RESERVATION_PREDICATE),
+        ),
+    )
+
+
+@event.listens_for(Reservation, "after_insert")
+@event.listens_for(Reservation, "after_update")
+@event.listens_for(Reservation, "after_delete")
+def _invalidate_reserved_tryout_ids(
+    _mapper: Any, _connection: Any, target: Reservation
+) -> None:
+    session = object_session(target)
+    if session is not None:
+        invalidate_user_reservations(session, target.user_id)
 
 
 class ReservationPublic(ReservationBase):
@@ -35,7 +77,9 @@ class ReservationPublic(ReservationBase):
 
 
 class ReservationUpdate(BaseModel):
-    status: str | None = Field(default=None, description="변경할 예약 상태")
+    status: ReservationStatus | None = Field(
+        default=None, description="변경할 예약 상태"
+    )
     reserved_seats: int | None = Field(
         default=None, ge=1, le=50000, description="변경할 응시 인원 수"
     )
@@ -45,3 +89,55 @@ class ReservationUpdateRequest(BaseModel):
     reserved_seats: int = Field(
         default=None, ge=1, le=50000, description="변경할 응시 인원 수"
     )
+
+
+class ReservationBatchConfirmRequest(BaseModel):
+    reservation_ids: list[int] | None = Field(
+        default=None, min_length=1, max_length=10000, description="확정할 예약 id 목록"
+    )
+    tryout_id: int | None = Field(
+        default=None, description="해당 시험의 대기(pending) 예약을 id 순으로 확정"
+    )
+    limit: int | None = Field(
+        default=None, ge=1, description="tryout_id 사용 시 확정할 최대 예약 수"
+    )
+
+    @model_validator(mode="after")
+    def _require_one_target(self) -> Self:
+        if (self.reservation_ids is None) == (self.tryout_id is None):
+            raise ValueError("reservation_ids와 tryout_id 중 하나만 지정해야 합니다.")
+        return self
+
+
+class ReservationConfirmResult(BaseModel):
+    reservation_id: int
+    status: Literal["confirmed", "failed"]
+    detail: str | None = None
+
+
+class ReservationBatchConfirmResponse(BaseModel):
+    confirmed: int
+    failed: int
+    results: list[ReservationConfirmResult]
+
+
+class ReservationImportRow(BaseModel):
+    """일괄 신청 파일의 한 행. 사용자는 email 또는 user_id 중 하나로 지정합니다."""
+
+    email: EmailStr | None = None
+    user_id: uuid.UUID | None = None
+    tryout_id: int
+    reserved_seats: int = Field(default=1, ge=1, le=50000)
+
+    @model_validator(mode="after")
+    def _require_one_user(self) -> Self:
+        if (self.email is None) == (self.user_id is None):
+            raise ValueError("email과 user_id 중 하나만 지정해야 합니다.")
+        return self
+
+
+class ReservationImportResult(BaseModel):
+    line: int = Field(description="파일의 행 번호 (CSV는 헤더가 1행)")
+    status: Literal["created", "failed"]
+    reservation_id: int | None = None
+    detail: str | None = None
@@ -1,8 +1,13 @@
 from datetime import datetime
+from typing import Any
 
 from pydantic import BaseModel
+from sqlalchemy import Index, event
+from sqlalchemy.orm import object_session
 from sqlmodel import Field, SQLModel
 
+from app.core.cache import invalidate_tryouts
+
 
 class TryoutBase(SQLModel):
     name: str
@@ -21,6 +26,24 @@ class TryoutCreate(TryoutBase):
 class Tryout(TryoutBase, table=True):
     __tablename__ = "tryouts"
     id: int = Field(default=None, primary_key=True)
+    __table_args__ = (
+        Index("ix_tryouts_start_time_end_time", "start_time", "end_time"),
+        Index("ix_tryouts_start_time_id", "start_time", "id"),
+        Index(
+            "ix_tryouts_registration_end_time_start_time",
+            "registration_end_time",
+            "registration_start_time",
+        ),
+    )
+
+
+@event.listens_for(Tryout, "after_insert")
+@event.listens_for(Tryout, "after_update")
+@event.listens_for(Tryout, "after_delete")
+def _invalidate_tryout_listing(_mapper: Any, _connection: Any, target: Tryout) -> None:
+    session = object_session(target)
+    if session is not None:
+        invalidate_tryouts(session, target.id)
 
 
 class TryoutPublic(TryoutBase):
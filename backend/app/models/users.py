@@ -1,8 +1,13 @@
 import uuid
+from typing import Any
 
-from pydantic import EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
+from sqlalchemy import event
+from sqlalchemy.orm import object_session
 from sqlmodel import Field, SQLModel
 
+from app.core.cache import invalidate_user, invalidate_user_principal
+
 
 class UserBase(SQLModel):
     email: EmailStr = Field(unique=True, index=True, max_length=255)
@@ -21,10 +26,33 @@ class User(UserBase, table=True):
     hashed_password: str
 
 
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_principal(_mapper: Any, _connection: Any, target: User) -> None:
+    # 비활성화/권한 변경이 다음 요청부터 반영되도록 캐시를 비웁니다.
+    # flush 시점에 비우면 커밋 전에 다른 요청이 이전 값을 다시 캐시할 수 있으므로
+    # 커밋 이후에 비웁니다.
+    session = object_session(target)
+    if session is None:
+        invalidate_user(target.id)
+    else:
+        invalidate_user_principal(session, target.id)
+
+
 class UserPublic(UserBase):
     id: uuid.UUID
 
 
+class UserPrincipal(BaseModel):
+    """인증된 요청의 사용자. 요청마다 DB를 조회하지 않도록 캐시됩니다."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: uuid.UUID
+    is_active: bool
+    is_superuser: bool
+
+
 class Token(SQLModel):
     access_token: str
     token_type: str = "bearer"
@@ -0,0 +1,51 @@
+import uuid
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import Index, text
+from sqlmodel import Field, SQLModel
+
+
+class WaitlistStatus(str, Enum):
+    waiting = "waiting"
+    promoted = "promoted"
+    cancelled = "cancelled"
+
+
+class WaitlistEntryBase(SQLModel):
+    user_id: uuid.UUID = Field(foreign_key="users.id")
+    tryout_id: int = Field(foreign_key="tryouts.id")
+    reserved_seats: int = Field(ge=1)
+    status: str = Field(default=WaitlistStatus.waiting)
+    model_config = {"from_attributes": True}
+
+
+class WaitlistEntryCreate(WaitlistEntryBase):
+    pass
+
+
+class WaitlistEntry(WaitlistEntryBase, table=True):
+    __tablename__ = "waitlist"
+    # id 순서가 대기 순서(FIFO)입니다.
+    id: int = Field(default=None, primary_key=True)
+    created_at: datetime = Field(default_factory=datetime.now)
+    reservation_id: int | None = Field(default=None, foreign_key="reservations.id")
+    __table_args__ = (
+        Index("ix_waitlist_tryout_id_status_id", "tryout_id", "status", "id"),
+        Index(
+            "uq_waitlist_user_tryout_waiting",
+            "user_id",
+            "tryout_id",
+            unique=True,
+            postgresql_where=text("status = 'waiting'"),
+        ),
+    )
+
+
+class WaitlistEntryPublic(WaitlistEntryBase):
+    id: int
+    created_at: datetime
+    reservation_id: int | None
+    position: int | None = Field(
+        default=None, description="대기 순번 (대기 중일 때만, 1부터 시작)"
+    )
@@ -0,0 +1,64 @@
+"""
+tryout의 확정 인원(`confirmed_reserved_count`)을 확정 예약의 좌석 합계와 비교합니다.
+
+    python -m app.reconcile                  # 차이만 보고
+    python -m app.reconcile --repair         # 차이가 있는 tryout 보정
+    python -m app.reconcile --repair --interval 300   # 5분마다 반복 실행
+
+보정하지 못한 차이가 남으면 종료 코드 1을 반환합니다.
+"""
+
+import argparse
+import logging
+import sys
+import time
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.db import engine
+from app.services.reconciliation import ReconciliationReport, ReconciliationService
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def run(repair: bool, chunk_size: int) -> ReconciliationReport:
+    with Session(engine, expire_on_commit=False) as session:
+        report = ReconciliationService(session).reconcile(
+            repair=repair, chunk_size=chunk_size
+        )
+    logger.info(
+        "drift=%d repaired=%d skipped=%d",
+        len(report.drifts),
+        len(report.repaired),
+        len(report.skipped),
+    )
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repair", action="store_true")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument(
+        "--interval", type=float, default=0, help="0보다 크면 이 간격(초)으로 반복"
+    )
+    args = parser.parse_args()
+
+    if args.repair and settings.ADMISSION_ENGINE == "ledger":
+        parser.error(
+            "ADMISSION_ENGINE=ledger에서는 좌석 원장이 확정 인원을 기록하므로 "
+            "--repair를 사용할 수 없습니다."
+        )
+
+    while True:
+        report = run(args.repair, args.chunk_size)
+        if args.interval <= 0:
+            unresolved = len(report.drifts) - len(report.repaired)
+            sys.exit(1 if unresolved else 0)
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlmodel import Session, col, delete
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.idempotency import IdempotencyRecord
+
+
+def _save_stmt(record: IdempotencyRecord) -> Insert:
+    """같은 키가 이미 있으면 만료된 경우에만 덮어쓰는 INSERT 문."""
+    values = record.model_dump()
+    stmt = insert(IdempotencyRecord).values(**values)
+    return stmt.on_conflict_do_update(
+        index_elements=[col(IdempotencyRecord.user_id), col(IdempotencyRecord.key)],
+        set_={name: stmt.excluded[name] for name in values},
+        where=col(IdempotencyRecord.expires_at) <= stmt.excluded.created_at,
+    )
+
+
+class IdempotencyRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get(
+        self, user_id: uuid.UUID, key: str, now: datetime
+    ) -> IdempotencyRecord | None:
+        record = self.session.get(IdempotencyRecord, (user_id, key))
+        if record is None or record.expires_at <= now:
+            return None
+        return record
+
+    def save(self, record: IdempotencyRecord) -> None:
+        """
+        응답을 저장합니다. 같은 키가 이미 있으면 만료된 경우에만 덮어쓰고,
+        아직 유효하면 먼저 저장된 응답을 유지합니다.
+        """
+        self.session.execute(_save_stmt(record))
+
+    def purge_expired(self, now: datetime) -> None:
+        stmt = delete(IdempotencyRecord).where(col(IdempotencyRecord.expires_at) <= now)
+        self.session.execute(stmt)
+
+
+class AsyncIdempotencyRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(
+        self, user_id: uuid.UUID, key: str, now: datetime
+    ) -> IdempotencyRecord | None:
+        record = await self.session.get(IdempotencyRecord, (user_id, key))
+        if record is None or record.expires_at <= now:
+            return None
+        return record
+
+    async def save(self, record: IdempotencyRecord) -> None:
+        """
+        응답을 저장합니다. 같은 키가 이미 있으면 만료된 경우에만 덮어쓰고,
+        아직 유효하면 먼저 저장된 응답을 유지합니다.
+        """
+        await self.session.execute(_save_stmt(record))
+
+    async def purge_expired(self, now: datetime) -> None:
+        stmt = delete(IdempotencyRecord).where(col(IdempotencyRecord.expires_at) <= now)
+        await self.session.execute(stmt)
@@ -1,18 +1,159 @@
 import uuid
+from collections.abc import Iterator
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import and_, exists, func
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    String,
+    Uuid,
+    and_,
+    column,
+    exists,
+    func,
+    literal,
+    type_coerce,
+    update,
+)
+from sqlalchemy import Select as SASelect
+from sqlalchemy import select as sa_select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.orm import aliased
+from sqlalchemy.types import TypeEngine
 from sqlmodel import Session, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import Select, SelectOfScalar
 
 from app.core.exceptions import NotFoundError
+from app.core.schedule import UserSchedule
 from app.models.reservations import (
+    RESERVATION_STATUS_TYPE,
     Reservation,
     ReservationCreate,
     ReservationStatus,
     ReservationUpdate,
 )
 from app.models.tryouts import Tryout
-from app.models.users import User
+from app.models.users import UserPrincipal
+
+
+def _is_active() -> ColumnElement[bool]:
+    # 'deleted'를 바인드 파라미터가 아닌 상수로 렌더링해 부분 인덱스 조건
+    # (ACTIVE_RESERVATION_PREDICATE)을 플래너가 항상 증명할 수 있도록 합니다.
+    return col(Reservation.status) != literal(
+        ReservationStatus.deleted, type_=RESERVATION_STATUS_TYPE, literal_execute=True
+    )
+
+
+def _user_schedule_stmt(
+    user_id: uuid.UUID,
+) -> Select[tuple[int, datetime, datetime]]:
+    return (
+        select(col(Tryout.id), col(Tryout.start_time), col(Tryout.end_time))
+        .join(Reservation, col(Reservation.tryout_id) == col(Tryout.id))
+        .where(
+            col(Reservation.user_id) == user_id,
+            _is_active(),
+        )
+    )
+
+
+def _overlapping_reservation_stmt(
+    user_id: uuid.UUID, start_time: datetime, end_time: datetime
+) -> SelectOfScalar[bool]:
+    return select(
+        exists().where(
+            and_(
+                col(Reservation.user_id) == user_id,
+                _is_active(),
+                col(Reservation.tryout_id) == col(Tryout.id),
+                col(Tryout.start_time) < end_time,
+                col(Tryout.end_time) > start_time,
+            )
+        )
+    )
+
+
+def _sum_confirmed_seats_stmt(tryout_id: int) -> SelectOfScalar[int]:
+    # 'confirmed'도 상수로 렌더링해야 generic plan에서 부분 인덱스 조건을 증명할 수
+    # 있습니다.
+    confirmed = literal(
+        ReservationStatus.confirmed, type_=RESERVATION_STATUS_TYPE, literal_execute=True
+    )
+    return select(func.coalesce(func.sum(Reservation.reserved_seats), 0)).where(
+        col(Reservation.tryout_id) == tryout_id,
+        col(Reservation.status) == confirmed,
+    )
+
+
+def _count_user_reservations_stmt(user: UserPrincipal) -> SelectOfScalar[int]:
+    stmt = select(func.count()).select_from(Reservation)
+    if not user.is_superuser:
+        stmt = stmt.where(Reservation.user_id == user.id)
+    return stmt
+
+
+def _paginate_user_reservations_stmt(
+    user: UserPrincipal, limit: int, offset: int, after_id: int | None
+) -> SASelect[Any]:
+    # 목록은 조회 결과를 바로 JSON으로 응답하므로 ORM 엔티티가 아닌 컬럼으로 조회합니다.
+    columns = [col(getattr(Reservation, name)) for name in Reservation.model_fields]
+    stmt = sa_select(*columns)
+    if not user.is_superuser:
+        stmt = stmt.where(col(Reservation.user_id) == user.id)
+    if after_id is not None:
+        stmt = stmt.where(col(Reservation.id) > after_id)
+    return stmt.order_by(col(Reservation.id)).offset(offset).limit(limit)
+
+
+def _by_user_and_tryout_stmt(
+    user_id: uuid.UUID, tryout_id: int, for_update: bool
+) -> SelectOfScalar[Reservation]:
+    stmt = select(Reservation).where(
+        and_(
+            col(Reservation.user_id) == user_id,
+            col(Reservation.tryout_id) == tryout_id,
+        )
+    )
+    if for_update:
+        stmt = stmt.with_for_update()
+    return stmt
+
+
+def _unnest(name: str, **columns: tuple[list[Any], TypeEngine[Any]]) -> Any:
+    """
+    열별 값 목록을 배열 파라미터로 전달해 `unnest(...)`로 펼친 테이블을 만듭니다.
+    행마다 파라미터를 만드는 VALUES보다 바인딩/컴파일 비용이 작고, 문장이 행 수와
+    무관하게 같으므로 컴파일 캐시를 재사용합니다.
+    """
+    return (
+        func.unnest(
+            *(literal(values, ARRAY(type_)) for values, type_ in columns.values())
+        )
+        .table_valued(*(column(key, type_) for key, (_, type_) in columns.items()))
+        .render_derived(name=name)
+    )
+
+
+def _unnest_pairs(pairs: list[tuple[uuid.UUID, int]]) -> Any:
+    return _unnest(
+        "pairs",
+        user_id=([user_id for user_id, _ in pairs], Uuid()),
+        tryout_id=([tryout_id for _, tryout_id in pairs], Integer()),
+    )
+
+
+# 한 번의 UPDATE ... WHERE id IN (...)에 넣을 최대 id 개수
+BULK_UPDATE_CHUNK_SIZE = 5000
+
+
+def _apply_update(reservation: Reservation, update_data: ReservationUpdate) -> None:
+    if update_data.reserved_seats is not None:
+        reservation.reserved_seats = update_data.reserved_seats
+
+    if update_data.status is not None:
+        reservation.status = update_data.status
 
 
 class ReservationRepository:
@@ -22,52 +163,27 @@ class ReservationRepository:
     def create(self, reservation_create: ReservationCreate) -> Reservation:
         reservation = Reservation.model_validate(reservation_create)
         self.session.add(reservation)
-        self.session.commit()
-        self.session.refresh(reservation)
+        self.session.flush()
         return reservation
 
-    def get_user_reserved_tryout_ids(
-        self, user_id: uuid.UUID, tryout_ids: list[int]
-    ) -> set[int]:
-        stmt = select(Reservation.tryout_id).where(
-            and_(
-                col(Reservation.user_id) == user_id,
-                col(Reservation.tryout_id).in_(tryout_ids),
-                col(Reservation.status) != ReservationStatus.deleted,
-            )
-        )
-        return set(self.session.exec(stmt).all())
+    def get_user_schedule(self, user_id: uuid.UUID) -> UserSchedule:
+        return UserSchedule(self.session.exec(_user_schedule_stmt(user_id)).all())
 
     def has_overlapping_reservation(
         self, user_id: uuid.UUID, start_time: datetime, end_time: datetime
     ) -> bool:
-        stmt = select(
-            exists().where(
-                and_(
-                    col(Reservation.user_id) == user_id,
-                    col(Tryout.start_time) < end_time,
-                    col(Tryout.end_time) > start_time,
-                    col(Reservation.status) != ReservationStatus.deleted,
-                )
-            )
-        )
+        stmt = _overlapping_reservation_stmt(user_id, start_time, end_time)
         result = self.session.exec(stmt).one()
         return bool(result)
 
-    def count_user_reservations(self, user: User) -> int:
-        stmt = select(func.count()).select_from(Reservation)
-        if not user.is_superuser:
-            stmt = stmt.where(Reservation.user_id == user.id)
-        return self.session.exec(stmt).one()
+    def count_user_reservations(self, user: UserPrincipal) -> int:
+        return self.session.exec(_count_user_reservations_stmt(user)).one()
 
     def paginate_user_reservations(
-        self, user: User, limit: int, offset: int
-    ) -> list[Reservation]:
-        stmt = select(Reservation)
-        if not user.is_superuser:
-            stmt = stmt.where(Reservation.user_id == user.id)
-        stmt = stmt.offset(offset).limit(limit)
-        return list(self.session.exec(stmt).all())
+        self, user: UserPrincipal, limit: int, offset: int, after_id: int | None = None
+    ) -> list[dict[str, Any]]:
+        stmt = _paginate_user_reservations_stmt(user, limit, offset, after_id)
+        return [dict(row) for row in self.session.execute(stmt).mappings()]
 
     def get_by_id(self, id: int, for_update: bool = False) -> Reservation:
         result = self.session.get(Reservation, id, with_for_update=for_update)
@@ -78,27 +194,225 @@ class ReservationRepository:
     def update(
         self, reservation: Reservation, update_data: ReservationUpdate
     ) -> Reservation:
-        if update_data.reserved_seats is not None:
-            reservation.reserved_seats = update_data.reserved_seats
-
-        if update_data.status is not None:
-            reservation.status = update_data.status
+        _apply_update(reservation, update_data)
 
         self.session.add(reservation)
-        self.session.commit()
-        self.session.refresh(reservation)
+        self.session.flush()
         return reservation
 
     def get_by_user_and_tryout(
         self, user_id: uuid.UUID, tryout_id: int, for_update: bool = False
     ) -> Reservation | None:
-        stmt = select(Reservation).where(
-            and_(
-                col(Reservation.user_id) == user_id,
+        stmt = _by_user_and_tryout_stmt(user_id, tryout_id, for_update)
+        return self.session.exec(stmt).first()
+
+    def group_ids_by_tryout(self, ids: list[int]) -> dict[int, list[int]]:
+        stmt = select(Reservation.id, Reservation.tryout_id).where(
+            col(Reservation.id).in_(ids)
+        )
+        groups: dict[int, list[int]] = {}
+        for reservation_id, tryout_id in self.session.exec(stmt).all():
+            groups.setdefault(tryout_id, []).append(reservation_id)
+        return groups
+
+    def lock_by_ids(self, ids: list[int]) -> list[Reservation]:
+        stmt = (
+            select(Reservation)
+            .where(col(Reservation.id).in_(ids))
+            .order_by(col(Reservation.id))
+            .with_for_update()
+        )
+        return list(self.session.exec(stmt).all())
+
+    def lock_pending_by_tryout(
+        self, tryout_id: int, limit: int | None = None
+    ) -> list[Reservation]:
+        stmt = (
+            select(Reservation)
+            .where(
                 col(Reservation.tryout_id) == tryout_id,
+                col(Reservation.status) == ReservationStatus.pending,
             )
+            .order_by(col(Reservation.id))
+            .limit(limit)
+            .with_for_update()
         )
-        if for_update:
-            stmt = stmt.with_for_update()
+        return list(self.session.exec(stmt).all())
 
-        return self.session.exec(stmt).first()
+    def sum_confirmed_seats(self, tryout_id: int) -> int:
+        return int(self.session.exec(_sum_confirmed_seats_stmt(tryout_id)).one())
+
+    def bulk_update_status(self, ids: list[int], status: ReservationStatus) -> None:
+        """
+        여러 예약의 상태를 집합 단위 UPDATE로 변경합니다. commit 하지 않으며,
+        세션에 로드된 객체에는 반영되지 않습니다.
+        """
+        for start in range(0, len(ids), BULK_UPDATE_CHUNK_SIZE):
+            chunk = ids[start : start + BULK_UPDATE_CHUNK_SIZE]
+            stmt = (
+                update(Reservation)
+                .where(col(Reservation.id).in_(chunk))
+                .values(status=status)
+                .execution_options(synchronize_session=False)
+            )
+            self.session.execute(stmt)
+
+    def iter_export_rows(
+        self, tryout_id: int | None, status: ReservationStatus | None, chunk_size: int
+    ) -> Iterator[tuple[int, uuid.UUID, int, int, str]]:
+        """
+        예약을 id 순으로 (id, user_id, tryout_id, reserved_seats, status) 튜플로 반환합니다.
+
+        필요한 열만 조회해 ORM 객체를 만들지 않고, 서버 측 커서로 chunk_size건씩
+        가져오므로 전체 건수와 무관하게 메모리 사용량이 일정합니다.
+        """
+        # sqlmodel의 select는 4개 열까지만 타입을 지원하므로 SQLAlchemy select를 사용합니다.
+        stmt = sa_select(
+            col(Reservation.id),
+            col(Reservation.user_id),
+            col(Reservation.tryout_id),
+            col(Reservation.reserved_seats),
+            # csv 모듈이 Enum을 "ReservationStatus.pending"으로 쓰지 않도록 문자열로 받습니다.
+            type_coerce(col(Reservation.status), String),
+        )
+        if tryout_id is not None:
+            stmt = stmt.where(col(Reservation.tryout_id) == tryout_id)
+        if status is not None:
+            stmt = stmt.where(col(Reservation.status) == status)
+        stmt = stmt.order_by(col(Reservation.id)).execution_options(
+            yield_per=chunk_size
+        )
+        yield from self.session.execute(stmt).tuples()
+
+    def get_active_pairs(
+        self, pairs: list[tuple[uuid.UUID, int]]
+    ) -> set[tuple[uuid.UUID, int]]:
+        """(user_id, tryout_id) 중 삭제되지 않은 예약이 이미 있는 쌍을 반환합니다."""
+        candidates = _unnest_pairs(pairs)
+        stmt = select(candidates.c.user_id, candidates.c.tryout_id).join(
+            Reservation,
+            and_(
+                col(Reservation.user_id) == candidates.c.user_id,
+                col(Reservation.tryout_id) == candidates.c.tryout_id,
+                _is_active(),
+            ),
+        )
+        return {(user_id, tryout_id) for user_id, tryout_id in self.session.exec(stmt)}
+
+    def get_overlapping_pairs(
+        self, pairs: list[tuple[uuid.UUID, int]]
+    ) -> set[tuple[uuid.UUID, int]]:
+        """
+        (user_id, tryout_id) 중 사용자가 다른 시험에 동시간대 예약(삭제 제외)을 가진
+        쌍을 한 번의 쿼리로 반환합니다.
+        """
+        candidates = _unnest_pairs(pairs)
+        target = aliased(Tryout)
+        stmt = (
+            select(candidates.c.user_id, candidates.c.tryout_id)
+            .join(target, col(target.id) == candidates.c.tryout_id)
+            .where(
+                exists().where(
+                    col(Reservation.user_id) == candidates.c.user_id,
+                    col(Reservation.tryout_id) != candidates.c.tryout_id,
+                    _is_active(),
+                    col(Reservation.tryout_id) == col(Tryout.id),
+                    col(Tryout.start_time) < col(target.end_time),
+                    col(Tryout.end_time) > col(target.start_time),
+                )
+            )
+        )
+        return {(user_id, tryout_id) for user_id, tryout_id in self.session.exec(stmt)}
+
+    def bulk_create_pending(
+        self, reservations: list[ReservationCreate]
+    ) -> dict[tuple[uuid.UUID, int], int]:
+        """
+        대기(pending) 예약을 INSERT ... SELECT FROM unnest(...) 한 번으로 생성하고 (user_id, tryout_id)별
+        예약 id를 반환합니다. 삭제된 예약이 있으면 다시 신청 상태로 되돌리고, 삭제되지
+        않은 예약과 겹치는 행은 건너뜁니다(반환값에 포함되지 않음).
+
+        ORM 이벤트를 거치지 않으므로 사용자별 예약 캐시는 호출한 쪽에서 무효화합니다.
+        """
+        rows = _unnest(
+            "rows",
+            user_id=([r.user_id for r in reservations], Uuid()),
+            tryout_id=([r.tryout_id for r in reservations], Integer()),
+            reserved_seats=([r.reserved_seats for r in reservations], Integer()),
+        )
+        insert_stmt = insert(Reservation).from_select(
+            ["user_id", "tryout_id", "reserved_seats", "status"],
+            select(
+                rows.c.user_id,
+                rows.c.tryout_id,
+                rows.c.reserved_seats,
+                literal(ReservationStatus.pending, type_=RESERVATION_STATUS_TYPE),
+            ),
+        )
+        stmt = insert_stmt.on_conflict_do_update(
+            constraint="uq_user_tryout",
+            set_={
+                "status": insert_stmt.excluded.status,
+                "reserved_seats": insert_stmt.excluded.reserved_seats,
+            },
+            where=col(Reservation.status) == ReservationStatus.deleted,
+        ).returning(
+            col(Reservation.id), col(Reservation.user_id), col(Reservation.tryout_id)
+        )
+        return {
+            (user_id, tryout_id): id
+            for id, user_id, tryout_id in self.session.execute(stmt)
+        }
+
+
+class AsyncReservationRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, reservation_create: ReservationCreate) -> Reservation:
+        reservation = Reservation.model_validate(reservation_create)
+        self.session.add(reservation)
+        await self.session.flush()
+        return reservation
+
+    async def get_user_schedule(self, user_id: uuid.UUID) -> UserSchedule:
+        stmt = _user_schedule_stmt(user_id)
+        return UserSchedule((await self.session.exec(stmt)).all())
+
+    async def has_overlapping_reservation(
+        self, user_id: uuid.UUID, start_time: datetime, end_time: datetime
+    ) -> bool:
+        stmt = _overlapping_reservation_stmt(user_id, start_time, end_time)
+        result = (await self.session.exec(stmt)).one()
+        return bool(result)
+
+    async def count_user_reservations(self, user: UserPrincipal) -> int:
+        return (await self.session.exec(_count_user_reservations_stmt(user))).one()
+
+    async def paginate_user_reservations(
+        self, user: UserPrincipal, limit: int, offset: int, after_id: int | None = None
+    ) -> list[dict[str, Any]]:
+        stmt = _paginate_user_reservations_stmt(user, limit, offset, after_id)
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
+    async def get_by_id(self, id: int, for_update: bool = False) -> Reservation:
+        result = await self.session.get(Reservation, id, with_for_update=for_update)
+        if not result:
+            raise NotFoundError(f"예약을 찾을 수 없습니다. (id:${id} )")
+        return result
+
+    async def update(
+        self, reservation: Reservation, update_data: ReservationUpdate
+    ) -> Reservation:
+        _apply_update(reservation, update_data)
+
+        self.session.add(reservation)
+        await self.session.flush()
+        return reservation
+
+    async def get_by_user_and_tryout(
+        self, user_id: uuid.UUID, tryout_id: int, for_update: bool = False
+    ) -> Reservation | None:
+        stmt = _by_user_and_tryout_stmt(user_id, tryout_id, for_update)
+        return (await self.session.exec(stmt)).first()
@@ -1,11 +1,71 @@
+from collections.abc import Iterator
 from datetime import datetime
+from typing import Any
 
-from sqlmodel import Session, func, select
+from sqlalchemy import ColumnElement, Select, literal, tuple_, update
+from sqlalchemy import select as sa_select
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Session, col, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
 
+from app.core.cache import invalidate_tryouts
 from app.core.exceptions import NotFoundError
+from app.models.reservations import Reservation, ReservationStatus
 from app.models.tryouts import Tryout, TryoutCreate, TryoutUpdateRequest
 
 
+def _tryout_columns() -> list[Any]:
+    # Tryout 필드 순서(= 응답 JSON의 키 순서)대로 컬럼을 반환합니다.
+    return [col(getattr(Tryout, name)) for name in Tryout.model_fields]
+
+
+def _upcoming_filters(now: datetime, open_now: bool) -> list[ColumnElement[bool]]:
+    filters = [col(Tryout.start_time) > now]
+    if open_now:
+        # ix_tryouts_registration_end_time_start_time: 신청 마감 전인 시험만 읽습니다.
+        filters += [
+            col(Tryout.registration_end_time) >= now,
+            col(Tryout.registration_start_time) <= now,
+        ]
+    return filters
+
+
+def _paginate_upcoming_stmt(
+    now: datetime,
+    limit: int,
+    offset: int,
+    after: tuple[datetime, int] | None,
+    open_now: bool = False,
+) -> Select[Any]:
+    # 목록은 캐시된 JSON으로 응답하므로 ORM 엔티티가 아닌 컬럼으로 조회합니다.
+    stmt = sa_select(*_tryout_columns()).where(*_upcoming_filters(now, open_now))
+    if after is not None:
+        after_start_time, after_id = after
+        stmt = stmt.where(
+            tuple_(col(Tryout.start_time), col(Tryout.id))
+            > tuple_(literal(after_start_time), literal(after_id))
+        )
+    return (
+        stmt.order_by(col(Tryout.start_time), col(Tryout.id))
+        .offset(offset)
+        .limit(limit)
+    )
+
+
+def _snapshot_stmt(id: int) -> Select[Any]:
+    # 엔티티가 아닌 컬럼으로 조회해 세션의 identity map에 올리지 않습니다.
+    return sa_select(*_tryout_columns()).where(col(Tryout.id) == id)
+
+
+def _count_upcoming_stmt(now: datetime, open_now: bool = False) -> SelectOfScalar[int]:
+    return (
+        select(func.count())
+        .select_from(Tryout)
+        .where(*_upcoming_filters(now, open_now))
+    )
+
+
 class TryoutRepository:
     def __init__(self, session: Session):
         self.session = session
@@ -13,40 +73,163 @@ class TryoutRepository:
     def create(self, tryouts_create: TryoutCreate) -> Tryout:
         tryout = Tryout.model_validate(tryouts_create)
         self.session.add(tryout)
-        self.session.commit()
-        self.session.refresh(tryout)
+        self.session.flush()
         return tryout
 
     def get_by_id(self, id: int, for_update: bool = False) -> Tryout:
-        result = self.session.get(Tryout, id, with_for_update=for_update)
+        # 잠금과 함께 읽을 때는 이미 로드된 객체도 잠금 이후의 값으로 갱신합니다.
+        result = self.session.get(
+            Tryout, id, with_for_update=for_update, populate_existing=for_update
+        )
 
         if not result:
             raise NotFoundError(f"예약을 찾을 수 없습니다. (id: ${id})")
 
         return result
 
+    def get_snapshot(self, id: int) -> Tryout:
+        """
+        잠금 없이 조회한 시험을 세션에 연결되지 않은 객체로 반환합니다.
+
+        같은 세션에서 이후 `get_by_id(for_update=True)`로 조회할 때 이미 로드된 객체가
+        재사용되어 잠금 이후의 값을 읽지 못하는 일이 없도록, 엔티티로 조회하지 않습니다.
+        """
+        row = self.session.execute(_snapshot_stmt(id)).mappings().one_or_none()
+        if row is None:
+            raise NotFoundError(f"예약을 찾을 수 없습니다. (id: ${id})")
+        return Tryout.model_validate(dict(row))
+
+    def get_by_ids(self, ids: list[int]) -> dict[int, Tryout]:
+        stmt = select(Tryout).where(col(Tryout.id).in_(ids))
+        return {tryout.id: tryout for tryout in self.session.exec(stmt)}
+
     def paginate_upcoming(
-        self, now: datetime, limit: int = 20, offset: int = 0
-    ) -> list[Tryout]:
-        stmt = (
-            select(Tryout)
-            .where(Tryout.start_time > now)
-            .order_by("id", "start_time")
-            .offset(offset)
-            .limit(limit)
-        )
-        return list(self.session.exec(stmt).all())
+        self,
+        now: datetime,
+        limit: int = 20,
+        offset: int = 0,
+        after: tuple[datetime, int] | None = None,
+        open_now: bool = False,
+    ) -> list[dict[str, Any]]:
+        stmt = _paginate_upcoming_stmt(now, limit, offset, after, open_now)
+        return [dict(row) for row in self.session.execute(stmt).mappings()]
+
+    def count_upcoming(self, now: datetime, open_now: bool = False) -> int:
+        return self.session.exec(_count_upcoming_stmt(now, open_now)).one()
 
-    def count_upcoming(self, now: datetime) -> int:
-        stmt = select(func.count()).select_from(Tryout).where(Tryout.start_time > now)
-        return self.session.exec(stmt).one()
+    def get_registration_windows(
+        self, now: datetime
+    ) -> list[tuple[int, datetime, datetime]]:
+        """아직 시작하지 않은 시험의 (id, 신청 시작 시각, 신청 마감 시각)을 반환합니다."""
+        stmt = select(
+            col(Tryout.id),
+            col(Tryout.registration_start_time),
+            col(Tryout.registration_end_time),
+        ).where(col(Tryout.start_time) > now)
+        return list(self.session.exec(stmt).all())
 
     def update(self, tryout: Tryout, update_data: TryoutUpdateRequest) -> Tryout:
         if update_data.confirmed_reserved_count is not None:
             tryout.confirmed_reserved_count = update_data.confirmed_reserved_count
 
         self.session.add(tryout)
-        self.session.commit()
-        self.session.refresh(tryout)
+        self.session.flush()
 
         return tryout
+
+    def add_confirmed_count(self, tryout: Tryout, delta: int) -> bool:
+        """
+        `confirmed_reserved_count`를 조건부 UPDATE 한 번으로 증감합니다.
+
+        행 잠금을 트랜잭션 내내 유지하지 않고, 정원 초과 또는 음수가 되는 경우에는
+        갱신하지 않고 False를 반환합니다.
+        """
+        stmt = (
+            update(Tryout)
+            .where(col(Tryout.id) == tryout.id)
+            .where(
+                col(Tryout.confirmed_reserved_count) + delta <= col(Tryout.max_capacity)
+            )
+            .where(col(Tryout.confirmed_reserved_count) + delta >= 0)
+            .values(
+                confirmed_reserved_count=col(Tryout.confirmed_reserved_count) + delta
+            )
+            .returning(col(Tryout.confirmed_reserved_count))
+            .execution_options(synchronize_session=False)
+        )
+        updated_count = self.session.execute(stmt).scalar_one_or_none()
+        if updated_count is None:
+            return False
+
+        set_committed_value(tryout, "confirmed_reserved_count", updated_count)  # type: ignore[no-untyped-call]
+        # ORM 이벤트를 거치지 않는 UPDATE이므로 목록 캐시를 직접 무효화합니다.
+        invalidate_tryouts(self.session, tryout.id)
+        return True
+
+    def iter_confirmed_count_drift(
+        self, chunk_size: int
+    ) -> Iterator[tuple[int, int, int]]:
+        """
+        `confirmed_reserved_count`가 확정 예약의 좌석 합계와 다른 tryout을
+        (id, 기록된 값, 실제 합계)로 반환합니다.
+
+        예약 테이블을 한 번의 집계 쿼리로 읽고, 결과는 서버 측 커서로 chunk_size건씩
+        가져옵니다. 잠금은 걸지 않습니다.
+        """
+        confirmed = (
+            select(
+                col(Reservation.tryout_id).label("tryout_id"),
+                func.sum(Reservation.reserved_seats).label("seats"),
+            )
+            .where(col(Reservation.status) == ReservationStatus.confirmed)
+            .group_by(col(Reservation.tryout_id))
+            .subquery()
+        )
+        actual = func.coalesce(confirmed.c.seats, 0)
+        stmt = (
+            select(col(Tryout.id), col(Tryout.confirmed_reserved_count), actual)
+            .outerjoin(confirmed, confirmed.c.tryout_id == col(Tryout.id))
+            .where(col(Tryout.confirmed_reserved_count) != actual)
+            .order_by(col(Tryout.id))
+            .execution_options(yield_per=chunk_size)
+        )
+        for tryout_id, recorded, seats in self.session.exec(stmt):
+            yield tryout_id, recorded, int(seats)
+
+
+class AsyncTryoutRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_id(self, id: int, for_update: bool = False) -> Tryout:
+        result = await self.session.get(
+            Tryout, id, with_for_update=for_update, populate_existing=for_update
+        )
+
+        if not result:
+            raise NotFoundError(f"예약을 찾을 수 없습니다. (id: ${id})")
+
+        return result
+
+    async def get_snapshot(self, id: int) -> Tryout:
+        result = await self.session.execute(_snapshot_stmt(id))
+        row = result.mappings().one_or_none()
+        if row is None:
+            raise NotFoundError(f"예약을 찾을 수 없습니다. (id: ${id})")
+        return Tryout.model_validate(dict(row))
+
+    async def paginate_upcoming(
+        self,
+        now: datetime,
+        limit: int = 20,
+        offset: int = 0,
+        after: tuple[datetime, int] | None = None,
+        open_now: bool = False,
+    ) -> list[dict[str, Any]]:
+        stmt = _paginate_upcoming_stmt(now, limit, offset, after, open_now)
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
+    async def count_upcoming(self, now: datetime, open_now: bool = False) -> int:
+        stmt = _count_upcoming_stmt(now, open_now)
+        return (await self.session.exec(stmt)).one()
@@ -1,7 +1,11 @@
-from sqlmodel import Session, select
+import uuid
+
+from sqlalchemy import String, Uuid, any_, false, literal
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlmodel import Session, col, or_, select
 
 from app.core.security import get_password_hash
-from app.models.users import User, UserCreate
+from app.models.users import User, UserCreate, UserPrincipal
 
 
 class UserRepository:
@@ -21,3 +25,31 @@ class UserRepository:
     def get_user_by_email(self, email: str) -> User | None:
         statement = select(User).where(User.email == email)
         return self.session.exec(statement).first()
+
+    def get_principals(
+        self, emails: list[str], ids: list[uuid.UUID]
+    ) -> tuple[dict[str, UserPrincipal], dict[uuid.UUID, UserPrincipal]]:
+        """email 또는 id로 사용자를 한 번에 조회해 (email별, id별) principal을 반환합니다."""
+        conditions = []
+        if emails:
+            conditions.append(col(User.email) == any_(literal(emails, ARRAY(String()))))
+        if ids:
+            conditions.append(col(User.id) == any_(literal(ids, ARRAY(Uuid()))))
+        statement = select(
+            User.id, User.email, User.is_active, User.is_superuser
+        ).where(or_(false(), *conditions))
+        by_email: dict[str, UserPrincipal] = {}
+        by_id: dict[uuid.UUID, UserPrincipal] = {}
+        for id, email, is_active, is_superuser in self.session.exec(statement):
+            principal = UserPrincipal(
+                id=id, is_active=is_active, is_superuser=is_superuser
+            )
+            by_email[email] = by_id[id] = principal
+        return by_email, by_id
+
+    def update_password_hash(self, user: User, hashed_password: str) -> User:
+        user.hashed_password = hashed_password
+        self.session.add(user)
+        self.session.commit()
+        self.session.refresh(user)
+        return user
@@ -0,0 +1,74 @@
+import uuid
+
+from sqlmodel import Session, col, func, select
+
+from app.models.waitlist import WaitlistEntry, WaitlistEntryCreate, WaitlistStatus
+
+
+class WaitlistRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def create(self, entry_create: WaitlistEntryCreate) -> WaitlistEntry:
+        entry = WaitlistEntry.model_validate(entry_create)
+        self.session.add(entry)
+        self.session.flush()
+        return entry
+
+    def get_waiting(self, user_id: uuid.UUID, tryout_id: int) -> WaitlistEntry | None:
+        stmt = select(WaitlistEntry).where(
+            col(WaitlistEntry.user_id) == user_id,
+            col(WaitlistEntry.tryout_id) == tryout_id,
+            col(WaitlistEntry.status) == WaitlistStatus.waiting,
+        )
+        return self.session.exec(stmt).first()
+
+    def position(self, entry: WaitlistEntry) -> int:
+        stmt = (
+            select(func.count())
+            .select_from(WaitlistEntry)
+            .where(
+                col(WaitlistEntry.tryout_id) == entry.tryout_id,
+                col(WaitlistEntry.status) == WaitlistStatus.waiting,
+                col(WaitlistEntry.id) <= entry.id,
+            )
+        )
+        return self.session.exec(stmt).one()
+
+    def lock_waiting(self, tryout_id: int, limit: int) -> list[WaitlistEntry]:
+        """
+        대기 중인 항목을 FIFO 순서로 잠급니다. 다른 워커가 잠근 항목은 건너뜁니다.
+        """
+        stmt = (
+            select(WaitlistEntry)
+            .where(
+                col(WaitlistEntry.tryout_id) == tryout_id,
+                col(WaitlistEntry.status) == WaitlistStatus.waiting,
+            )
+            .order_by(col(WaitlistEntry.id))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(self.session.exec(stmt).all())
+
+    def get_tryout_ids_with_waiting(self) -> list[int]:
+        stmt = (
+            select(WaitlistEntry.tryout_id)
+            .where(col(WaitlistEntry.status) == WaitlistStatus.waiting)
+            .distinct()
+        )
+        return list(self.session.exec(stmt).all())
+
+    def update_status(
+        self,
+        entry: WaitlistEntry,
+        status: WaitlistStatus,
+        reservation_id: int | None = None,
+    ) -> WaitlistEntry:
+        entry.status = status
+        if reservation_id is not None:
+            entry.reservation_id = reservation_id
+
+        self.session.add(entry)
+        self.session.flush()
+        return entry
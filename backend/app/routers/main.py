@@ -1,9 +1,60 @@
 from fastapi import APIRouter
+from fastapi.routing import APIRoute
 
-from app.routers import reservations, tryouts, utils
+from app.core.config import settings
+from app.routers import (
+    reservations,
+    reservations_async,
+    tryouts,
+    tryouts_async,
+    utils,
+)
 
-api_router = APIRouter()
 
-api_router.include_router(utils.router)
-api_router.include_router(tryouts.router)
-api_router.include_router(reservations.router)
+def include_with_fallback(
+    api_router: APIRouter, primary: APIRouter, fallback: APIRouter
+) -> None:
+    """
+    `primary`의 라우트를 등록하고, `fallback`에서는 같은 경로/메서드가
+    `primary`에 없는 라우트만 등록합니다.
+
+    `fallback`의 고정 경로(예: `/reservations/export`)는 `primary`의 경로 변수
+    라우트(예: `/reservations/{reservation_id}`)에 가려지지 않도록 앞에 둡니다.
+    """
+    start = len(api_router.routes)
+    api_router.include_router(primary)
+
+    overridden = {
+        (route.path, method)
+        for route in primary.routes
+        if isinstance(route, APIRoute)
+        for method in route.methods
+    }
+    for route in fallback.routes:
+        if isinstance(route, APIRoute) and not any(
+            (route.path, method) in overridden for method in route.methods
+        ):
+            if "{" in route.path:
+                api_router.routes.append(route)
+            else:
+                api_router.routes.insert(start, route)
+                start += 1
+
+
+def build_api_router(database_mode: str) -> APIRouter:
+    api_router = APIRouter()
+    api_router.include_router(utils.router)
+
+    if database_mode == "async":
+        include_with_fallback(api_router, tryouts_async.router, tryouts.router)
+        include_with_fallback(
+            api_router, reservations_async.router, reservations.router
+        )
+    else:
+        api_router.include_router(tryouts.router)
+        api_router.include_router(reservations.router)
+
+    return api_router
+
+
+api_router = build_api_router(settings.DATABASE_MODE)
@@ -0,0 +1,44 @@
+import secrets
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+router = APIRouter(tags=["metrics"])
+
+scrape_bearer = HTTPBearer(auto_error=False)
+
+
+def verify_scrape_token(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(scrape_bearer)],
+) -> None:
+    # 토큰을 설정하지 않으면 지표를 노출하지 않습니다.
+    token = settings.METRICS_TOKEN
+    if (
+        not token
+        or credentials is None
+        or not secrets.compare_digest(credentials.credentials, token)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Could not validate credentials",
+        )
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+    dependencies=[Depends(verify_scrape_token)],
+)
+def metrics() -> PlainTextResponse:
+    """
+    Per-endpoint request metrics in Prometheus text format (per worker process)
+    """
+    return PlainTextResponse(
+        metrics_registry.render(), media_type="text/plain; version=0.0.4"
+    )
@@ -1,15 +1,37 @@
+from tempfile import SpooledTemporaryFile
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 
+from app.core.exceptions import BadRequestError
+from app.core.responses import FastJSONResponse
 from app.dependencies import SessionDep, get_current_active_superuser, get_current_user
 from app.models.common import PaginatedResponse
-from app.models.reservations import Reservation, ReservationUpdateRequest
-from app.models.users import User
+from app.models.reservations import (
+    Reservation,
+    ReservationBatchConfirmRequest,
+    ReservationBatchConfirmResponse,
+    ReservationStatus,
+    ReservationUpdateRequest,
+)
+from app.models.users import UserPrincipal
+from app.services.reservation_export import (
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    stream_reservation_export,
+)
+from app.services.reservation_import import (
+    IMPORT_CONTENT_TYPES,
+    stream_reservation_import,
+)
 from app.services.reservations import ReservationService
 
 router = APIRouter(prefix="/reservations", tags=["reservations"])
 
+# 일괄 신청 업로드 파일은 이 크기까지만 메모리에 두고, 넘으면 임시 파일에 기록합니다.
+IMPORT_SPOOL_MAX_BYTES = 1024 * 1024
+
 
 @router.get(
     "",
@@ -18,19 +40,53 @@ router = APIRouter(prefix="/reservations", tags=["reservations"])
 - 일반 사용자는 본인의 예약만 확인할 수 있습니다.
 - 어드민은 전체 예약 목록을 조회할 수 있습니다.
 - `limit`, `offset`을 통해 페이지네이션이 가능합니다.
+- 응답의 `next_cursor`를 `cursor`로 전달하면 커서 방식으로 다음 페이지를 조회합니다.
+  커서 방식에서는 `offset`이 무시되고 `total`은 계산하지 않습니다.
 """,
     response_model=PaginatedResponse[Reservation],
+    response_class=FastJSONResponse,
 )
 def paginate_reservations(
     session: SessionDep,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_user)],
     limit: Annotated[int, Query(ge=1, le=1000)] = 10,
     offset: Annotated[int, Query(ge=0)] = 0,
-) -> PaginatedResponse[Reservation]:
-    return ReservationService(session).paginate_reservations(
+    cursor: Annotated[str | None, Query()] = None,
+) -> FastJSONResponse:
+    page = ReservationService(session).paginate_reservations(
         user=current_user,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+    )
+    return FastJSONResponse(page)
+
+
+@router.get(
+    "/export",
+    summary="[Admin 전용] 예약 내보내기",
+    description="""
+- 어드민 전용 기능입니다.
+- 예약 전체를 id 순으로 NDJSON(`format=ndjson`, 기본값) 또는 CSV(`format=csv`)로 스트리밍합니다.
+- `tryout_id`, `status`로 대상을 좁힐 수 있으며, 건수와 무관하게 한 번의 요청으로 내려받습니다.
+""",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}
+    },
+    dependencies=[Depends(get_current_active_superuser)],
+)
+def export_reservations(
+    format: ExportFormat = "ndjson",
+    tryout_id: int | None = None,
+    status: ReservationStatus | None = None,
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_reservation_export(format, tryout_id=tryout_id, status=status),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="reservations.{format}"'
+        },
     )
 
 
@@ -45,7 +101,7 @@ def paginate_reservations(
 def get_reservation_by_id(
     reservation_id: int,
     session: SessionDep,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> Reservation:
     return ReservationService(session).get_reservation_by_id(
         reservation_id=reservation_id,
@@ -71,6 +127,64 @@ def confirm_reservation(
     return ReservationService(session).confirm_reservation(reservation_id)
 
 
+@router.post(
+    "/confirm:batch",
+    response_model=ReservationBatchConfirmResponse,
+    summary="[Admin 전용] 예약 일괄 확정 처리",
+    description="""
+- 어드민 전용 기능입니다.
+- `reservation_ids`로 확정할 예약 id 목록을 전달하거나, `tryout_id`(+ `limit`)로 해당 시험의 대기 예약을 id 순으로 확정합니다.
+- 시험별로 남은 정원 안에서 id 순으로 확정하며, 확정하지 못한 예약은 사유와 함께 결과에 포함됩니다.
+""",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+def confirm_reservations(
+    request: ReservationBatchConfirmRequest,
+    session: SessionDep,
+) -> ReservationBatchConfirmResponse:
+    return ReservationService(session).confirm_reservations(request)
+
+
+@router.post(
+    "/import",
+    summary="[Admin 전용] 예약 일괄 신청",
+    description="""
+- 어드민 전용 기능입니다. 기관 고객의 여러 계정/시험 신청을 한 번에 등록합니다.
+- 요청 본문은 CSV(`Content-Type: text/csv`, 헤더 포함) 또는 NDJSON(`application/x-ndjson`)이며,
+  각 행은 `email` 또는 `user_id`, `tryout_id`, `reserved_seats`(기본 1)로 구성됩니다.
+- 행마다 예약 신청과 같은 조건(신청 기간, 정원, 중복/동시간대 예약)을 검사하고 대기(pending) 예약을 생성합니다.
+- 응답은 행별 결과(`line`, `status`, `reservation_id`, `detail`)를 NDJSON으로 스트리밍합니다.
+""",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                content_type: {"schema": {"type": "string"}}
+                for content_type in IMPORT_CONTENT_TYPES
+            },
+        }
+    },
+    dependencies=[Depends(get_current_active_superuser)],
+)
+async def import_reservations(request: Request) -> StreamingResponse:
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    format = IMPORT_CONTENT_TYPES.get(content_type)
+    if format is None:
+        raise BadRequestError("text/csv 또는 application/x-ndjson 형식만 지원합니다.")
+
+    upload = SpooledTemporaryFile(max_size=IMPORT_SPOOL_MAX_BYTES)
+    async for chunk in request.stream():
+        upload.write(chunk)
+    upload.seek(0)
+
+    return StreamingResponse(
+        stream_reservation_import(upload, format),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.delete(
     "/{reservation_id}/delete",
     response_model=Reservation,
@@ -84,7 +198,7 @@ def confirm_reservation(
 def reject_reservation(
     reservation_id: int,
     session: SessionDep,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> Reservation:
     return ReservationService(session).delete_reservation(
         reservation_id, current_user=current_user
@@ -105,7 +219,7 @@ def update_reservation(
     reservation_id: int,
     update_data: ReservationUpdateRequest,
     session: SessionDep,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> Reservation:
     return ReservationService(session).update_reservation(
         reservation_id=reservation_id,
@@ -0,0 +1,61 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+
+from app.core.responses import FastJSONResponse
+from app.dependencies import AsyncCurrentUser, AsyncSessionDep
+from app.models.common import PaginatedResponse
+from app.models.reservations import Reservation
+from app.services.reservations import AsyncReservationService
+
+# DATABASE_MODE=async 일 때 app.routers.reservations의 조회 API를 대체하는 라우터입니다.
+# 확정/수정/삭제 API는 동기 라우터를 그대로 사용합니다.
+router = APIRouter(prefix="/reservations", tags=["reservations"])
+
+
+@router.get(
+    "",
+    summary="[User/Admin] 예약 목록 조회",
+    description="""
+- 일반 사용자는 본인의 예약만 확인할 수 있습니다.
+- 어드민은 전체 예약 목록을 조회할 수 있습니다.
+- `limit`, `offset`을 통해 페이지네이션이 가능합니다.
+- 응답의 `next_cursor`를 `cursor`로 전달하면 커서 방식으로 다음 페이지를 조회합니다.
+  커서 방식에서는 `offset`이 무시되고 `total`은 계산하지 않습니다.
+""",
+    response_model=PaginatedResponse[Reservation],
+    response_class=FastJSONResponse,
+)
+async def paginate_reservations(
+    session: AsyncSessionDep,
+    current_user: AsyncCurrentUser,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 10,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query()] = None,
+) -> FastJSONResponse:
+    page = await AsyncReservationService(session).paginate_reservations(
+        user=current_user,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+    )
+    return FastJSONResponse(page)
+
+
+@router.get(
+    "/{reservation_id}",
+    summary="[User/Admin] 예약 상세 조회",
+    description="""
+- 본인의 예약이거나, 어드민인 경우 해당 예약 상세 정보를 조회할 수 있습니다.
+""",
+    response_model=Reservation,
+)
+async def get_reservation_by_id(
+    reservation_id: int,
+    session: AsyncSessionDep,
+    current_user: AsyncCurrentUser,
+) -> Reservation:
+    return await AsyncReservationService(session).get_reservation_by_id(
+        reservation_id=reservation_id,
+        current_user=current_user,
+    )
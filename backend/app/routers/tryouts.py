@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, Query
 
+from app.core.responses import FastJSONResponse
 from app.dependencies import CurrentUser, SessionDep, get_current_user
 from app.models.common import PaginatedResponse
 from app.models.reservations import Reservation
 from app.models.tryouts import TryoutPublic
-from app.models.users import User
+from app.models.users import UserPrincipal
+from app.models.waitlist import WaitlistEntryPublic
 from app.services.tryouts import TryoutService
 
 router = APIRouter(prefix="/tryouts", tags=["tryouts"])
@@ -13,24 +15,35 @@ router = APIRouter(prefix="/tryouts", tags=["tryouts"])
 @router.get(
     "",
     response_model=PaginatedResponse[TryoutPublic],
+    response_class=FastJSONResponse,
     summary="[User] 시험 일정 목록 조회",
     description="""
 고객이 예약 가능한 시험 일정을 조회합니다.
 
 - 시험 시작 시간이 현재 이후인 일정만 조회됩니다.
+- `open_now=true`이면 현재 신청 기간인 일정만 조회합니다.
 - 각 일정에 대해 `isApplied` 값으로 예약 여부를 함께 제공합니다.
 - 페이징 방식으로 `limit`, `offset` 사용
+- 응답의 `next_cursor`를 `cursor`로 전달하면 `(start_time, id)` 기준 커서 방식으로 다음 페이지를 조회합니다.
+  커서 방식에서는 `offset`이 무시되고 `total`은 계산하지 않습니다.
 """,
 )
 def paginate_tryouts(
     session: SessionDep,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
-) -> PaginatedResponse[TryoutPublic]:
-    return TryoutService(session).paginate_upcoming_tryouts(
-        limit=limit, offset=offset, user_id=current_user.id
+    cursor: str | None = Query(None),
+    open_now: bool = Query(False),
+) -> FastJSONResponse:
+    page = TryoutService(session).paginate_upcoming_tryouts(
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        user_id=current_user.id,
+        open_now=open_now,
     )
+    return FastJSONResponse(page)
 
 
 @router.get(
@@ -59,16 +72,66 @@ def get_tryout_by_id(
 - 어드민은 예약 신청이 불가능합니다.
 - 예약 신청은 시험 시작 3일 전까지 가능하며, 동시간대 확정 인원 5만명을 초과할 수 없습니다.
 - 하나의 시험에 대해 중복 예약은 불가하며, 기존 삭제된 예약은 재사용됩니다.
+- 같은 시험에 동시에 처리 중인 신청이 많으면 `202`와 대기 번호(`ticket_id`, `position`)를 반환합니다.
+  `Retry-After` 이후 `POST /tryouts/{tryout_id}/reserve/tickets/{ticket_id}`로 다시 요청하세요.
 """,
 )
 def reserve_tryout(
     session: SessionDep,
     tryout_id: int,
     reserved_seats: int = Query(..., gt=0, le=50000, description="신청 인원 수"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> Reservation:
     return TryoutService(session).reserve_tryout(
         tryout_id=tryout_id,
         user=current_user,
         reserved_seats=reserved_seats,
     )
+
+
+@router.post(
+    "/{tryout_id}/reserve/tickets/{ticket_id}",
+    response_model=Reservation,
+    summary="[User 전용] 예약 신청 대기 번호 사용",
+    description="""
+예약 신청 시 발급받은 대기 번호로 예약을 이어서 진행합니다.
+
+- 차례가 되면 발급 시 요청한 인원으로 예약을 신청하고 예약 정보를 반환합니다.
+- 아직 차례가 아니면 `202`와 현재 대기 순번을 반환합니다.
+- 만료되었거나 본인의 대기 번호가 아니면 `404`를 반환합니다.
+""",
+)
+def redeem_reserve_ticket(
+    session: SessionDep,
+    tryout_id: int,
+    ticket_id: str,
+    current_user: UserPrincipal = Depends(get_current_user),
+) -> Reservation:
+    return TryoutService(session).redeem_reserve_ticket(
+        tryout_id=tryout_id, user=current_user, ticket_id=ticket_id
+    )
+
+
+@router.post(
+    "/{tryout_id}/waitlist",
+    response_model=WaitlistEntryPublic,
+    summary="[User 전용] 시험 일정 대기열 등록",
+    description="""
+정원이 가득 찬 시험 일정의 대기열에 등록합니다.
+
+- 예약 신청과 같은 조건(신청 기간, 중복/동시간대 예약)을 확인하며, 남은 좌석이 있으면 등록되지 않습니다.
+- 확정 예약이 삭제되거나 인원이 줄어 좌석이 생기면, 등록 순서(FIFO)대로 확정 예약으로 자동 승격됩니다.
+- 응답의 `position`은 현재 대기 순번입니다.
+""",
+)
+def join_waitlist(
+    session: SessionDep,
+    tryout_id: int,
+    reserved_seats: int = Query(..., gt=0, le=50000, description="신청 인원 수"),
+    current_user: UserPrincipal = Depends(get_current_user),
+) -> WaitlistEntryPublic:
+    return TryoutService(session).join_waitlist(
+        tryout_id=tryout_id,
+        user=current_user,
+        reserved_seats=reserved_seats,
+    )
@@ -0,0 +1,113 @@
+from fastapi import APIRouter, Query
+
+from app.core.responses import FastJSONResponse
+from app.dependencies import AsyncCurrentUser, AsyncSessionDep
+from app.models.common import PaginatedResponse
+from app.models.reservations import Reservation
+from app.models.tryouts import TryoutPublic
+from app.services.tryouts import AsyncTryoutService
+
+# DATABASE_MODE=async 일 때 app.routers.tryouts의 같은 경로를 대체하는 라우터입니다.
+router = APIRouter(prefix="/tryouts", tags=["tryouts"])
+
+
+@router.get(
+    "",
+    response_model=PaginatedResponse[TryoutPublic],
+    response_class=FastJSONResponse,
+    summary="[User] 시험 일정 목록 조회",
+    description="""
+고객이 예약 가능한 시험 일정을 조회합니다.
+
+- 시험 시작 시간이 현재 이후인 일정만 조회됩니다.
+- `open_now=true`이면 현재 신청 기간인 일정만 조회합니다.
+- 각 일정에 대해 `isApplied` 값으로 예약 여부를 함께 제공합니다.
+- 페이징 방식으로 `limit`, `offset` 사용
+- 응답의 `next_cursor`를 `cursor`로 전달하면 `(start_time, id)` 기준 커서 방식으로 다음 페이지를 조회합니다.
+  커서 방식에서는 `offset`이 무시되고 `total`은 계산하지 않습니다.
+""",
+)
+async def paginate_tryouts(
+    session: AsyncSessionDep,
+    current_user: AsyncCurrentUser,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
+    open_now: bool = Query(False),
+) -> FastJSONResponse:
+    page = await AsyncTryoutService(session).paginate_upcoming_tryouts(
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        user_id=current_user.id,
+        open_now=open_now,
+    )
+    return FastJSONResponse(page)
+
+
+@router.get(
+    "/{tryout_id}",
+    response_model=TryoutPublic,
+    summary="[User] 시험 일정 상세 조회",
+    description="""
+시험 일정 정보를 조회합니다.
+
+- 로그인한 사용자가 해당 일정에 예약했는지 여부도 함께 반환됩니다.
+""",
+)
+async def get_tryout_by_id(
+    tryout_id: int, session: AsyncSessionDep, current_user: AsyncCurrentUser
+) -> TryoutPublic:
+    return await AsyncTryoutService(session).get_tryout_by_id(
+        tryout_id, current_user.id
+    )
+
+
+@router.post(
+    "/{tryout_id}/reserve",
+    response_model=Reservation,
+    summary="[User 전용] 시험 일정 예약 신청",
+    description="""
+고객이 특정 시험 일정에 예약을 신청합니다.
+
+- 어드민은 예약 신청이 불가능합니다.
+- 예약 신청은 시험 시작 3일 전까지 가능하며, 동시간대 확정 인원 5만명을 초과할 수 없습니다.
+- 하나의 시험에 대해 중복 예약은 불가하며, 기존 삭제된 예약은 재사용됩니다.
+- 같은 시험에 동시에 처리 중인 신청이 많으면 `202`와 대기 번호(`ticket_id`, `position`)를 반환합니다.
+  `Retry-After` 이후 `POST /tryouts/{tryout_id}/reserve/tickets/{ticket_id}`로 다시 요청하세요.
+""",
+)
+async def reserve_tryout(
+    session: AsyncSessionDep,
+    tryout_id: int,
+    current_user: AsyncCurrentUser,
+    reserved_seats: int = Query(..., gt=0, le=50000, description="신청 인원 수"),
+) -> Reservation:
+    return await AsyncTryoutService(session).reserve_tryout(
+        tryout_id=tryout_id,
+        user=current_user,
+        reserved_seats=reserved_seats,
+    )
+
+
+@router.post(
+    "/{tryout_id}/reserve/tickets/{ticket_id}",
+    response_model=Reservation,
+    summary="[User 전용] 예약 신청 대기 번호 사용",
+    description="""
+예약 신청 시 발급받은 대기 번호로 예약을 이어서 진행합니다.
+
+- 차례가 되면 발급 시 요청한 인원으로 예약을 신청하고 예약 정보를 반환합니다.
+- 아직 차례가 아니면 `202`와 현재 대기 순번을 반환합니다.
+- 만료되었거나 본인의 대기 번호가 아니면 `404`를 반환합니다.
+""",
+)
+async def redeem_reserve_ticket(
+    session: AsyncSessionDep,
+    tryout_id: int,
+    ticket_id: str,
+    current_user: AsyncCurrentUser,
+) -> Reservation:
+    return await AsyncTryoutService(session).redeem_reserve_ticket(
+        tryout_id=tryout_id, user=current_user, ticket_id=ticket_id
+    )
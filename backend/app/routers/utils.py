@@ -1,12 +1,14 @@
 from datetime import timedelta
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.core.config import settings
+from app.core.db import get_pool_status
+from app.core.profiler import query_profiler
 from app.core.security import create_access_token
-from app.dependencies import SessionDep
+from app.dependencies import SessionDep, get_current_active_superuser
 from app.models.users import Token
 from app.services.users import UserService
 
@@ -18,6 +20,24 @@ async def health_check() -> bool:
     return True
 
 
+@router.get("/db-pool/", dependencies=[Depends(get_current_active_superuser)])
+async def db_pool_status() -> dict[str, Any]:
+    """
+    Connection pool usage (checked-out, overflow, checkout wait time) per engine
+    """
+    return get_pool_status()
+
+
+@router.get("/query-profile/", dependencies=[Depends(get_current_active_superuser)])
+async def query_profile(limit: int = 50) -> list[dict[str, Any]]:
+    """
+    Per-statement-fingerprint latency stats (requires QUERY_PROFILER_ENABLED)
+    """
+    if not settings.QUERY_PROFILER_ENABLED:
+        raise HTTPException(status_code=404, detail="Query profiler is disabled")
+    return query_profiler.snapshot(limit)
+
+
 @router.post("/login/access-token")
 def login_access_token(
     session: SessionDep,
@@ -0,0 +1,128 @@
+from typing import Protocol
+
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.exceptions import BadRequestError, TryoutFullError
+from app.core.transaction import run_after_commit, run_after_rollback
+from app.models.tryouts import Tryout, TryoutUpdateRequest
+from app.repository.tryouts import TryoutRepository
+from app.services.capacity_ledger import capacity_ledger
+
+
+class AdmissionEngine(Protocol):
+    """
+    tryout의 확정 인원(`confirmed_reserved_count`)을 관리하는 좌석 배정 엔진.
+
+    `load_tryout`으로 검증에 사용할 tryout을 가져오고, `admit`/`release`로
+    확정 인원을 증감합니다. 정원을 초과하면 `TryoutFullError`를 발생시킵니다.
+    `for_update`를 생략하면 엔진의 기본 잠금 방식을 따르며, 여러 예약을 한 번에
+    처리하는 배치 작업은 True로 tryout 행을 잠가 정원 계산 중 변경을 막습니다.
+    """
+
+    def load_tryout(self, tryout_id: int, for_update: bool | None = None) -> Tryout: ...
+
+    def admit(self, tryout: Tryout, seats: int) -> None: ...
+
+    def release(self, tryout: Tryout, seats: int) -> None: ...
+
+
+class RowLockAdmissionEngine:
+    def __init__(self, session: Session):
+        self.tryout_repo = TryoutRepository(session)
+
+    def load_tryout(self, tryout_id: int, for_update: bool | None = None) -> Tryout:
+        return self.tryout_repo.get_by_id(
+            tryout_id, for_update=True if for_update is None else for_update
+        )
+
+    def admit(self, tryout: Tryout, seats: int) -> None:
+        if tryout.confirmed_reserved_count + seats > tryout.max_capacity:
+            raise TryoutFullError()
+
+        self.tryout_repo.update(
+            tryout,
+            TryoutUpdateRequest(
+                confirmed_reserved_count=tryout.confirmed_reserved_count + seats
+            ),
+        )
+
+    def release(self, tryout: Tryout, seats: int) -> None:
+        if tryout.confirmed_reserved_count < seats:
+            raise BadRequestError("확정 인원 수가 잘못되었습니다.")
+
+        self.tryout_repo.update(
+            tryout,
+            TryoutUpdateRequest(
+                confirmed_reserved_count=tryout.confirmed_reserved_count - seats
+            ),
+        )
+
+
+class ConditionalUpdateAdmissionEngine:
+    def __init__(self, session: Session):
+        self.tryout_repo = TryoutRepository(session)
+
+    def load_tryout(self, tryout_id: int, for_update: bool | None = None) -> Tryout:
+        # 정원 검사는 admit/release의 조건부 UPDATE가 담당하므로 기본적으로 잠그지 않습니다.
+        return self.tryout_repo.get_by_id(tryout_id, for_update=bool(for_update))
+
+    def admit(self, tryout: Tryout, seats: int) -> None:
+        if not self.tryout_repo.add_confirmed_count(tryout, seats):
+            raise TryoutFullError()
+
+    def release(self, tryout: Tryout, seats: int) -> None:
+        if not self.tryout_repo.add_confirmed_count(tryout, -seats):
+            raise BadRequestError("확정 인원 수가 잘못되었습니다.")
+
+
+class LedgerAdmissionEngine:
+    """확정 인원을 프로세스 메모리의 좌석 원장(CapacityLedger)으로 관리합니다."""
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.tryout_repo = TryoutRepository(session)
+
+    def load_tryout(self, tryout_id: int, for_update: bool | None = None) -> Tryout:
+        # 확정 인원은 원장에서 단일 writer로 관리하므로 tryout 행은 잠그지 않고,
+        # 아직 기록되지 않았을 수 있는 DB 값 대신 원장의 값을 사용합니다.
+        tryout = self.tryout_repo.get_by_id(tryout_id)
+        confirmed = capacity_ledger.confirmed(tryout_id)
+        set_committed_value(tryout, "confirmed_reserved_count", confirmed)  # type: ignore[no-untyped-call]
+        return tryout
+
+    def admit(self, tryout: Tryout, seats: int) -> None:
+        tryout_id = tryout.id
+        if not capacity_ledger.admit(tryout_id, seats):
+            raise TryoutFullError()
+
+        run_after_commit(self.session, lambda: capacity_ledger.commit(tryout_id, seats))
+        run_after_rollback(
+            self.session, lambda: capacity_ledger.rollback(tryout_id, seats)
+        )
+        set_committed_value(  # type: ignore[no-untyped-call]
+            tryout, "confirmed_reserved_count", tryout.confirmed_reserved_count + seats
+        )
+
+    def release(self, tryout: Tryout, seats: int) -> None:
+        tryout_id = tryout.id
+        if not capacity_ledger.can_release(tryout_id, seats):
+            raise BadRequestError("확정 인원 수가 잘못되었습니다.")
+
+        run_after_commit(
+            self.session, lambda: capacity_ledger.commit(tryout_id, -seats)
+        )
+
+
+def requires_tryout_row_lock() -> bool:
+    # AdmissionEngine을 거치지 않고 tryout을 읽는 곳(async 경로)에서 잠금 여부를 맞춥니다.
+    return settings.ADMISSION_ENGINE == "row_lock"
+
+
+def get_admission_engine(session: Session) -> AdmissionEngine:
+    if requires_tryout_row_lock():
+        return RowLockAdmissionEngine(session)
+    if settings.ADMISSION_ENGINE == "ledger":
+        return LedgerAdmissionEngine(session)
+    return ConditionalUpdateAdmissionEngine(session)
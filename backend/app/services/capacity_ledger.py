@@ -0,0 +1,256 @@
+import logging
+import threading
+from dataclasses import dataclass
+
+from sqlalchemy import Connection, bindparam, text, update
+from sqlalchemy.exc import DBAPIError
+from sqlmodel import Session, col
+
+from app.core.cache import tryout_page_cache, tryout_snapshot_cache
+from app.core.config import settings
+from app.core.db import engine
+from app.core.exceptions import ServiceUnavailableError
+from app.models.tryouts import Tryout
+from app.repository.reservations import ReservationRepository
+from app.repository.tryouts import TryoutRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Seats:
+    max_capacity: int
+    # 커밋되지 않은 admit까지 포함한 확정 인원. 정원 검사에 사용합니다.
+    confirmed: int
+    # 커밋된 확정 인원. write-behind로 tryouts 테이블에 기록하는 값입니다.
+    committed: int
+
+
+class CapacityLedger:
+    """
+    tryout별 확정 인원을 프로세스 메모리에서 관리하는 좌석 원장 (ADMISSION_ENGINE=ledger).
+
+    - 정원 검사와 증가는 메모리에서 처리하고, 커밋된 값만 `flush_interval`마다 한 번의
+      배치 UPDATE로 `tryouts.confirmed_reserved_count`에 기록합니다.
+    - 좌석 증가(admit)는 즉시 반영하고 롤백되면 되돌리며, 좌석 반환(release)은 커밋된
+      뒤에 반영해 롤백된 반환 좌석을 다른 요청이 가져가지 않도록 합니다.
+    - tryout을 처음 사용할 때 Postgres advisory lock으로 해당 tryout의 단일 writer가
+      되고, 확정 인원을 `reservations`의 합계로 다시 계산합니다. 기록되지 않은 변경이
+      있던 프로세스가 종료되어도 이 값으로 복구됩니다. 복구는 전역 잠금 밖에서 하므로
+      복구 중에도 다른 tryout의 요청은 기다리지 않습니다.
+    - advisory lock을 보유한 연결이 끊기면 다른 워커가 writer가 될 수 있으므로,
+      `flush_interval`마다 연결을 확인하고 끊겼으면 메모리 상태를 버립니다. 이후 요청은
+      advisory lock을 다시 잡고 복구합니다.
+    - 다른 워커 프로세스가 이미 관리 중인 tryout은 ServiceUnavailableError(503)로
+      거절하므로, 워커가 여러 개이면 tryout id 기준으로 요청을 나눠 보내야 합니다.
+    """
+
+    def __init__(self, flush_interval: float, lock_namespace: int):
+        self.flush_interval = flush_interval
+        self.lock_namespace = lock_namespace
+        self._seats: dict[int, _Seats] = {}
+        self._dirty: set[int] = set()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # advisory lock을 보유하는 연결. 여러 스레드가 함께 쓰므로 _owner_lock으로 보호합니다.
+        self._owner: Connection | None = None
+        self._owner_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def confirmed(self, tryout_id: int) -> int:
+        entry = self._load(tryout_id)
+        with self._lock:
+            return entry.confirmed
+
+    def admit(self, tryout_id: int, seats: int) -> bool:
+        entry = self._load(tryout_id)
+        with self._lock:
+            if entry.confirmed + seats > entry.max_capacity:
+                return False
+            entry.confirmed += seats
+            return True
+
+    def can_release(self, tryout_id: int, seats: int) -> bool:
+        entry = self._load(tryout_id)
+        with self._lock:
+            return entry.committed >= seats
+
+    def commit(self, tryout_id: int, delta: int) -> None:
+        """커밋된 증감을 반영합니다. 반환(delta < 0)은 이때 정원에 돌려줍니다."""
+        with self._lock:
+            entry = self._seats.get(tryout_id)
+            # 그 사이 원장을 버렸다면 다음 복구 때 reservations에서 다시 계산합니다.
+            if entry is None:
+                return
+            entry.committed += delta
+            if delta < 0:
+                entry.confirmed += delta
+            self._dirty.add(tryout_id)
+
+    def rollback(self, tryout_id: int, delta: int) -> None:
+        """롤백된 admit을 되돌립니다."""
+        if delta <= 0:
+            return
+        with self._lock:
+            entry = self._seats.get(tryout_id)
+            if entry is not None:
+                entry.confirmed -= delta
+
+    def flush(self) -> int:
+        """커밋된 확정 인원을 tryouts 테이블에 기록하고, 기록한 tryout 수를 반환합니다."""
+        with self._flush_lock:
+            with self._lock:
+                rows = [
+                    {"b_id": tryout_id, "b_count": self._seats[tryout_id].committed}
+                    for tryout_id in sorted(self._dirty)
+                ]
+                self._dirty.clear()
+            if not rows:
+                return 0
+
+            stmt = (
+                update(Tryout)
+                .where(col(Tryout.id) == bindparam("b_id"))
+                .values(confirmed_reserved_count=bindparam("b_count"))
+            )
+            try:
+                with engine.begin() as connection:
+                    connection.execute(stmt, rows)
+            except Exception:
+                with self._lock:
+                    self._dirty.update(row["b_id"] for row in rows)
+                raise
+
+        # ORM 이벤트를 거치지 않는 UPDATE이므로 목록 캐시와 스냅샷을 직접 무효화합니다.
+        tryout_page_cache.bump()
+        for row in rows:
+            tryout_snapshot_cache.invalidate(row["b_id"])
+        return len(rows)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="capacity-ledger", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        self.reset()
+
+    def reset(self) -> None:
+        """메모리 상태를 비우고 advisory lock을 반환합니다. 기록되지 않은 값은 버립니다."""
+        with self._lock:
+            self._seats.clear()
+            self._dirty.clear()
+        with self._owner_lock:
+            self._release_owner()
+
+    def check_owner(self) -> bool:
+        """
+        advisory lock을 보유한 연결이 살아 있는지 확인합니다. 끊겼으면 잠금도 함께
+        사라졌으므로 메모리 상태를 버리고 False를 반환합니다.
+        """
+        with self._owner_lock:
+            if self._owner is None:
+                return True
+            try:
+                self._owner.execute(text("SELECT 1"))
+                self._owner.commit()
+                return True
+            except DBAPIError:
+                logger.exception("좌석 원장의 advisory lock 연결이 끊겼습니다.")
+                self._owner.invalidate()
+                self._owner.close()
+                self._owner = None
+        with self._lock:
+            self._seats.clear()
+            self._dirty.clear()
+        return False
+
+    def _release_owner(self) -> None:
+        # 세션 단위 advisory lock은 풀 반환 시의 ROLLBACK으로 풀리지 않으므로, 연결을
+        # 풀에 돌려주기 전에 직접 해제합니다. 해제하지 못하면 연결을 폐기합니다.
+        if self._owner is None:
+            return
+        try:
+            self._owner.execute(text("SELECT pg_advisory_unlock_all()"))
+            self._owner.commit()
+        except DBAPIError:
+            self._owner.invalidate()
+        self._owner.close()
+        self._owner = None
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self.flush_interval):
+            try:
+                if self.check_owner():
+                    self.flush()
+            except Exception:
+                logger.exception("좌석 원장 기록 중 오류가 발생했습니다.")
+
+    def _load(self, tryout_id: int) -> _Seats:
+        with self._lock:
+            entry = self._seats.get(tryout_id)
+        if entry is not None:
+            return entry
+
+        # 복구(DB 조회)는 잠금 없이 하고, 먼저 등록된 값이 없을 때만 등록합니다.
+        # 같은 tryout을 동시에 복구하면 먼저 등록된 값을 사용합니다.
+        recovered, drifted = self._recover(tryout_id)
+        with self._lock:
+            entry = self._seats.setdefault(tryout_id, recovered)
+            if entry is recovered and drifted:
+                self._dirty.add(tryout_id)
+        return entry
+
+    def _recover(self, tryout_id: int) -> tuple[_Seats, bool]:
+        """reservations에서 확정 인원을 다시 계산하고, 기록된 값과 다른지 함께 반환합니다."""
+        if not self._try_advisory_lock(tryout_id):
+            raise ServiceUnavailableError("다른 워커에서 처리 중인 시험입니다.")
+
+        with Session(engine) as session:
+            tryout = TryoutRepository(session).get_by_id(tryout_id)
+            confirmed = ReservationRepository(session).sum_confirmed_seats(tryout_id)
+
+        drifted = confirmed != tryout.confirmed_reserved_count
+        if drifted:
+            logger.warning(
+                "tryout %s의 확정 인원을 %s에서 %s로 복구합니다.",
+                tryout_id,
+                tryout.confirmed_reserved_count,
+                confirmed,
+            )
+        seats = _Seats(
+            max_capacity=tryout.max_capacity, confirmed=confirmed, committed=confirmed
+        )
+        return seats, drifted
+
+    def _try_advisory_lock(self, tryout_id: int) -> bool:
+        # 커넥션 풀에서 연결을 기다리는 동안에는 잠금을 잡지 않습니다.
+        spare = engine.connect() if self._owner is None else None
+        with self._owner_lock:
+            if self._owner is None:
+                self._owner, spare = spare or engine.connect(), None
+            acquired = self._owner.execute(
+                text("SELECT pg_try_advisory_lock(:namespace, :tryout_id)"),
+                {"namespace": self.lock_namespace, "tryout_id": tryout_id},
+            ).scalar_one()
+            # advisory lock은 세션 단위로 유지되므로 트랜잭션은 바로 끝냅니다.
+            self._owner.commit()
+        if spare is not None:
+            spare.close()
+        return bool(acquired)
+
+
+capacity_ledger = CapacityLedger(
+    flush_interval=settings.CAPACITY_LEDGER_FLUSH_INTERVAL_MS / 1000,
+    lock_namespace=settings.CAPACITY_LEDGER_LOCK_NAMESPACE,
+)
@@ -0,0 +1,103 @@
+import logging
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from psycopg.errors import LockNotAvailable
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.transaction import TransactionHelper
+from app.models.tryouts import TryoutUpdateRequest
+from app.repository.reservations import ReservationRepository
+from app.repository.tryouts import TryoutRepository
+
+logger = logging.getLogger(__name__)
+
+
+class CountDrift(NamedTuple):
+    tryout_id: int
+    recorded: int
+    actual: int
+
+
+@dataclass
+class ReconciliationReport:
+    drifts: list[CountDrift] = field(default_factory=list)
+    repaired: list[int] = field(default_factory=list)
+    # 잠금을 바로 얻지 못해 다음 실행으로 미룬 tryout
+    skipped: list[int] = field(default_factory=list)
+
+
+class ReconciliationService:
+    """
+    비정규화된 `tryouts.confirmed_reserved_count`를 확정 예약의 좌석 합계와 비교하고,
+    필요하면 바로잡습니다.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.repo = TryoutRepository(session)
+        self.reservation_repo = ReservationRepository(session)
+
+    def reconcile(
+        self, repair: bool = False, chunk_size: int = 1000
+    ) -> ReconciliationReport:
+        report = ReconciliationReport()
+        try:
+            report.drifts = [
+                CountDrift(*row)
+                for row in self.repo.iter_confirmed_count_drift(chunk_size)
+            ]
+        finally:
+            # 집계에 사용한 읽기 트랜잭션은 보정 전에 끝냅니다.
+            self.session.rollback()
+
+        for drift in report.drifts:
+            logger.warning(
+                "tryout %s: 기록된 확정 인원 %s, 실제 %s",
+                drift.tryout_id,
+                drift.recorded,
+                drift.actual,
+            )
+            if not repair:
+                continue
+            if self.repair(drift.tryout_id):
+                report.repaired.append(drift.tryout_id)
+            else:
+                report.skipped.append(drift.tryout_id)
+        return report
+
+    def repair(self, tryout_id: int) -> bool:
+        """
+        tryout 하나의 확정 인원을 다시 계산해 저장합니다.
+
+        tryout 행을 먼저 잠근 뒤 합계를 계산하므로, 확정/삭제 중인 트랜잭션의 변경은
+        커밋된 뒤 보정된 값에 더해집니다. 잠금을 `RECONCILE_LOCK_TIMEOUT_MS` 안에 얻지
+        못하면 보정하지 않고 False를 반환합니다.
+        """
+
+        def operation() -> None:
+            self.session.execute(
+                select(
+                    func.set_config(
+                        "lock_timeout", f"{settings.RECONCILE_LOCK_TIMEOUT_MS}ms", True
+                    )
+                )
+            )
+            tryout = self.repo.get_by_id(tryout_id, for_update=True)
+            actual = self.reservation_repo.sum_confirmed_seats(tryout_id)
+            if tryout.confirmed_reserved_count != actual:
+                self.repo.update(
+                    tryout, TryoutUpdateRequest(confirmed_reserved_count=actual)
+                )
+
+        try:
+            TransactionHelper(self.session).run(operation)
+        except OperationalError as e:
+            if isinstance(e.orig, LockNotAvailable):
+                logger.info("tryout %s: 잠금 대기 시간 초과로 건너뜁니다.", tryout_id)
+                return False
+            raise
+        return True
@@ -0,0 +1,133 @@
+import logging
+import threading
+import time
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+from sqlmodel import Session
+
+from app.core.cache import tryout_page_cache
+from app.core.config import settings
+from app.core.db import engine
+from app.repository.tryouts import TryoutRepository
+
+logger = logging.getLogger(__name__)
+
+# 신청 기간은 마감 시각을 포함하므로, 마감 직후에 상태를 바꿉니다.
+_AFTER_END = timedelta(microseconds=1)
+
+
+class RegistrationWindow(NamedTuple):
+    start: datetime
+    end: datetime
+
+    def contains(self, now: datetime) -> bool:
+        return self.start <= now <= self.end
+
+
+class RegistrationWindowScheduler:
+    """
+    아직 시작하지 않은 시험의 신청 기간을 프로세스 메모리에 두고, 신청 시작/마감 시각마다
+    신청 가능한 tryout id 집합(`open_ids`)을 바꾸는 백그라운드 스레드.
+
+    예약 신청은 `is_closed`로 신청 기간이 아닌 시험을 대기열과 tryout 행 잠금 전에
+    거절합니다. 상태가 바뀔 때마다 시험 목록 캐시를 무효화해 `open_now` 목록도
+    경계 시각에 맞춰 갱신됩니다. 신청 기간은 `refresh_seconds`마다 DB에서 다시 읽으며,
+    그 사이에 생성된 시험은 알 수 없으므로 거절하지 않고 DB 검증에 맡깁니다.
+    """
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self.open_ids: frozenset[int] = frozenset()
+        self._windows: dict[int, RegistrationWindow] = {}
+        self._boundaries: list[datetime] = []
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+
+    def is_closed(self, tryout_id: int, now: datetime) -> bool:
+        """신청 기간이 아닌 것이 확실한 시험이면 True, 알 수 없으면 False를 반환합니다."""
+        window = self._windows.get(tryout_id)
+        if window is None or tryout_id in self.open_ids:
+            # 마감 직후 상태가 바뀌기 전이면 DB 검증이 거절합니다.
+            return False
+        # 시작 직후 상태가 바뀌기 전에는 열린 시험을 거절하지 않도록 다시 확인합니다.
+        return not window.contains(now)
+
+    def load(self, now: datetime) -> None:
+        with Session(engine) as session:
+            rows = TryoutRepository(session).get_registration_windows(now)
+        windows = {id: RegistrationWindow(start, end) for id, start, end in rows}
+        self._boundaries = sorted(
+            {w.start for w in windows.values()}
+            | {w.end + _AFTER_END for w in windows.values()}
+        )
+        self._windows = windows
+        self.flip(now)
+
+    def flip(self, now: datetime) -> None:
+        open_ids = frozenset(
+            id for id, window in self._windows.items() if window.contains(now)
+        )
+        if open_ids != self.open_ids:
+            self.open_ids = open_ids
+            tryout_page_cache.bump()
+
+    def next_boundary(self, now: datetime) -> datetime | None:
+        i = bisect_right(self._boundaries, now)
+        return self._boundaries[i] if i < len(self._boundaries) else None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="registration-window-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self._thread.join()
+        self._thread = None
+
+    def reset(self) -> None:
+        self.open_ids = frozenset()
+        self._windows = {}
+        self._boundaries = []
+
+    def _run(self) -> None:
+        reload_at = 0.0
+        while True:
+            timeout = self.refresh_seconds
+            try:
+                now = datetime.now()
+                if time.monotonic() >= reload_at:
+                    self.load(now)
+                    reload_at = time.monotonic() + self.refresh_seconds
+                else:
+                    self.flip(now)
+                boundary = self.next_boundary(now)
+                if boundary is not None:
+                    timeout = min(
+                        reload_at - time.monotonic(),
+                        (boundary - datetime.now()).total_seconds(),
+                    )
+            except Exception:
+                logger.exception("신청 기간 스케줄러 처리 중 오류가 발생했습니다.")
+
+            with self._condition:
+                if not self._stopping:
+                    self._condition.wait(timeout=max(timeout, 0))
+                if self._stopping:
+                    return
+
+
+registration_windows = RegistrationWindowScheduler(
+    refresh_seconds=settings.REGISTRATION_WINDOW_REFRESH_SECONDS
+)
@@ -0,0 +1,70 @@
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any, Literal
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.db import engine
+from app.models.reservations import ReservationStatus
+from app.repository.reservations import ReservationRepository
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+EXPORT_COLUMNS = ("id", "user_id", "tryout_id", "reserved_seats", "status")
+
+
+def _ndjson_chunks(rows: Iterable[tuple[Any, ...]], chunk_size: int) -> Iterator[str]:
+    lines: list[str] = []
+    for row in rows:
+        record = dict(zip(EXPORT_COLUMNS, row, strict=True))
+        record["user_id"] = str(record["user_id"])
+        lines.append(json.dumps(record, ensure_ascii=False))
+        if len(lines) >= chunk_size:
+            yield "\n".join(lines) + "\n"
+            lines.clear()
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def _csv_chunks(rows: Iterable[tuple[Any, ...]], chunk_size: int) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+        if count % chunk_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def stream_reservation_export(
+    format: ExportFormat,
+    tryout_id: int | None = None,
+    status: ReservationStatus | None = None,
+) -> Iterator[str]:
+    """
+    예약을 NDJSON 또는 CSV로 `RESERVATION_EXPORT_CHUNK_SIZE`행씩 반환합니다.
+
+    응답을 스트리밍하는 동안 사용할 Session을 직접 열고, 서버 측 커서가 끝까지 읽히거나
+    클라이언트 연결이 끊겨 제너레이터가 닫히면 함께 닫습니다.
+    """
+    chunk_size = settings.RESERVATION_EXPORT_CHUNK_SIZE
+    with Session(engine) as session:
+        rows = ReservationRepository(session).iter_export_rows(
+            tryout_id, status, chunk_size
+        )
+        if format == "csv":
+            yield from _csv_chunks(rows, chunk_size)
+        else:
+            yield from _ndjson_chunks(rows, chunk_size)
@@ -0,0 +1,223 @@
+import csv
+import io
+import json
+import uuid
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from itertools import islice
+from typing import IO, Literal, NamedTuple
+
+from pydantic import ValidationError
+from sqlmodel import Session
+
+from app.core.cache import invalidate_user_reservations
+from app.core.config import settings
+from app.core.db import engine
+from app.core.transaction import TransactionHelper
+from app.models.reservations import (
+    ReservationCreate,
+    ReservationImportResult,
+    ReservationImportRow,
+)
+from app.models.tryouts import Tryout
+from app.models.users import UserPrincipal
+from app.repository.reservations import ReservationRepository
+from app.repository.tryouts import TryoutRepository
+from app.repository.users import UserRepository
+
+ImportFormat = Literal["csv", "ndjson"]
+
+# 요청 Content-Type -> 파일 형식
+IMPORT_CONTENT_TYPES: dict[str, ImportFormat] = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+class ParsedRow(NamedTuple):
+    line: int
+    row: ReservationImportRow | None
+    error: str | None = None
+
+
+def _parse(line: int, record: object) -> ParsedRow:
+    if not isinstance(record, dict):
+        return ParsedRow(line, None, "행은 JSON 객체여야 합니다.")
+    try:
+        return ParsedRow(line, ReservationImportRow.model_validate(record))
+    except ValidationError as e:
+        detail = "; ".join(
+            f"{'.'.join(str(loc) for loc in error['loc']) or 'row'}: {error['msg']}"
+            for error in e.errors()
+        )
+        return ParsedRow(line, None, detail)
+
+
+def iter_import_rows(file: IO[bytes], format: ImportFormat) -> Iterator[ParsedRow]:
+    """업로드 파일을 한 행씩 읽어 검증합니다. 파일 전체를 메모리에 올리지 않습니다."""
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", errors="replace", newline="")
+    if format == "csv":
+        reader = csv.DictReader(text)
+        for record in reader:
+            # 빈 칸은 값이 없는 것으로 보고, 헤더보다 많은 칸은 무시합니다.
+            values = {k: v for k, v in record.items() if k is not None and v != ""}
+            yield _parse(reader.line_num, values)
+        return
+
+    for line, raw in enumerate(text, start=1):
+        if not raw.strip():
+            continue
+        try:
+            record = json.loads(raw)
+        except json.JSONDecodeError:
+            yield ParsedRow(line, None, "JSON 형식이 올바르지 않습니다.")
+            continue
+        yield _parse(line, record)
+
+
+def _rejection_reason(
+    user: UserPrincipal | None,
+    tryout: Tryout | None,
+    reserved_seats: int,
+    now: datetime,
+) -> str | None:
+    if user is None:
+        return "사용자를 찾을 수 없습니다."
+    if not user.is_active or user.is_superuser:
+        return "시험을 신청할 수 없는 사용자입니다."
+    if tryout is None:
+        return "시험을 찾을 수 없습니다."
+    if not (tryout.registration_start_time <= now <= tryout.registration_end_time):
+        return "신청 기간이 아닙니다."
+    if tryout.confirmed_reserved_count + reserved_seats > tryout.max_capacity:
+        return "정원이 가득 찼습니다."
+    return None
+
+
+def _overlaps(a: Tryout, b: Tryout) -> bool:
+    return a.start_time < b.end_time and a.end_time > b.start_time
+
+
+class ReservationImportService:
+    def __init__(self, session: Session):
+        self.session = session
+        self.repo = ReservationRepository(session)
+        self.tryout_repo = TryoutRepository(session)
+        self.user_repo = UserRepository(session)
+
+    def import_rows(
+        self, rows: Iterable[ParsedRow], batch_size: int
+    ) -> Iterator[ReservationImportResult]:
+        """행을 batch_size건씩 처리하고, 배치가 커밋될 때마다 행별 결과를 반환합니다."""
+        iterator = iter(rows)
+        while batch := list(islice(iterator, batch_size)):
+            yield from self.import_batch(batch)
+
+    def import_batch(self, batch: list[ParsedRow]) -> list[ReservationImportResult]:
+        """
+        배치 하나를 한 트랜잭션으로 신청합니다.
+
+        사용자, 시험, 기존 예약, 동시간대 예약은 행마다가 아니라 배치 전체에 대해 한 번씩
+        조회하고, 통과한 행은 multi-row INSERT 한 번으로 생성합니다. 대기(pending) 예약은
+        확정 인원을 바꾸지 않으므로 tryout 행은 잠그지 않습니다.
+        """
+
+        def operation() -> list[ReservationImportResult]:
+            now = datetime.now()
+            rows = [parsed.row for parsed in batch if parsed.row is not None]
+            by_email, by_id = self.user_repo.get_principals(
+                emails=[row.email for row in rows if row.email is not None],
+                ids=[row.user_id for row in rows if row.user_id is not None],
+            )
+            tryouts = self.tryout_repo.get_by_ids(
+                sorted({row.tryout_id for row in rows})
+            )
+
+            reasons: dict[int, str] = {}
+            candidates: dict[int, tuple[uuid.UUID, Tryout, int]] = {}
+            for i, parsed in enumerate(batch):
+                row = parsed.row
+                if row is None:
+                    reasons[i] = parsed.error or "잘못된 행입니다."
+                    continue
+                if row.email is not None:
+                    user = by_email.get(row.email)
+                else:
+                    user = by_id.get(row.user_id) if row.user_id else None
+                tryout = tryouts.get(row.tryout_id)
+                reason = _rejection_reason(user, tryout, row.reserved_seats, now)
+                if reason is not None or user is None or tryout is None:
+                    reasons[i] = reason or "잘못된 행입니다."
+                    continue
+                candidates[i] = (user.id, tryout, row.reserved_seats)
+
+            pairs = sorted({(user_id, t.id) for user_id, t, _ in candidates.values()})
+            active = self.repo.get_active_pairs(pairs) if pairs else set()
+            overlapping = self.repo.get_overlapping_pairs(pairs) if pairs else set()
+
+            # 같은 파일 안의 중복/동시간대 신청은 먼저 나온 행을 우선합니다.
+            accepted: dict[int, ReservationCreate] = {}
+            accepted_tryouts: dict[uuid.UUID, list[Tryout]] = {}
+            for i, (user_id, tryout, seats) in candidates.items():
+                earlier = accepted_tryouts.setdefault(user_id, [])
+                if (user_id, tryout.id) in active or any(
+                    t.id == tryout.id for t in earlier
+                ):
+                    reasons[i] = "이미 신청된 시험입니다."
+                elif (user_id, tryout.id) in overlapping or any(
+                    _overlaps(t, tryout) for t in earlier
+                ):
+                    reasons[i] = "동시간대에 이미 예약된 시험이 존재합니다."
+                else:
+                    accepted[i] = ReservationCreate(
+                        user_id=user_id, tryout_id=tryout.id, reserved_seats=seats
+                    )
+                    earlier.append(tryout)
+
+            created = (
+                self.repo.bulk_create_pending(list(accepted.values()))
+                if accepted
+                else {}
+            )
+            for user_id in {r.user_id for r in accepted.values()}:
+                invalidate_user_reservations(self.session, user_id)
+
+            results = []
+            for i, parsed in enumerate(batch):
+                reservation_id = None
+                if i in accepted:
+                    r = accepted[i]
+                    reservation_id = created.get((r.user_id, r.tryout_id))
+                    if reservation_id is None:
+                        # 조회 이후 다른 요청이 같은 시험을 먼저 신청한 경우
+                        reasons[i] = "이미 신청된 시험입니다."
+                results.append(
+                    ReservationImportResult(
+                        line=parsed.line,
+                        status="failed" if i in reasons else "created",
+                        reservation_id=reservation_id,
+                        detail=reasons.get(i),
+                    )
+                )
+            return results
+
+        return TransactionHelper(self.session).run(operation)
+
+
+def stream_reservation_import(file: IO[bytes], format: ImportFormat) -> Iterator[str]:
+    """
+    업로드 파일을 처리하며 행별 결과를 NDJSON 한 줄씩 반환합니다.
+
+    응답을 스트리밍하는 동안 요청의 세션은 이미 닫히므로 별도의 Session을 사용하고,
+    처리가 끝나면 파일을 닫습니다.
+    """
+    try:
+        with Session(engine, expire_on_commit=False) as session:
+            service = ReservationImportService(session)
+            for result in service.import_rows(
+                iter_import_rows(file, format), settings.RESERVATION_IMPORT_BATCH_SIZE
+            ):
+                yield result.model_dump_json(exclude_none=True) + "\n"
+    finally:
+        file.close()
@@ -1,8 +1,11 @@
 import uuid
 from datetime import datetime
+from typing import Any
 
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.cache import user_schedule_cache
 from app.core.exceptions import (
     AlreadyReservedError,
     AuthorizationError,
@@ -10,57 +13,147 @@ from app.core.exceptions import (
     InvalidReservationPeriodError,
     TryoutFullError,
 )
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.responses import dumps
+from app.core.schedule import UserSchedule
 from app.core.transaction import TransactionHelper
-from app.models.common import PaginatedResponse
 from app.models.reservations import (
     Reservation,
+    ReservationBatchConfirmRequest,
+    ReservationBatchConfirmResponse,
+    ReservationConfirmResult,
     ReservationStatus,
     ReservationUpdate,
     ReservationUpdateRequest,
 )
-from app.models.tryouts import Tryout, TryoutUpdateRequest
-from app.models.users import User
-from app.repository.reservations import ReservationRepository
-from app.repository.tryouts import TryoutRepository
+from app.models.tryouts import Tryout
+from app.models.users import UserPrincipal
+from app.repository.reservations import (
+    AsyncReservationRepository,
+    ReservationRepository,
+)
+from app.services.admission import get_admission_engine
+from app.services.waitlist import notify_seats_released
+
+
+def _decode_reservation_cursor(cursor: str) -> int:
+    key = decode_cursor(cursor)
+    try:
+        return int(key["id"])
+    except (KeyError, TypeError, ValueError):
+        raise BadRequestError("잘못된 커서입니다.")
+
+
+def _reservation_page(
+    rows: list[dict[str, Any]], limit: int, total: int | None
+) -> bytes:
+    """`PaginatedResponse[Reservation]` 형식의 JSON을 반환합니다."""
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor({"id": rows[-1]["id"]})
+
+    return dumps({"total": total, "items": rows, "next_cursor": next_cursor})
+
+
+def _validate_registration_period(tryout: Tryout, now: datetime) -> None:
+    if not (tryout.registration_start_time <= now <= tryout.registration_end_time):
+        raise InvalidReservationPeriodError()
+
+
+_OVERLAPPING_MESSAGE = "동시간대에 이미 예약된 시험이 존재합니다."
+
+
+def _validate_existing(existing: Reservation | None) -> None:
+    if existing and existing.status != ReservationStatus.deleted:
+        raise AlreadyReservedError()
+
+
+def _validate_schedule(schedule: UserSchedule, tryout: Tryout) -> None:
+    if schedule.has_tryout(tryout.id):
+        raise AlreadyReservedError()
+
+    if schedule.overlaps(tryout.start_time, tryout.end_time):
+        raise AlreadyReservedError(_OVERLAPPING_MESSAGE)
+
+
+def _validate_capacity(tryout: Tryout, reserved_seats: int) -> None:
+    if tryout.confirmed_reserved_count + reserved_seats > tryout.max_capacity:
+        raise TryoutFullError()
+
+
+def _confirm_rejection_reason(
+    reservation: Reservation, tryout: Tryout, now: datetime
+) -> str | None:
+    if reservation.status != ReservationStatus.pending:
+        return "이미 확정되었거나 삭제된 예약입니다."
+
+    if tryout.start_time <= now:
+        return "시험 시작 시간이 지난 예약은 확정할 수 없습니다."
+
+    return None
+
+
+def _validate_reservation_access(
+    reservation: Reservation, current_user: UserPrincipal
+) -> None:
+    if not current_user.is_superuser and reservation.user_id != current_user.id:
+        raise AuthorizationError("접근 권한이 없습니다.")
 
 
 class ReservationService:
     def __init__(self, session: Session):
         self.session = session
         self.repo = ReservationRepository(session)
-        self.tryout_repo = TryoutRepository(session)
+        self.admission = get_admission_engine(session)
 
-    def validate_reservation_or_raise(
+    def precheck_reservation_or_raise(
         self, tryout: Tryout, user_id: uuid.UUID, reserved_seats: int, now: datetime
     ) -> None:
-        if not (tryout.registration_start_time <= now <= tryout.registration_end_time):
-            raise InvalidReservationPeriodError()
-
-        reserved_ids = self.repo.get_user_reserved_tryout_ids(
-            user_id=user_id, tryout_ids=[tryout.id]
-        )
-
-        if tryout.id in reserved_ids:
-            raise AlreadyReservedError()
+        """
+        캐시된 사용자 시간표로 검증합니다. 잠금 전에 거절할 요청을 걸러내는 용도로만
+        사용하고, 통과한 요청은 트랜잭션 안에서 `validate_reservation_or_raise`로
+        다시 검증합니다.
+        """
+        _validate_registration_period(tryout, now)
+        _validate_schedule(self.get_user_schedule(user_id), tryout)
+        _validate_capacity(tryout, reserved_seats)
 
+    def validate_reservation_or_raise(
+        self,
+        tryout: Tryout,
+        user_id: uuid.UUID,
+        reserved_seats: int,
+        now: datetime,
+        existing: Reservation | None,
+    ) -> None:
+        """
+        DB를 기준으로 검증합니다. `existing`은 같은 트랜잭션에서 조회한 사용자의
+        해당 시험 예약이며, 동시간대 예약은 캐시 대신 SQL로 확인합니다.
+        """
+        _validate_registration_period(tryout, now)
+        _validate_existing(existing)
         if self.repo.has_overlapping_reservation(
-            user_id=user_id,
-            start_time=tryout.start_time,
-            end_time=tryout.end_time,
+            user_id=user_id, start_time=tryout.start_time, end_time=tryout.end_time
         ):
-            raise AlreadyReservedError("동시간대에 이미 예약된 시험이 존재합니다.")
-
-        if tryout.confirmed_reserved_count + reserved_seats > tryout.max_capacity:
-            raise TryoutFullError()
+            raise AlreadyReservedError(_OVERLAPPING_MESSAGE)
+        _validate_capacity(tryout, reserved_seats)
+
+    def get_user_schedule(self, user_id: uuid.UUID) -> UserSchedule:
+        """사용자의 시간표를 캐시에서 찾고, 없으면 DB에서 조회해 캐시합니다."""
+        schedule = user_schedule_cache.get(user_id)
+        if schedule is None:
+            generation = user_schedule_cache.generation
+            schedule = self.repo.get_user_schedule(user_id)
+            user_schedule_cache.set(user_id, schedule, generation=generation)
+        return schedule
 
     def _validate_confirm_reservation(
         self, reservation: Reservation, tryout: Tryout
     ) -> None:
-        if reservation.status != ReservationStatus.pending:
-            raise BadRequestError("이미 확정되었거나 삭제된 예약입니다.")
-
-        if tryout.start_time <= datetime.now():
-            raise BadRequestError("시험 시작 시간이 지난 예약은 확정할 수 없습니다.")
+        reason = _confirm_rejection_reason(reservation, tryout, datetime.now())
+        if reason:
+            raise BadRequestError(reason)
 
         if (
             tryout.confirmed_reserved_count + reservation.reserved_seats
@@ -69,7 +162,7 @@ class ReservationService:
             raise TryoutFullError()
 
     def _validate_delete_reservation(
-        self, reservation: Reservation, tryout: Tryout, current_user: User
+        self, reservation: Reservation, tryout: Tryout, current_user: UserPrincipal
     ) -> None:
         is_admin = current_user.is_superuser
 
@@ -91,23 +184,27 @@ class ReservationService:
             raise BadRequestError("확정 인원 수가 잘못되었습니다.")
 
     def paginate_reservations(
-        self, user: User, limit: int, offset: int
-    ) -> PaginatedResponse[Reservation]:
-        total = self.repo.count_user_reservations(user)
-        reservations = self.repo.paginate_user_reservations(user, limit, offset)
-
-        return PaginatedResponse[Reservation](
-            items=[Reservation.model_validate(r) for r in reservations],
-            total=total,
+        self, user: UserPrincipal, limit: int, offset: int, cursor: str | None = None
+    ) -> bytes:
+        total = None
+        after_id = None
+        if cursor is None:
+            total = self.repo.count_user_reservations(user)
+        else:
+            after_id = _decode_reservation_cursor(cursor)
+            offset = 0
+
+        # 다음 페이지 존재 여부를 알기 위해 한 건을 더 조회합니다.
+        rows = self.repo.paginate_user_reservations(
+            user, limit + 1, offset, after_id=after_id
         )
+        return _reservation_page(rows, limit, total)
 
     def get_reservation_by_id(
-        self, reservation_id: int, current_user: User
+        self, reservation_id: int, current_user: UserPrincipal
     ) -> Reservation:
         reservation = self.repo.get_by_id(reservation_id)
-
-        if not current_user.is_superuser and reservation.user_id != current_user.id:
-            raise AuthorizationError("접근 권한이 없습니다.")
+        _validate_reservation_access(reservation, current_user)
 
         return Reservation.model_validate(reservation)
 
@@ -117,39 +214,108 @@ class ReservationService:
     ) -> Reservation:
         def operation() -> Reservation:
             reservation = self.repo.get_by_id(reservation_id, for_update=True)
-            tryout = self.tryout_repo.get_by_id(reservation.tryout_id, for_update=True)
+            tryout = self.admission.load_tryout(reservation.tryout_id)
 
             self._validate_confirm_reservation(reservation, tryout)
 
-            updated_count = tryout.confirmed_reserved_count + reservation.reserved_seats
-            tryout_update = TryoutUpdateRequest(confirmed_reserved_count=updated_count)
-
             update_data = ReservationUpdate(status=ReservationStatus.confirmed)
 
-            self.tryout_repo.update(tryout, tryout_update)
+            self.admission.admit(tryout, reservation.reserved_seats)
             self.repo.update(reservation, update_data)
 
             return reservation
 
         return TransactionHelper(self.session).run(operation)
 
+    def confirm_reservations(
+        self, request: ReservationBatchConfirmRequest
+    ) -> ReservationBatchConfirmResponse:
+        """
+        여러 예약을 tryout 단위로 묶어 확정합니다.
+
+        tryout마다 한 번만 잠그고 남은 정원 안에서 id 순으로 확정할 예약을 고른 뒤,
+        예약 상태와 확정 인원을 집합 단위 UPDATE로 갱신합니다. 커밋은 tryout 단위입니다.
+        """
+        results: dict[int, ReservationConfirmResult] = {}
+
+        if request.tryout_id is not None:
+            results.update(
+                self._confirm_tryout_group(request.tryout_id, None, request.limit)
+            )
+            ordered_ids = sorted(results)
+        else:
+            ordered_ids = list(dict.fromkeys(request.reservation_ids or []))
+            groups = self.repo.group_ids_by_tryout(ordered_ids)
+            for tryout_id in sorted(groups):
+                results.update(
+                    self._confirm_tryout_group(tryout_id, groups[tryout_id], None)
+                )
+            for reservation_id in ordered_ids:
+                results.setdefault(
+                    reservation_id,
+                    ReservationConfirmResult(
+                        reservation_id=reservation_id,
+                        status="failed",
+                        detail="예약을 찾을 수 없습니다.",
+                    ),
+                )
+
+        items = [results[reservation_id] for reservation_id in ordered_ids]
+        confirmed = sum(1 for item in items if item.status == "confirmed")
+        return ReservationBatchConfirmResponse(
+            confirmed=confirmed, failed=len(items) - confirmed, results=items
+        )
+
+    def _confirm_tryout_group(
+        self, tryout_id: int, reservation_ids: list[int] | None, limit: int | None
+    ) -> dict[int, ReservationConfirmResult]:
+        def operation() -> dict[int, ReservationConfirmResult]:
+            # 단건 확정과 같은 순서(예약 → tryout)로 잠가 교착 상태를 피합니다.
+            if reservation_ids is None:
+                reservations = self.repo.lock_pending_by_tryout(tryout_id, limit)
+            else:
+                reservations = self.repo.lock_by_ids(reservation_ids)
+            tryout = self.admission.load_tryout(tryout_id, for_update=True)
+            now = datetime.now()
+
+            remaining = tryout.max_capacity - tryout.confirmed_reserved_count
+            accepted: list[int] = []
+            seats = 0
+            results: dict[int, ReservationConfirmResult] = {}
+            for reservation in reservations:
+                reason = _confirm_rejection_reason(reservation, tryout, now)
+                if reason is None and seats + reservation.reserved_seats > remaining:
+                    reason = "정원이 가득 찼습니다."
+                if reason:
+                    results[reservation.id] = ReservationConfirmResult(
+                        reservation_id=reservation.id, status="failed", detail=reason
+                    )
+                    continue
+                accepted.append(reservation.id)
+                seats += reservation.reserved_seats
+                results[reservation.id] = ReservationConfirmResult(
+                    reservation_id=reservation.id, status="confirmed"
+                )
+
+            if accepted:
+                self.repo.bulk_update_status(accepted, ReservationStatus.confirmed)
+                self.admission.admit(tryout, seats)
+            return results
+
+        return TransactionHelper(self.session).run(operation)
+
     def delete_reservation(
-        self, reservation_id: int, current_user: User
+        self, reservation_id: int, current_user: UserPrincipal
     ) -> Reservation:
         def operation() -> Reservation:
             reservation = self.repo.get_by_id(reservation_id, for_update=True)
-            tryout = self.tryout_repo.get_by_id(reservation.tryout_id, for_update=True)
+            tryout = self.admission.load_tryout(reservation.tryout_id)
 
             self._validate_delete_reservation(reservation, tryout, current_user)
 
             if reservation.status == ReservationStatus.confirmed:
-                updated_count = (
-                    tryout.confirmed_reserved_count - reservation.reserved_seats
-                )
-                tryout_update = TryoutUpdateRequest(
-                    confirmed_reserved_count=updated_count
-                )
-                self.tryout_repo.update(tryout, tryout_update)
+                self.admission.release(tryout, reservation.reserved_seats)
+                notify_seats_released(self.session, tryout.id)
 
             reservation_update = ReservationUpdate(status=ReservationStatus.deleted)
             self.repo.update(reservation, reservation_update)
@@ -160,13 +326,13 @@ class ReservationService:
 
     def update_reservation(
         self,
-        user: User,
+        user: UserPrincipal,
         reservation_id: int,
         update_data: ReservationUpdateRequest,
     ) -> Reservation:
         def operation() -> Reservation:
             reservation = self.repo.get_by_id(reservation_id, for_update=True)
-            tryout = self.tryout_repo.get_by_id(reservation.tryout_id, for_update=True)
+            tryout = self.admission.load_tryout(reservation.tryout_id)
             now = datetime.now()
 
             self.__validate_update_reservation(
@@ -175,11 +341,11 @@ class ReservationService:
 
             new_seats = update_data.reserved_seats
             diff = new_seats - reservation.reserved_seats
-            if reservation.status == ReservationStatus.confirmed:
-                tryout_update = TryoutUpdateRequest(
-                    confirmed_reserved_count=tryout.confirmed_reserved_count + diff
-                )
-                self.tryout_repo.update(tryout, tryout_update)
+            if reservation.status == ReservationStatus.confirmed and diff > 0:
+                self.admission.admit(tryout, diff)
+            elif reservation.status == ReservationStatus.confirmed and diff < 0:
+                self.admission.release(tryout, -diff)
+                notify_seats_released(self.session, tryout.id)
 
             return self.repo.update(
                 reservation, ReservationUpdate(reserved_seats=new_seats)
@@ -189,7 +355,7 @@ class ReservationService:
 
     def __validate_update_reservation(
         self,
-        user: User,
+        user: UserPrincipal,
         reservation: Reservation,
         update_data: ReservationUpdateRequest,
         tryout: Tryout,
@@ -217,3 +383,64 @@ class ReservationService:
         diff = new_seats - reservation.reserved_seats
         if diff > 0 and tryout.confirmed_reserved_count + diff > tryout.max_capacity:
             raise TryoutFullError("최대 예약 인원을 초과할 수 없습니다.")
+
+
+class AsyncReservationService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.repo = AsyncReservationRepository(session)
+
+    async def precheck_reservation_or_raise(
+        self, tryout: Tryout, user_id: uuid.UUID, reserved_seats: int, now: datetime
+    ) -> None:
+        _validate_registration_period(tryout, now)
+        _validate_schedule(await self.get_user_schedule(user_id), tryout)
+        _validate_capacity(tryout, reserved_seats)
+
+    async def validate_reservation_or_raise(
+        self,
+        tryout: Tryout,
+        user_id: uuid.UUID,
+        reserved_seats: int,
+        now: datetime,
+        existing: Reservation | None,
+    ) -> None:
+        _validate_registration_period(tryout, now)
+        _validate_existing(existing)
+        if await self.repo.has_overlapping_reservation(
+            user_id=user_id, start_time=tryout.start_time, end_time=tryout.end_time
+        ):
+            raise AlreadyReservedError(_OVERLAPPING_MESSAGE)
+        _validate_capacity(tryout, reserved_seats)
+
+    async def get_user_schedule(self, user_id: uuid.UUID) -> UserSchedule:
+        schedule = user_schedule_cache.get(user_id)
+        if schedule is None:
+            generation = user_schedule_cache.generation
+            schedule = await self.repo.get_user_schedule(user_id)
+            user_schedule_cache.set(user_id, schedule, generation=generation)
+        return schedule
+
+    async def paginate_reservations(
+        self, user: UserPrincipal, limit: int, offset: int, cursor: str | None = None
+    ) -> bytes:
+        total = None
+        after_id = None
+        if cursor is None:
+            total = await self.repo.count_user_reservations(user)
+        else:
+            after_id = _decode_reservation_cursor(cursor)
+            offset = 0
+
+        rows = await self.repo.paginate_user_reservations(
+            user, limit + 1, offset, after_id=after_id
+        )
+        return _reservation_page(rows, limit, total)
+
+    async def get_reservation_by_id(
+        self, reservation_id: int, current_user: UserPrincipal
+    ) -> Reservation:
+        reservation = await self.repo.get_by_id(reservation_id)
+        _validate_reservation_access(reservation, current_user)
+
+        return Reservation.model_validate(reservation)
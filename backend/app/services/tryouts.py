@@ -1,21 +1,115 @@
 import uuid
 from datetime import datetime
+from typing import Any, NamedTuple
 
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.exceptions import AuthorizationError, NotFoundError
-from app.core.transaction import TransactionHelper
-from app.models.common import PaginatedResponse
+from app.core.admission_queue import reserve_queue
+from app.core.cache import tryout_page_cache, tryout_snapshot_cache
+from app.core.exceptions import (
+    AlreadyReservedError,
+    AuthorizationError,
+    BadRequestError,
+    InvalidReservationPeriodError,
+    NotFoundError,
+    TryoutFullError,
+)
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.responses import dumps, encode_page
+from app.core.transaction import AsyncTransactionHelper, TransactionHelper
 from app.models.reservations import (
     Reservation,
     ReservationCreate,
     ReservationStatus,
     ReservationUpdate,
 )
-from app.models.tryouts import TryoutPublic
-from app.models.users import User
-from app.repository.tryouts import TryoutRepository
-from app.services.reservations import ReservationService
+from app.models.tryouts import Tryout, TryoutPublic
+from app.models.users import UserPrincipal
+from app.models.waitlist import (
+    WaitlistEntry,
+    WaitlistEntryCreate,
+    WaitlistEntryPublic,
+)
+from app.repository.tryouts import AsyncTryoutRepository, TryoutRepository
+from app.repository.waitlist import WaitlistRepository
+from app.services.admission import requires_tryout_row_lock
+from app.services.registration_window import registration_windows
+from app.services.reservations import AsyncReservationService, ReservationService
+
+
+def _decode_tryout_cursor(cursor: str) -> tuple[datetime, int]:
+    key = decode_cursor(cursor)
+    try:
+        return datetime.fromisoformat(key["start_time"]), int(key["id"])
+    except (KeyError, TypeError, ValueError):
+        raise BadRequestError("잘못된 커서입니다.")
+
+
+def _next_tryout_cursor(rows: list[dict[str, Any]], limit: int) -> str | None:
+    if len(rows) <= limit:
+        return None
+    last = rows[limit - 1]
+    return encode_cursor(
+        {"start_time": last["start_time"].isoformat(), "id": last["id"]}
+    )
+
+
+# 캐시된 행 JSON의 닫는 괄호 대신 붙이는 사용자별 필드
+_APPLIED = b',"isApplied":true}'
+_NOT_APPLIED = b',"isApplied":false}'
+
+
+class _CatalogPage(NamedTuple):
+    """
+    사용자와 무관한 시험 목록 한 페이지. 프로세스 내에서 공유 캐시됩니다.
+
+    행은 `TryoutPublic`의 JSON에서 `isApplied`와 닫는 괄호를 뺀 bytes로 미리 인코딩해
+    두고, 요청마다 `isApplied`만 붙여 응답합니다.
+    """
+
+    ids: list[int]
+    rows: list[bytes]
+    total: int | None
+    next_cursor: str | None
+
+
+def _catalog_page(
+    rows: list[dict[str, Any]], limit: int, total: int | None
+) -> _CatalogPage:
+    # rows는 다음 페이지 확인을 위해 limit + 1건까지 조회된 결과입니다.
+    return _CatalogPage(
+        ids=[row["id"] for row in rows[:limit]],
+        rows=[dumps(row)[:-1] for row in rows[:limit]],
+        total=total,
+        next_cursor=_next_tryout_cursor(rows, limit),
+    )
+
+
+def _catalog_key(
+    limit: int, offset: int, cursor: str | None, open_now: bool
+) -> tuple[int, int, str | None, bool]:
+    # 커서 방식에서는 offset을 사용하지 않습니다.
+    return limit, 0 if cursor is not None else offset, cursor, open_now
+
+
+def _tryout_page(page: _CatalogPage, reserved_ids: frozenset[int]) -> bytes:
+    """`PaginatedResponse[TryoutPublic]` 형식의 JSON을 반환합니다."""
+    items = (
+        row + (_APPLIED if id in reserved_ids else _NOT_APPLIED)
+        for id, row in zip(page.ids, page.rows, strict=True)
+    )
+    return encode_page(items, page.total, page.next_cursor)
+
+
+def _ensure_can_reserve(user: UserPrincipal, tryout_id: int) -> None:
+    if user.is_superuser:
+        raise AuthorizationError("Admin은 시험 신청이 불가합니다.")
+
+    # 신청 기간이 아닌 시험은 대기열과 tryout 행 잠금 전에 거절합니다.
+    if registration_windows.is_closed(tryout_id, datetime.now()):
+        raise InvalidReservationPeriodError()
 
 
 class TryoutService:
@@ -28,59 +122,296 @@ class TryoutService:
         if not tryout:
             raise NotFoundError("Tryout not found")
 
-        reserved_ids = self.reservation_service.repo.get_user_reserved_tryout_ids(
-            user_id=user_id, tryout_ids=[tryout_id]
-        )
+        reserved_ids = self._reserved_tryout_ids(user_id)
 
         return TryoutPublic(
             **tryout.model_dump(), isApplied=(tryout_id in reserved_ids)
         )
 
     def paginate_upcoming_tryouts(
-        self, user_id: uuid.UUID, limit: int, offset: int
-    ) -> PaginatedResponse[TryoutPublic]:
-        now = datetime.now()
-        tryouts = self.repo.paginate_upcoming(now=now, limit=limit, offset=offset)
-        total = self.repo.count_upcoming(now=now)
+        self,
+        user_id: uuid.UUID,
+        limit: int,
+        offset: int,
+        cursor: str | None = None,
+        open_now: bool = False,
+    ) -> bytes:
+        key = _catalog_key(limit, offset, cursor, open_now)
+        page = tryout_page_cache.get(key)
+        if page is None:
+            version = tryout_page_cache.version
+            page = self._load_catalog_page(limit, offset, cursor, open_now)
+            tryout_page_cache.set(version, key, page)
 
-        tryout_ids = [t.id for t in tryouts]
-        reserved_ids = self.reservation_service.repo.get_user_reserved_tryout_ids(
-            user_id=user_id, tryout_ids=tryout_ids
-        )
+        return _tryout_page(page, self._reserved_tryout_ids(user_id))
 
-        items = [
-            TryoutPublic(**t.model_dump(), isApplied=(t.id in reserved_ids))
-            for t in tryouts
-        ]
+    def _load_catalog_page(
+        self, limit: int, offset: int, cursor: str | None, open_now: bool
+    ) -> _CatalogPage:
+        now = datetime.now()
+        total = None
+        after = None
+        if cursor is None:
+            total = self.repo.count_upcoming(now=now, open_now=open_now)
+        else:
+            after = _decode_tryout_cursor(cursor)
+            offset = 0
 
-        return PaginatedResponse[TryoutPublic](
-            total=total,
-            items=items,
+        # 다음 페이지 존재 여부를 알기 위해 한 건을 더 조회합니다.
+        rows = self.repo.paginate_upcoming(
+            now=now,
+            limit=limit + 1,
+            offset=offset,
+            after=after,
+            open_now=open_now,
         )
+        return _catalog_page(rows, limit, total)
+
+    def _reserved_tryout_ids(self, user_id: uuid.UUID) -> frozenset[int]:
+        return self.reservation_service.get_user_schedule(user_id).tryout_ids
 
     def reserve_tryout(
-        self, user: User, tryout_id: int, reserved_seats: int = 1
+        self, user: UserPrincipal, tryout_id: int, reserved_seats: int = 1
+    ) -> Reservation:
+        """
+        예약을 신청합니다. tryout별 동시 처리 한도를 넘으면 QueuedError로
+        대기 번호를 발급하며, `redeem_reserve_ticket`으로 이어서 처리합니다.
+        """
+        _ensure_can_reserve(user, tryout_id)
+        self._precheck(user, tryout_id, reserved_seats)
+
+        with reserve_queue.enter(tryout_id, str(user.id), reserved_seats):
+            return self._reserve(user, tryout_id, reserved_seats)
+
+    def redeem_reserve_ticket(
+        self, user: UserPrincipal, tryout_id: int, ticket_id: str
     ) -> Reservation:
-        if user.is_superuser:
-            raise AuthorizationError("Admin은 시험 신청이 불가합니다.")
+        _ensure_can_reserve(user, tryout_id)
+
+        with reserve_queue.redeem(tryout_id, ticket_id, str(user.id)) as seats:
+            self._precheck(user, tryout_id, seats)
+            return self._reserve(user, tryout_id, seats)
+
+    def _precheck(
+        self, user: UserPrincipal, tryout_id: int, reserved_seats: int
+    ) -> None:
+        """
+        캐시된 시험 스냅샷과 사용자 시간표로 신청 기간, 중복/동시간대 예약, 정원을
+        잠금 없이 미리 검증합니다. 통과한 요청만 `_reserve`에서 tryout 행을 잠그고
+        캐시 없이 DB 기준으로 다시 검증하므로, 캐시가 오래되어 통과한 요청은 그때
+        거절됩니다.
+        """
+        self.reservation_service.precheck_reservation_or_raise(
+            self._get_snapshot(tryout_id), user.id, reserved_seats, datetime.now()
+        )
+
+    def _get_snapshot(self, tryout_id: int) -> Tryout:
+        tryout = tryout_snapshot_cache.get(tryout_id)
+        if tryout is None:
+            generation = tryout_snapshot_cache.generation
+            tryout = self.repo.get_snapshot(tryout_id)
+            tryout_snapshot_cache.set(tryout_id, tryout, generation=generation)
+        return tryout
 
+    def _reserve(
+        self, user: UserPrincipal, tryout_id: int, reserved_seats: int
+    ) -> Reservation:
         def operation() -> Reservation:
-            tryout = self.repo.get_by_id(tryout_id, for_update=True)
+            tryout = self.reservation_service.admission.load_tryout(tryout_id)
+            existing = self.reservation_service.repo.get_by_user_and_tryout(
+                user_id=user.id, tryout_id=tryout_id, for_update=True
+            )
 
             self.reservation_service.validate_reservation_or_raise(
-                tryout, user.id, reserved_seats, datetime.now()
+                tryout, user.id, reserved_seats, datetime.now(), existing
+            )
+
+            if existing:
+                update_data = ReservationUpdate(
+                    status=ReservationStatus.pending,
+                    reserved_seats=reserved_seats,
+                )
+                return self.reservation_service.repo.update(existing, update_data)
+
+            reservation_in = ReservationCreate(
+                user_id=user.id,
+                tryout_id=tryout_id,
+                reserved_seats=reserved_seats,
             )
 
+            return self.reservation_service.repo.create(reservation_in)
+
+        try:
+            return TransactionHelper(self.repo.session).run(operation)
+        except IntegrityError:
+            # 같은 사용자의 동시 신청은 uq_user_tryout 제약에서 걸러집니다.
+            raise AlreadyReservedError()
+
+    def join_waitlist(
+        self, user: UserPrincipal, tryout_id: int, reserved_seats: int = 1
+    ) -> WaitlistEntryPublic:
+        """
+        정원이 가득 찬 시험의 대기열에 등록합니다.
+
+        예약 신청과 같은 검증(신청 기간, 중복/동시간대 예약)을 거치며, 남은 좌석으로
+        바로 신청할 수 있으면 등록하지 않습니다. 승격은 app.services.waitlist의
+        워커가 좌석이 반환될 때 처리합니다.
+        """
+        _ensure_can_reserve(user, tryout_id)
+        waitlist_repo = WaitlistRepository(self.repo.session)
+
+        def operation() -> WaitlistEntry:
+            tryout = self.repo.get_by_id(tryout_id)
+            if reserved_seats > tryout.max_capacity:
+                raise TryoutFullError("시험 정원보다 많은 인원은 대기할 수 없습니다.")
+
             existing = self.reservation_service.repo.get_by_user_and_tryout(
+                user_id=user.id, tryout_id=tryout_id
+            )
+            try:
+                self.reservation_service.validate_reservation_or_raise(
+                    tryout, user.id, reserved_seats, datetime.now(), existing
+                )
+            except TryoutFullError:
+                pass
+            else:
+                raise BadRequestError("남은 좌석이 있어 바로 예약할 수 있습니다.")
+
+            if waitlist_repo.get_waiting(user.id, tryout_id):
+                raise AlreadyReservedError("이미 대기열에 등록된 시험입니다.")
+
+            return waitlist_repo.create(
+                WaitlistEntryCreate(
+                    user_id=user.id, tryout_id=tryout_id, reserved_seats=reserved_seats
+                )
+            )
+
+        try:
+            entry = TransactionHelper(self.repo.session).run(operation)
+        except IntegrityError:
+            # 같은 사용자의 동시 등록은 부분 유니크 인덱스에서 걸러집니다.
+            raise AlreadyReservedError("이미 대기열에 등록된 시험입니다.")
+
+        return WaitlistEntryPublic(
+            **entry.model_dump(), position=waitlist_repo.position(entry)
+        )
+
+
+class AsyncTryoutService:
+    def __init__(self, session: AsyncSession):
+        self.reservation_service = AsyncReservationService(session)
+        self.repo = AsyncTryoutRepository(session)
+
+    async def get_tryout_by_id(
+        self, tryout_id: int, user_id: uuid.UUID
+    ) -> TryoutPublic:
+        tryout = await self.repo.get_by_id(tryout_id)
+
+        reserved_ids = await self._reserved_tryout_ids(user_id)
+
+        return TryoutPublic(
+            **tryout.model_dump(), isApplied=(tryout_id in reserved_ids)
+        )
+
+    async def paginate_upcoming_tryouts(
+        self,
+        user_id: uuid.UUID,
+        limit: int,
+        offset: int,
+        cursor: str | None = None,
+        open_now: bool = False,
+    ) -> bytes:
+        key = _catalog_key(limit, offset, cursor, open_now)
+        page = tryout_page_cache.get(key)
+        if page is None:
+            version = tryout_page_cache.version
+            page = await self._load_catalog_page(limit, offset, cursor, open_now)
+            tryout_page_cache.set(version, key, page)
+
+        return _tryout_page(page, await self._reserved_tryout_ids(user_id))
+
+    async def _load_catalog_page(
+        self, limit: int, offset: int, cursor: str | None, open_now: bool
+    ) -> _CatalogPage:
+        now = datetime.now()
+        total = None
+        after = None
+        if cursor is None:
+            total = await self.repo.count_upcoming(now=now, open_now=open_now)
+        else:
+            after = _decode_tryout_cursor(cursor)
+            offset = 0
+
+        rows = await self.repo.paginate_upcoming(
+            now=now,
+            limit=limit + 1,
+            offset=offset,
+            after=after,
+            open_now=open_now,
+        )
+        return _catalog_page(rows, limit, total)
+
+    async def _reserved_tryout_ids(self, user_id: uuid.UUID) -> frozenset[int]:
+        schedule = await self.reservation_service.get_user_schedule(user_id)
+        return schedule.tryout_ids
+
+    async def reserve_tryout(
+        self, user: UserPrincipal, tryout_id: int, reserved_seats: int = 1
+    ) -> Reservation:
+        _ensure_can_reserve(user, tryout_id)
+        await self._precheck(user, tryout_id, reserved_seats)
+
+        with reserve_queue.enter(tryout_id, str(user.id), reserved_seats):
+            return await self._reserve(user, tryout_id, reserved_seats)
+
+    async def redeem_reserve_ticket(
+        self, user: UserPrincipal, tryout_id: int, ticket_id: str
+    ) -> Reservation:
+        _ensure_can_reserve(user, tryout_id)
+
+        with reserve_queue.redeem(tryout_id, ticket_id, str(user.id)) as seats:
+            await self._precheck(user, tryout_id, seats)
+            return await self._reserve(user, tryout_id, seats)
+
+    async def _precheck(
+        self, user: UserPrincipal, tryout_id: int, reserved_seats: int
+    ) -> None:
+        await self.reservation_service.precheck_reservation_or_raise(
+            await self._get_snapshot(tryout_id), user.id, reserved_seats, datetime.now()
+        )
+
+    async def _get_snapshot(self, tryout_id: int) -> Tryout:
+        tryout = tryout_snapshot_cache.get(tryout_id)
+        if tryout is None:
+            generation = tryout_snapshot_cache.generation
+            tryout = await self.repo.get_snapshot(tryout_id)
+            tryout_snapshot_cache.set(tryout_id, tryout, generation=generation)
+        return tryout
+
+    async def _reserve(
+        self, user: UserPrincipal, tryout_id: int, reserved_seats: int
+    ) -> Reservation:
+        reservation_repo = self.reservation_service.repo
+
+        async def operation() -> Reservation:
+            tryout = await self.repo.get_by_id(
+                tryout_id, for_update=requires_tryout_row_lock()
+            )
+
+            existing = await reservation_repo.get_by_user_and_tryout(
                 user_id=user.id, tryout_id=tryout_id, for_update=True
             )
 
-            if existing and existing.status == ReservationStatus.deleted:
+            await self.reservation_service.validate_reservation_or_raise(
+                tryout, user.id, reserved_seats, datetime.now(), existing
+            )
+
+            if existing:
                 update_data = ReservationUpdate(
                     status=ReservationStatus.pending,
                     reserved_seats=reserved_seats,
                 )
-                return self.reservation_service.repo.update(existing, update_data)
+                return await reservation_repo.update(existing, update_data)
 
             reservation_in = ReservationCreate(
                 user_id=user.id,
@@ -88,6 +419,9 @@ class TryoutService:
                 reserved_seats=reserved_seats,
             )
 
-            return self.reservation_service.repo.create(reservation_in)
+            return await reservation_repo.create(reservation_in)
 
-        return TransactionHelper(self.repo.session).run(operation)
+        try:
+            return await AsyncTransactionHelper(self.repo.session).run(operation)
+        except IntegrityError:
+            raise AlreadyReservedError()
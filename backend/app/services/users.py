@@ -1,6 +1,6 @@
 from sqlmodel import Session
 
-from app.core.security import verify_password
+from app.core.security import verify_and_update
 from app.models.users import User
 from app.repository.users import UserRepository
 
@@ -13,6 +13,10 @@ class UserService:
         db_user = self.repo.get_user_by_email(email=email)
         if not db_user:
             return None
-        if not verify_password(password, db_user.hashed_password):
+        verified, new_hash = verify_and_update(password, db_user.hashed_password)
+        if not verified:
             return None
+        if new_hash:
+            # 해시 비용 설정이 바뀐 경우 로그인 시점에 새 해시로 교체합니다.
+            db_user = self.repo.update_password_hash(db_user, new_hash)
         return db_user
@@ -0,0 +1,199 @@
+import logging
+import threading
+from datetime import datetime
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.db import engine
+from app.core.transaction import TransactionHelper, run_after_commit
+from app.models.reservations import (
+    Reservation,
+    ReservationCreate,
+    ReservationStatus,
+    ReservationUpdate,
+)
+from app.models.tryouts import Tryout
+from app.models.waitlist import WaitlistEntry, WaitlistStatus
+from app.repository.reservations import ReservationRepository
+from app.repository.waitlist import WaitlistRepository
+from app.services.admission import get_admission_engine
+
+logger = logging.getLogger(__name__)
+
+
+class WaitlistService:
+    def __init__(self, session: Session):
+        self.session = session
+        self.repo = WaitlistRepository(session)
+        self.reservation_repo = ReservationRepository(session)
+        self.admission = get_admission_engine(session)
+
+    def promote(self, tryout_id: int, limit: int) -> int:
+        """
+        남은 좌석만큼 대기자를 FIFO 순서로 대기(pending) 예약으로 승격하고, 처리한
+        항목 수를 반환합니다.
+
+        승격된 예약도 다른 예약처럼 어드민 확정을 거쳐야 좌석을 차지하므로, 여기서는
+        확정 인원을 바꾸지 않습니다. 대기 항목과 tryout을 배치마다 한 번만 잠그고,
+        앞선 대기자의 인원이 남은 좌석보다 많으면 뒤의 대기자도 승격하지 않습니다.
+        """
+
+        def operation() -> int:
+            # 주기적인 확인에서 빈 좌석이 없는 tryout은 잠그지 않고 넘어갑니다.
+            tryout = self.admission.load_tryout(tryout_id, for_update=False)
+            now = datetime.now()
+            if (
+                tryout.start_time > now
+                and tryout.confirmed_reserved_count >= tryout.max_capacity
+            ):
+                return 0
+
+            entries = self.repo.lock_waiting(tryout_id, limit)
+            if not entries:
+                return 0
+
+            tryout = self.admission.load_tryout(tryout_id, for_update=True)
+
+            remaining = tryout.max_capacity - tryout.confirmed_reserved_count
+            seats = 0
+            handled = 0
+            for entry in entries:
+                reservation = None
+                if tryout.start_time > now:
+                    if seats + entry.reserved_seats > remaining:
+                        break
+                    reservation = self._promote_entry(entry, tryout)
+
+                if reservation is None:
+                    self.repo.update_status(entry, WaitlistStatus.cancelled)
+                else:
+                    self.repo.update_status(
+                        entry, WaitlistStatus.promoted, reservation_id=reservation.id
+                    )
+                    seats += entry.reserved_seats
+                handled += 1
+            return handled
+
+        return TransactionHelper(self.session).run(operation)
+
+    def _promote_entry(
+        self, entry: WaitlistEntry, tryout: Tryout
+    ) -> Reservation | None:
+        # 대기 중에 다른 예약이 생겨 더 이상 신청할 수 없는 경우 None을 반환합니다.
+        existing = self.reservation_repo.get_by_user_and_tryout(
+            user_id=entry.user_id, tryout_id=tryout.id, for_update=True
+        )
+        if existing and existing.status != ReservationStatus.deleted:
+            return None
+
+        if self.reservation_repo.has_overlapping_reservation(
+            user_id=entry.user_id,
+            start_time=tryout.start_time,
+            end_time=tryout.end_time,
+        ):
+            return None
+
+        if existing:
+            return self.reservation_repo.update(
+                existing,
+                ReservationUpdate(
+                    status=ReservationStatus.pending,
+                    reserved_seats=entry.reserved_seats,
+                ),
+            )
+
+        return self.reservation_repo.create(
+            ReservationCreate(
+                user_id=entry.user_id,
+                tryout_id=tryout.id,
+                reserved_seats=entry.reserved_seats,
+                status=ReservationStatus.pending,
+            )
+        )
+
+
+class WaitlistWorker:
+    """
+    좌석이 반환된 tryout의 대기자를 백그라운드 스레드에서 승격합니다.
+
+    `notify`로 받은 tryout id를 모아 처리하고, 알림이 없으면 `poll_seconds`마다
+    대기자가 있는 모든 tryout을 확인합니다. 요청 처리 중에 tryout 행 잠금을
+    반복해서 잡지 않도록 승격은 배치 단위로만 수행합니다.
+    """
+
+    def __init__(self, batch_size: int, poll_seconds: float):
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self._pending: set[int] = set()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+
+    def notify(self, tryout_id: int) -> None:
+        with self._condition:
+            self._pending.add(tryout_id)
+            self._condition.notify()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="waitlist-worker", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self._thread.join()
+        self._thread = None
+
+    def process(self, tryout_id: int) -> int:
+        """tryout 하나의 대기열을 더 이상 승격할 수 없을 때까지 처리합니다."""
+        total = 0
+        # 배치마다 커밋하면 세션의 객체가 만료(expire_on_commit)되므로, 다음 배치는
+        # tryout을 다시 조회하고 이전 값을 재사용하지 않습니다.
+        with Session(engine) as session:
+            service = WaitlistService(session)
+            while True:
+                handled = service.promote(tryout_id, self.batch_size)
+                total += handled
+                if handled < self.batch_size:
+                    return total
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._pending and not self._stopping:
+                    self._condition.wait(timeout=self.poll_seconds)
+                if self._stopping:
+                    return
+                tryout_ids = self._pending
+                self._pending = set()
+
+            try:
+                if not tryout_ids:
+                    with Session(engine) as session:
+                        tryout_ids = set(
+                            WaitlistRepository(session).get_tryout_ids_with_waiting()
+                        )
+                for tryout_id in sorted(tryout_ids):
+                    self.process(tryout_id)
+            except Exception:
+                logger.exception("대기열 승격 처리 중 오류가 발생했습니다.")
+
+
+waitlist_worker = WaitlistWorker(
+    batch_size=settings.WAITLIST_BATCH_SIZE,
+    poll_seconds=settings.WAITLIST_POLL_SECONDS,
+)
+
+
+def notify_seats_released(session: Session, tryout_id: int) -> None:
+    """커밋 이후 해당 tryout의 대기열 승격을 워커에 요청합니다."""
+    run_after_commit(session, lambda: waitlist_worker.notify(tryout_id))
@@ -7,12 +7,16 @@ from fastapi.testclient import TestClient
 from pydantic import EmailStr
 from sqlmodel import Session, delete
 
+from app.core.cache import reset_caches
 from app.core.config import settings
 from app.core.db import engine, init_db
 from app.main import app
+from app.models.idempotency import IdempotencyRecord
 from app.models.reservations import Reservation
 from app.models.users import User, UserCreate
+from app.models.waitlist import WaitlistEntry
 from app.repository.users import UserRepository
+from app.services.capacity_ledger import capacity_ledger
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -21,11 +25,18 @@ def db() -> Generator[Session, None, None]:
         init_db(session)
         yield session
 
+        statement = delete(IdempotencyRecord)
+        session.execute(statement)
+        statement = delete(WaitlistEntry)
+        session.execute(statement)
         statement = delete(Reservation)
         session.execute(statement)
         statement = delete(User)
         session.execute(statement)
         session.commit()
+        # 벌크 DELETE는 ORM 이벤트를 거치지 않으므로 캐시를 직접 비웁니다.
+        reset_caches()
+        capacity_ledger.reset()
 
 
 @pytest.fixture(scope="module")
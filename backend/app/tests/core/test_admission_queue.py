@@ -0,0 +1,173 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.admission_queue import VirtualQueue, reserve_queue
+from app.core.config import settings
+from app.core.exceptions import NotFoundError, QueuedError, ServiceUnavailableError
+
+
+# ✅ 한도를 넘은 요청은 대기 번호를 받고, 슬롯이 반환되면 순서대로 처리됨
+def test_virtual_queue_issues_tickets_in_order() -> None:
+    queue = VirtualQueue(concurrency=1, max_waiting=10, ticket_ttl=30)
+
+    with queue.enter(1, "a"):
+        with pytest.raises(QueuedError) as first, queue.enter(1, "b", payload=2):
+            pass
+        with pytest.raises(QueuedError) as second, queue.enter(1, "c", payload=3):
+            pass
+        # 처리 중인 요청이 끝나기 전에는 차례가 오지 않습니다.
+        with pytest.raises(QueuedError), queue.redeem(1, first.value.ticket_id, "b"):
+            pass
+
+    assert (first.value.position, second.value.position) == (1, 2)
+
+    # 앞선 대기 번호보다 먼저 처리되지 않습니다.
+    with pytest.raises(QueuedError) as waiting:
+        with queue.redeem(1, second.value.ticket_id, "c"):
+            pass
+    assert waiting.value.position == 2
+
+    with queue.redeem(1, first.value.ticket_id, "b") as payload:
+        assert payload == 2
+    with queue.redeem(1, second.value.ticket_id, "c") as payload:
+        assert payload == 3
+    assert queue.waiting(1) == 0
+
+
+# ✅ 대기 중인 요청이 있으면 새 요청도 대기 번호를 받고, 같은 사용자는 같은 번호를 받음
+def test_virtual_queue_new_requests_do_not_skip_waiting_tickets() -> None:
+    queue = VirtualQueue(concurrency=1, max_waiting=10, ticket_ttl=30)
+
+    with queue.enter(1, "a"):
+        with pytest.raises(QueuedError) as first, queue.enter(1, "b"):
+            pass
+
+    with pytest.raises(QueuedError) as late, queue.enter(1, "c"):
+        pass
+    with pytest.raises(QueuedError) as again, queue.enter(1, "b"):
+        pass
+
+    assert late.value.position == 2
+    assert again.value.ticket_id == first.value.ticket_id
+    # 다른 tryout은 영향을 받지 않습니다.
+    with queue.enter(2, "c"):
+        pass
+
+
+# ✅ 만료된 대기 번호는 버려지고, 다른 사용자의 대기 번호는 사용할 수 없음
+def test_virtual_queue_expired_and_foreign_tickets(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    queue = VirtualQueue(concurrency=1, max_waiting=1, ticket_ttl=30)
+    now = 1000.0
+    monkeypatch.setattr("time.monotonic", lambda: now)
+
+    with queue.enter(1, "a"):
+        with pytest.raises(QueuedError) as ticket, queue.enter(1, "b"):
+            pass
+        with pytest.raises(ServiceUnavailableError), queue.enter(1, "c"):
+            pass
+
+    with pytest.raises(NotFoundError), queue.redeem(1, ticket.value.ticket_id, "c"):
+        pass
+
+    now += 31
+    with pytest.raises(NotFoundError), queue.redeem(1, ticket.value.ticket_id, "b"):
+        pass
+    with queue.enter(1, "c"):
+        pass
+
+
+# ✅ 맨 앞이 아니어도 만료된 대기 번호는 정리됨
+def test_virtual_queue_drops_expired_tickets_anywhere(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    queue = VirtualQueue(concurrency=1, max_waiting=2, ticket_ttl=30)
+    now = 1000.0
+    monkeypatch.setattr("time.monotonic", lambda: now)
+
+    # Given: b가 먼저 대기 번호를 받고 계속 다시 요청하는 동안 c는 떠남
+    with queue.enter(1, "a"):
+        with pytest.raises(QueuedError) as first, queue.enter(1, "b"):
+            pass
+        with pytest.raises(QueuedError), queue.enter(1, "c"):
+            pass
+        now += 20
+        with pytest.raises(QueuedError), queue.redeem(1, first.value.ticket_id, "b"):
+            pass
+        now += 11
+
+        # When: 뒤쪽의 c 대기 번호만 만료
+        with pytest.raises(QueuedError), queue.enter(1, "d"):
+            pass
+
+    # Then: 대기 인원 한도(503)에 걸리지 않고 c 대신 d가 대기
+    assert queue.waiting(1) == 2
+
+
+# ✅ 다시 요청하지 않는 대기 번호는 빈 슬롯을 차지하지 않음
+def test_virtual_queue_stale_ticket_does_not_block_new_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    queue = VirtualQueue(concurrency=1, max_waiting=10, ticket_ttl=30)
+    now = 1000.0
+    monkeypatch.setattr("time.monotonic", lambda: now)
+
+    # Given: 대기 번호를 받은 b가 다시 요청하지 않음
+    with queue.enter(1, "a"):
+        with pytest.raises(QueuedError) as abandoned, queue.enter(1, "b"):
+            pass
+
+    # 최근에 받은 대기 번호가 있는 동안에는 새 요청이 앞지르지 못합니다.
+    with pytest.raises(QueuedError) as waiting, queue.enter(1, "c"):
+        pass
+
+    # When: 처리 중인 요청이 없고 b, c 모두 stale_after 동안 다시 요청하지 않음
+    now += 5
+
+    # Then: 만료 전이어도 새 요청과 뒤쪽 대기 번호가 바로 처리됨
+    with queue.enter(1, "d"):
+        pass
+    with queue.redeem(1, waiting.value.ticket_id, "c"):
+        pass
+    # 떠났던 b도 만료 전에 돌아오면 처리됩니다.
+    with queue.redeem(1, abandoned.value.ticket_id, "b"):
+        pass
+    assert queue.waiting(1) == 0
+
+
+# ✅ 예약 신청이 한도를 넘으면 202와 대기 번호를 받고, 대기 번호로 예약을 완료
+def test_reserve_returns_ticket_when_queue_is_full(
+    client: TestClient,
+    normal_user_token_headers0: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(reserve_queue, "concurrency", 1)
+
+    # Given: 같은 시험의 예약 신청이 처리 중
+    with reserve_queue.enter(1, "other-user"):
+        # When
+        response = client.post(
+            f"{settings.API_V1_STR}/tryouts/1/reserve?reserved_seats=2",
+            headers=normal_user_token_headers0,
+        )
+
+    # Then
+    assert response.status_code == 202
+    assert response.headers["Retry-After"] == "1"
+    ticket = response.json()
+    assert ticket["position"] == 1
+
+    redeemed = client.post(
+        f"{settings.API_V1_STR}/tryouts/1/reserve/tickets/{ticket['ticket_id']}",
+        headers=normal_user_token_headers0,
+    )
+    assert redeemed.status_code == 200
+    assert redeemed.json()["reserved_seats"] == 2
+
+    # 사용한 대기 번호는 다시 사용할 수 없습니다.
+    reused = client.post(
+        f"{settings.API_V1_STR}/tryouts/1/reserve/tickets/{ticket['ticket_id']}",
+        headers=normal_user_token_headers0,
+    )
+    assert reused.status_code == 404
@@ -0,0 +1,145 @@
+import time
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.core.cache import TTLCache, invalidate_user, principal_cache
+from app.core.config import settings
+from app.core.db import engine
+from app.repository.users import UserRepository
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    # Given: 최대 2개까지 보관하는 캐시
+    ttl_cache: TTLCache[str, int] = TTLCache(ttl=60, max_size=2)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.get("a")
+
+    # When: 세 번째 항목 추가
+    ttl_cache.set("c", 3)
+
+    # Then: 가장 오래 사용하지 않은 항목이 제거됨
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("c") == 3
+
+
+def test_ttl_cache_expires_items(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    ttl_cache: TTLCache[str, int] = TTLCache(ttl=10, max_size=10)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2, ttl=1)
+
+    now += 5
+
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("b") is None
+
+
+def test_ttl_cache_skips_value_loaded_before_invalidation() -> None:
+    ttl_cache: TTLCache[str, int] = TTLCache(ttl=60, max_size=2)
+
+    # Given: "a", "b"를 조회하기 시작할 때의 generation
+    generation = ttl_cache.generation
+
+    # When: 조회 도중 "a"가 무효화됨
+    ttl_cache.invalidate("a")
+    ttl_cache.set("a", 1, generation=generation)
+    ttl_cache.set("b", 2, generation=generation)
+
+    # Then: 무효화된 키의 이전 조회 결과만 저장되지 않고, 이후 조회 결과는 저장됨
+    assert ttl_cache.get("a") is None
+    assert ttl_cache.get("b") == 2
+    ttl_cache.set("a", 1, generation=ttl_cache.generation)
+    assert ttl_cache.get("a") == 1
+
+    # 무효화 기록이 max_size를 넘어 밀려나면 그 이전에 시작한 조회는 저장하지 않음
+    ttl_cache.invalidate("c")
+    ttl_cache.invalidate("d")
+    ttl_cache.set("e", 5, generation=generation)
+    assert ttl_cache.get("e") is None
+
+
+# ✅ 인증된 사용자 정보는 캐시되고, 비활성화 시 즉시 무효화됨
+def test_current_user_cache_invalidated_on_deactivate(
+    client: TestClient, db: Session, normal_user_token_headers0: dict[str, str]
+) -> None:
+    # Given: 한 번 인증된 사용자
+    response = client.get(
+        f"{settings.API_V1_STR}/tryouts/1", headers=normal_user_token_headers0
+    )
+    assert response.status_code == 200
+    user = UserRepository(session=db).get_user_by_email(email="user0@example.com")
+    assert user is not None
+    assert principal_cache.get(str(user.id)) is not None
+
+    # When: 사용자 비활성화
+    user.is_active = False
+    db.add(user)
+    db.commit()
+
+    # Then: 캐시가 비워지고 다음 요청부터 거부됨
+    assert principal_cache.get(str(user.id)) is None
+    response = client.get(
+        f"{settings.API_V1_STR}/tryouts/1", headers=normal_user_token_headers0
+    )
+    assert response.status_code == 400
+    assert "Inactive user" in response.text
+
+
+# ✅ 사용자 변경은 커밋 이후에 무효화되어, 커밋 전 요청이 이전 값을 다시 캐시하지 않음
+def test_current_user_cache_invalidated_after_commit(
+    client: TestClient, db: Session, normal_user_token_headers0: dict[str, str]
+) -> None:
+    # Given: 비활성화를 flush했지만 아직 커밋하지 않은 사용자
+    user = UserRepository(session=db).get_user_by_email(email="user0@example.com")
+    assert user is not None
+    user.is_active = False
+    db.add(user)
+    db.flush()
+
+    # When: 커밋 전에 들어온 요청이 커밋된(활성) 값을 캐시한 뒤 커밋
+    response = client.get(
+        f"{settings.API_V1_STR}/tryouts/1", headers=normal_user_token_headers0
+    )
+    assert response.status_code == 200
+    db.commit()
+
+    # Then: 커밋 시점에 캐시가 비워져 다음 요청부터 거부됨
+    assert principal_cache.get(str(user.id)) is None
+    response = client.get(
+        f"{settings.API_V1_STR}/tryouts/1", headers=normal_user_token_headers0
+    )
+    assert response.status_code == 400
+
+
+# ✅ 사용자 조회 도중 무효화되면 조회한 이전 값을 캐시하지 않음
+def test_current_user_cache_skips_value_loaded_before_invalidation(
+    client: TestClient, db: Session, normal_user_token_headers0: dict[str, str]
+) -> None:
+    user = UserRepository(session=db).get_user_by_email(email="user0@example.com")
+    assert user is not None
+    principal_cache.invalidate(str(user.id))
+
+    # Given: users 조회가 실행될 때 같은 사용자가 무효화되는 상황
+    def on_execute(*args: Any) -> None:
+        if args[2].startswith("SELECT users"):
+            invalidate_user(user.id)
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        # When
+        response = client.get(
+            f"{settings.API_V1_STR}/tryouts/1", headers=normal_user_token_headers0
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+    # Then: 요청은 처리되지만 무효화 이전에 조회한 값은 캐시되지 않음
+    assert response.status_code == 200
+    assert principal_cache.get(str(user.id)) is None
@@ -0,0 +1,70 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+
+
+def test_metrics_exposes_per_route_sql_counts(
+    client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+    normal_user_token_headers0: dict[str, str],
+) -> None:
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-token")
+
+    # Given: DB를 사용하는 요청 이후
+    client.get(f"{settings.API_V1_STR}/tryouts/1", headers=normal_user_token_headers0)
+
+    # When
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-token"})
+
+    # Then: 라우트 경로 단위로 요청 수, SQL 수, 잠금 대기 히스토그램이 노출됨
+    assert response.status_code == 200
+    route = f'method="GET",route="{settings.API_V1_STR}/tryouts/{{tryout_id}}"'
+    assert f'http_requests_total{{{route},status="200"}}' in response.text
+    assert f"http_request_sql_statements_total{{{route}}}" in response.text
+    assert f"http_request_lock_wait_seconds_count{{{route}}}" in response.text
+
+
+# ✅ 스크레이프 토큰이 없거나 다르면 지표를 노출하지 않음
+@pytest.mark.parametrize("configured", [None, "scrape-token"])
+def test_metrics_requires_scrape_token(
+    client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+    normal_user_token_headers0: dict[str, str],
+    configured: str | None,
+) -> None:
+    # Given: 토큰을 설정하지 않았거나(기본) 설정한 상태
+    monkeypatch.setattr(settings, "METRICS_TOKEN", configured)
+
+    for headers in (
+        {},
+        {"Authorization": "Bearer wrong-token"},
+        # 사용자 액세스 토큰으로는 조회할 수 없습니다.
+        normal_user_token_headers0,
+    ):
+        # When
+        response = client.get("/metrics", headers=headers)
+
+        # Then
+        assert response.status_code == 403
+        assert "http_requests_total" not in response.text
+
+
+def test_server_timing_header(
+    client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+    normal_user_token_headers0: dict[str, str],
+) -> None:
+    monkeypatch.setattr(settings, "SERVER_TIMING_ENABLED", True)
+
+    response = client.post(
+        f"{settings.API_V1_STR}/tryouts/1/reserve?reserved_seats=1",
+        headers=normal_user_token_headers0,
+    )
+
+    assert response.status_code == 200
+    server_timing = response.headers["Server-Timing"]
+    assert "db;dur=" in server_timing
+    assert "lock;dur=" in server_timing
+    assert "commit;dur=" in server_timing
+    assert "app;dur=" in server_timing
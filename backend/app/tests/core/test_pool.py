@@ -0,0 +1,59 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.pool import engine_options, pool_limits
+
+
+def test_pool_limits_split_connection_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Given: 워커 4개가 최대 40개의 커넥션을 나눠 사용
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 4)
+    monkeypatch.setattr(settings, "DB_MAX_CONNECTIONS", 40)
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 8)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 10)
+
+    # Then: 엔진 하나당 10개, 엔진 두 개면 5개를 넘지 않음
+    assert pool_limits(engines=1) == (8, 2)
+    assert pool_limits(engines=2) == (5, 0)
+
+
+def test_external_pooler_disables_prepared_statements(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "DB_EXTERNAL_POOLER", True)
+
+    options = engine_options(is_async=False)
+
+    assert options["poolclass"].__name__ == "NullPool"
+    assert options["connect_args"]["prepare_threshold"] is None
+
+
+def test_db_pool_status(
+    client: TestClient,
+    normal_user_token_headers0: dict[str, str],
+    superuser_token_headers: dict[str, str],
+) -> None:
+    # Given: DB를 사용하는 요청 이후
+    client.get(f"{settings.API_V1_STR}/tryouts", headers=normal_user_token_headers0)
+
+    # When
+    response = client.get(
+        f"{settings.API_V1_STR}/utils/db-pool/", headers=superuser_token_headers
+    )
+
+    # Then
+    assert response.status_code == 200
+    sync_pool = response.json()["sync"]
+    assert sync_pool["pool"] == "InstrumentedQueuePool"
+    assert sync_pool["checkouts"] > 0
+    assert {"checked_out", "overflow", "max_wait_seconds"} <= sync_pool.keys()
+
+
+# ✅ 풀 사용 현황은 관리자만 조회
+def test_db_pool_status_requires_superuser(
+    client: TestClient, normal_user_token_headers0: dict[str, str]
+) -> None:
+    url = f"{settings.API_V1_STR}/utils/db-pool/"
+
+    assert client.get(url).status_code == 401
+    assert client.get(url, headers=normal_user_token_headers0).status_code == 403
@@ -0,0 +1,105 @@
+from collections.abc import Generator
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.db import engine
+from app.core.profiler import fingerprint, profile_request, query_profiler
+from app.repository.tryouts import TryoutRepository
+
+
+@pytest.fixture()
+def profiler() -> Generator[None, None, None]:
+    query_profiler.reset()
+    query_profiler.instrument(engine, explain_engine=engine)
+    yield
+    query_profiler.remove(engine)
+    query_profiler.reset()
+
+
+def test_fingerprint_ignores_values_and_in_list_length() -> None:
+    one = fingerprint(
+        "SELECT r.id FROM reservations r WHERE r.user_id = %(user_id_1)s::UUID "
+        "AND r.tryout_id IN (%(tryout_id_1_1)s::INTEGER)"
+    )
+    many = fingerprint(
+        "SELECT r.id FROM reservations r WHERE r.user_id = %(user_id_1)s::UUID "
+        "AND r.tryout_id IN (%(tryout_id_1_1)s::INTEGER, %(tryout_id_1_2)s::INTEGER)"
+    )
+
+    assert one == many
+    assert one.endswith("IN (?)")
+
+
+# ✅ 요청 하나에서 같은 쿼리가 반복되면 경고
+@pytest.mark.usefixtures("profiler")
+def test_repeated_statements_are_reported(
+    db: Session, caplog: pytest.LogCaptureFixture
+) -> None:
+    # Given
+    repo = TryoutRepository(db)
+    now = datetime.now()
+
+    # When: 같은 count 쿼리를 세 번 실행
+    with profile_request("GET /tryouts") as profile:
+        for _ in range(3):
+            repo.count_upcoming(now=now)
+
+    # Then: N+1 / 중복 쿼리 경고와 fingerprint별 집계
+    assert len(profile.repeated_fingerprints(threshold=3)) == 1
+    assert "possible N+1 in GET /tryouts: 3 x" in caplog.text
+    assert "duplicate query in GET /tryouts: 3 x" in caplog.text
+    [count_stats] = [
+        s for s in query_profiler.snapshot() if "count(*)" in s["fingerprint"]
+    ]
+    assert count_stats["count"] == 3
+
+
+@pytest.mark.usefixtures("profiler")
+def test_explain_analyzes_select_statements(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "QUERY_PROFILER_EXPLAIN_ANALYZE", True)
+
+    plan = query_profiler.explain(
+        "SELECT id FROM tryouts WHERE start_time > %(now)s", {"now": datetime.now()}
+    )
+    locking_plan = query_profiler.explain(
+        "SELECT id FROM tryouts FOR NO KEY UPDATE", {}
+    )
+
+    assert "actual time" in plan
+    assert "actual time" not in locking_plan
+
+
+# ✅ 기본 설정에서는 EXPLAIN할 문장을 실행하지 않음
+@pytest.mark.usefixtures("profiler")
+def test_explain_does_not_execute_statements_by_default() -> None:
+    # When: 부수 효과(advisory lock)가 있는 SELECT를 EXPLAIN
+    plan = query_profiler.explain(
+        "SELECT pg_try_advisory_lock(%(namespace)s, %(key)s)",
+        {"namespace": 424242, "key": 7},
+    )
+
+    # Then: 실행 계획만 남기고 잠금은 잡지 않음
+    assert "actual time" not in plan
+    with engine.connect() as conn:
+        locks = conn.execute(
+            text(
+                "SELECT count(*) FROM pg_locks WHERE locktype = 'advisory' "
+                "AND classid = 424242 AND objid = 7"
+            )
+        ).scalar_one()
+    assert locks == 0
+
+
+# ✅ 쿼리 프로파일 결과는 관리자만 조회
+def test_query_profile_requires_superuser(
+    client: TestClient, normal_user_token_headers0: dict[str, str]
+) -> None:
+    url = f"{settings.API_V1_STR}/utils/query-profile/"
+
+    assert client.get(url).status_code == 401
+    assert client.get(url, headers=normal_user_token_headers0).status_code == 403
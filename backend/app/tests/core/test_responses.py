@@ -0,0 +1,100 @@
+import uuid
+from datetime import datetime
+
+import orjson
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.responses import dumps, encode_page
+from app.models.common import PaginatedResponse
+from app.models.reservations import Reservation, ReservationStatus
+from app.models.tryouts import TryoutPublic
+
+
+def _tryout(id: int, start_time: datetime) -> TryoutPublic:
+    return TryoutPublic(
+        id=id,
+        name="모의고사",
+        start_time=start_time,
+        end_time=start_time,
+        registration_start_time=start_time,
+        registration_end_time=start_time,
+        max_capacity=50000,
+        confirmed_reserved_count=3,
+        isApplied=id % 2 == 0,
+    )
+
+
+# ✅ orjson으로 인코딩
+def test_dumps_uses_orjson() -> None:
+    # When / Then
+    assert dumps({"a": [1, None]}) == orjson.dumps({"a": [1, None]})
+
+
+# ✅ pydantic JSON 응답과 같은 bytes로 인코딩
+def test_dumps_matches_pydantic_json() -> None:
+    # Given
+    page = PaginatedResponse[TryoutPublic](
+        total=2,
+        items=[
+            _tryout(1, datetime(2026, 1, 2, 3, 4, 5)),
+            _tryout(2, datetime(2026, 1, 2, 3, 4, 5, 678)),
+        ],
+        next_cursor="abc",
+    )
+    reservation = Reservation(
+        id=1,
+        user_id=uuid.uuid4(),
+        tryout_id=1,
+        reserved_seats=2,
+        status=ReservationStatus.confirmed,
+    )
+
+    # When / Then
+    assert dumps(page.model_dump()) == page.model_dump_json().encode()
+    assert dumps(reservation.model_dump()) == reservation.model_dump_json().encode()
+    assert (
+        encode_page(
+            (item.model_dump_json().encode() for item in page.items),
+            page.total,
+            page.next_cursor,
+        )
+        == page.model_dump_json().encode()
+    )
+
+
+# ✅ 목록 API는 response_model로 직렬화한 것과 같은 JSON을 응답
+def test_list_endpoints_match_response_model(
+    client: TestClient,
+    normal_user_token_headers0: dict[str, str],
+    superuser_token_headers: dict[str, str],
+) -> None:
+    # Given: 예약이 하나 이상 있는 상태
+    client.post(
+        f"{settings.API_V1_STR}/tryouts/1/reserve?reserved_seats=1",
+        headers=normal_user_token_headers0,
+    )
+    cases: list[tuple[str, dict[str, str], type[BaseModel]]] = [
+        (
+            f"{settings.API_V1_STR}/tryouts?limit=100",
+            normal_user_token_headers0,
+            PaginatedResponse[TryoutPublic],
+        ),
+        (
+            f"{settings.API_V1_STR}/reservations?limit=100",
+            superuser_token_headers,
+            PaginatedResponse[Reservation],
+        ),
+    ]
+
+    for url, headers, model in cases:
+        # When
+        for page_url in (url, f"{url}&offset=1"):
+            response = client.get(page_url, headers=headers)
+
+            # Then
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/json"
+            expected = model.model_validate_json(response.content).model_dump_json()
+            assert response.content == expected.encode()
@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from app.core.schedule import UserSchedule
+
+
+def at(hour: int) -> datetime:
+    return datetime(2025, 1, 1, hour)
+
+
+def test_user_schedule_overlaps() -> None:
+    # Given: 9~12시(긴 시험), 10~11시, 14~15시 예약
+    schedule = UserSchedule(
+        [(3, at(14), at(15)), (1, at(9), at(12)), (2, at(10), at(11))]
+    )
+
+    # Then: 반열린 구간 [start, end) 기준으로 겹침 여부를 판단
+    assert schedule.overlaps(at(11), at(13))  # 11시에 끝난 예약 이후지만 9~12시와 겹침
+    assert schedule.overlaps(at(8), at(10))
+    assert schedule.overlaps(at(13), at(16))
+    assert not schedule.overlaps(at(12), at(14))
+    assert not schedule.overlaps(at(6), at(9))
+    assert not schedule.overlaps(at(15), at(18))
+
+
+def test_user_schedule_tryout_ids() -> None:
+    schedule = UserSchedule([(1, at(9), at(10)), (2, at(11), at(12))])
+
+    assert schedule.has_tryout(2)
+    assert not schedule.has_tryout(3)
+    assert schedule.tryout_ids == frozenset({1, 2})
+    assert len(schedule) == 2
+    assert not UserSchedule([]).overlaps(at(0), at(23))
@@ -0,0 +1,55 @@
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from passlib.hash import bcrypt  # type: ignore[import-untyped]
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.security import password_hash_pool
+from app.models.users import User
+from app.tests.conftest import random_email
+
+
+# ✅ 해시 비용이 바뀐 계정은 로그인 시 새 비용으로 다시 해시됨
+def test_login_rehashes_outdated_password_hash(client: TestClient, db: Session) -> None:
+    # Given: 현재 설정보다 낮은 비용으로 해시된 계정
+    email = random_email()
+    user = User(email=email, hashed_password=bcrypt.using(rounds=4).hash("password123"))
+    db.add(user)
+    db.commit()
+
+    # When: 로그인
+    response = client.post(
+        f"{settings.API_V1_STR}/utils/login/access-token",
+        data={"username": email, "password": "password123"},
+    )
+
+    # Then: 로그인 성공 후 해시가 설정된 비용으로 교체됨
+    assert response.status_code == 200
+    db.refresh(user)
+    assert user.hashed_password.startswith(f"$2b${settings.BCRYPT_ROUNDS:02d}$")
+
+
+# ✅ 해시 작업 대기열이 가득 차면 503으로 즉시 거절
+def test_login_rejected_when_hash_pool_is_full(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Given: 남은 슬롯이 없는 해시 풀
+    slots = threading.BoundedSemaphore(1)
+    slots.acquire()
+    monkeypatch.setattr(password_hash_pool, "workers", 1)
+    monkeypatch.setattr(password_hash_pool, "_slots", slots)
+
+    # When
+    response = client.post(
+        f"{settings.API_V1_STR}/utils/login/access-token",
+        data={
+            "username": settings.FIRST_SUPERUSER,
+            "password": settings.FIRST_SUPERUSER_PASSWORD,
+        },
+    )
+
+    # Then
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,105 @@
+import threading
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.db import engine
+
+# 요청과 무관하게 주기적으로 쿼리를 실행하는 백그라운드 스레드
+BACKGROUND_THREADS = {
+    "registration-window-scheduler",
+    "waitlist-worker",
+    "capacity-ledger",
+}
+
+
+class StatementCounter:
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+        self.commits = 0
+
+    def reset(self) -> None:
+        self.statements.clear()
+        self.commits = 0
+
+
+@pytest.fixture()
+def counter() -> Generator[StatementCounter, None, None]:
+    counter = StatementCounter()
+
+    def on_execute(*args: Any) -> None:
+        if threading.current_thread().name not in BACKGROUND_THREADS:
+            counter.statements.append(args[2])
+
+    def on_commit(_: Any) -> None:
+        if threading.current_thread().name not in BACKGROUND_THREADS:
+            counter.commits += 1
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    event.listen(engine, "commit", on_commit)
+    yield counter
+    event.remove(engine, "before_cursor_execute", on_execute)
+    event.remove(engine, "commit", on_commit)
+
+
+# ✅ 예약 신청은 커밋 한 번, refresh 조회 없이 처리
+def test_reserve_commits_once(
+    client: TestClient,
+    normal_user_token_headers0: dict[str, str],
+    counter: StatementCounter,
+) -> None:
+    # Given: 인증 캐시와 사용자 시간표 캐시가 채워진 상태
+    client.get(f"{settings.API_V1_STR}/tryouts/1", headers=normal_user_token_headers0)
+    counter.reset()
+
+    # When
+    response = client.post(
+        f"{settings.API_V1_STR}/tryouts/1/reserve?reserved_seats=1",
+        headers=normal_user_token_headers0,
+    )
+
+    # Then: 사전 검증용 tryout 스냅샷 조회(중복/겹침은 캐시된 시간표로 검사),
+    # tryout 조회, 기존 예약 잠금, 동시간대 예약 조회, INSERT ... RETURNING
+    assert response.status_code == 200
+    assert counter.commits == 1
+    assert len(counter.statements) == 5
+    assert counter.statements[-1].startswith("INSERT INTO reservations")
+
+
+# ✅ 예약 확정은 tryout/예약 갱신을 한 트랜잭션에서 커밋 한 번으로 처리
+@pytest.mark.parametrize("admission_engine", ["row_lock", "conditional_update"])
+def test_confirm_commits_once(
+    client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+    superuser_token_headers: dict[str, str],
+    normal_user_token_headers0: dict[str, str],
+    counter: StatementCounter,
+    admission_engine: str,
+) -> None:
+    # Given: 대기 중인 예약과 인증 캐시가 채워진 어드민
+    monkeypatch.setattr(settings, "ADMISSION_ENGINE", admission_engine)
+    reserve = client.post(
+        f"{settings.API_V1_STR}/tryouts/1/reserve?reserved_seats=1",
+        headers=normal_user_token_headers0,
+    )
+    reservation_id = reserve.json()["id"]
+    client.get(f"{settings.API_V1_STR}/tryouts/1", headers=superuser_token_headers)
+    counter.reset()
+
+    # When
+    response = client.post(
+        f"{settings.API_V1_STR}/reservations/{reservation_id}/confirm",
+        headers=superuser_token_headers,
+    )
+
+    # Then: 예약 잠금, tryout 조회, tryout/예약 UPDATE 후 커밋 한 번 (refresh 조회 없음)
+    assert response.status_code == 200
+    assert response.json()["status"] == "confirmed"
+    assert counter.commits == 1
+    assert len(counter.statements) == 4
+    assert counter.statements[-2].startswith("UPDATE tryouts")
+    assert counter.statements[-1].startswith("UPDATE reservations")
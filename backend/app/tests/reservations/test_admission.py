@@ -0,0 +1,274 @@
+import threading
+import uuid
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session, col, delete, func, select
+
+from app.core.config import settings
+from app.core.db import engine
+from app.core.exceptions import TryoutFullError
+from app.core.transaction import TransactionHelper
+from app.models.reservations import (
+    Reservation,
+    ReservationBatchConfirmRequest,
+    ReservationStatus,
+)
+from app.models.tryouts import Tryout
+from app.models.users import User
+from app.repository.reservations import ReservationRepository
+from app.services.admission import LedgerAdmissionEngine
+from app.services.capacity_ledger import capacity_ledger
+from app.services.reservations import ReservationService
+
+MAX_CAPACITY = 500
+RESERVATIONS = 1000
+WORKERS = 12
+
+
+@pytest.fixture()
+def pending_reservations(db: Session) -> Generator[tuple[int, list[int]], None, None]:
+    now = datetime.now()
+    tryout = Tryout(
+        name="Admission Tryout",
+        start_time=now + timedelta(days=10),
+        end_time=now + timedelta(days=10, hours=2),
+        registration_start_time=now - timedelta(days=1),
+        registration_end_time=now + timedelta(days=7),
+        max_capacity=MAX_CAPACITY,
+        confirmed_reserved_count=0,
+    )
+    db.add(tryout)
+    db.commit()
+
+    users = [
+        User(email=f"admission-{uuid.uuid4()}@example.com", hashed_password="")
+        for _ in range(RESERVATIONS)
+    ]
+    db.add_all(users)
+    db.commit()
+
+    reservations = [
+        Reservation(user_id=user.id, tryout_id=tryout.id, reserved_seats=1 + i % 3)
+        for i, user in enumerate(users)
+    ]
+    db.add_all(reservations)
+    db.commit()
+
+    yield tryout.id, [r.id for r in reservations]
+
+    db.execute(delete(Reservation).where(col(Reservation.tryout_id) == tryout.id))
+    db.execute(delete(Tryout).where(col(Tryout.id) == tryout.id))
+    db.commit()
+
+
+def confirm(reservation_id: int) -> bool:
+    with Session(engine) as session:
+        try:
+            ReservationService(session).confirm_reservation(reservation_id)
+        except TryoutFullError:
+            return False
+    return True
+
+
+@pytest.mark.parametrize(
+    "admission_engine", ["row_lock", "conditional_update", "ledger"]
+)
+def test_parallel_confirms_do_not_oversell(
+    monkeypatch: pytest.MonkeyPatch,
+    db: Session,
+    pending_reservations: tuple[int, list[int]],
+    admission_engine: str,
+) -> None:
+    # Given: 정원보다 훨씬 많은 대기 예약
+    monkeypatch.setattr(settings, "ADMISSION_ENGINE", admission_engine)
+    tryout_id, reservation_ids = pending_reservations
+
+    # When: 모든 예약을 동시에 확정 시도
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        results = list(executor.map(confirm, reservation_ids))
+    # ledger 엔진은 확정 인원을 주기적으로 기록하므로 검증 전에 기록합니다.
+    capacity_ledger.flush()
+
+    # Then: 확정 인원은 정원을 넘지 않고, 확정된 예약의 좌석 합과 일치
+    db.expire_all()
+    tryout = db.get(Tryout, tryout_id)
+    assert tryout is not None
+    confirmed_seats: int = db.exec(
+        select(func.coalesce(func.sum(Reservation.reserved_seats), 0)).where(
+            col(Reservation.tryout_id) == tryout_id,
+            col(Reservation.status) == ReservationStatus.confirmed,
+        )
+    ).one()
+
+    assert any(results) and not all(results)
+    assert tryout.confirmed_reserved_count == confirmed_seats
+    assert confirmed_seats <= MAX_CAPACITY
+    assert MAX_CAPACITY - confirmed_seats < 3
+
+
+def test_batch_confirm_fills_capacity_in_id_order(
+    db: Session, pending_reservations: tuple[int, list[int]]
+) -> None:
+    # Given: 정원보다 훨씬 많은 대기 예약
+    tryout_id, reservation_ids = pending_reservations
+
+    # When: tryout 단위로 일괄 확정
+    response = ReservationService(db).confirm_reservations(
+        ReservationBatchConfirmRequest(tryout_id=tryout_id)
+    )
+
+    # Then: 정원 안에서만 확정되고, 나머지는 정원 초과 사유와 함께 실패
+    db.expire_all()
+    tryout = db.get(Tryout, tryout_id)
+    assert tryout is not None
+    confirmed_seats: int = db.exec(
+        select(func.coalesce(func.sum(Reservation.reserved_seats), 0)).where(
+            col(Reservation.tryout_id) == tryout_id,
+            col(Reservation.status) == ReservationStatus.confirmed,
+        )
+    ).one()
+
+    assert [r.reservation_id for r in response.results] == sorted(reservation_ids)
+    assert response.confirmed + response.failed == RESERVATIONS
+    assert tryout.confirmed_reserved_count == confirmed_seats
+    assert MAX_CAPACITY - 3 < confirmed_seats <= MAX_CAPACITY
+    assert all(
+        r.detail == "정원이 가득 찼습니다."
+        for r in response.results
+        if r.status == "failed"
+    )
+
+
+# ✅ 좌석 원장은 처음 사용할 때 확정 인원을 예약 테이블에서 다시 계산
+def test_ledger_recovers_confirmed_count_from_reservations(
+    db: Session, pending_reservations: tuple[int, list[int]]
+) -> None:
+    # Given: 확정 예약 3건(좌석 1 + 2 + 3)과 어긋난 확정 인원
+    tryout_id, reservation_ids = pending_reservations
+    for reservation in db.exec(
+        select(Reservation).where(col(Reservation.id).in_(reservation_ids[:3]))
+    ):
+        reservation.status = ReservationStatus.confirmed
+        db.add(reservation)
+    tryout = db.get(Tryout, tryout_id)
+    assert tryout is not None
+    tryout.confirmed_reserved_count = 100
+    db.add(tryout)
+    db.commit()
+
+    # When
+    confirmed = capacity_ledger.confirmed(tryout_id)
+    capacity_ledger.flush()
+
+    # Then
+    assert confirmed == 6
+    db.refresh(tryout)
+    assert tryout.confirmed_reserved_count == 6
+
+
+# ✅ 좌석 원장 복구 중에도 다른 시험의 요청은 기다리지 않음
+def test_ledger_recovery_does_not_block_other_tryouts(
+    monkeypatch: pytest.MonkeyPatch, pending_reservations: tuple[int, list[int]]
+) -> None:
+    # Given: 확정 인원 합계 조회가 멈춘 채 복구 중인 시험
+    tryout_id, _ = pending_reservations
+    recovering = threading.Event()
+    release = threading.Event()
+    sum_confirmed_seats = ReservationRepository.sum_confirmed_seats
+
+    def blocking_sum(self: ReservationRepository, id_: int) -> int:
+        if id_ == tryout_id:
+            recovering.set()
+            release.wait(timeout=10)
+        return sum_confirmed_seats(self, id_)
+
+    monkeypatch.setattr(ReservationRepository, "sum_confirmed_seats", blocking_sum)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(capacity_ledger.confirmed, tryout_id)
+        assert recovering.wait(timeout=10)
+
+        # When: 다른 시험의 확정 인원 조회
+        other = capacity_ledger.confirmed(1)
+
+        # Then: 복구가 끝나기 전에 처리되고, 복구한 시험도 이후 정상 조회됨
+        assert not pending.done()
+        assert other >= 0
+        release.set()
+        assert pending.result(timeout=10) == 0
+
+
+def _advisory_lock_pids(tryout_id: int) -> list[int]:
+    with engine.connect() as conn:
+        return list(
+            conn.execute(
+                text(
+                    "SELECT pid FROM pg_locks WHERE locktype = 'advisory' "
+                    "AND classid = :namespace AND objid = :tryout_id"
+                ),
+                {
+                    "namespace": settings.CAPACITY_LEDGER_LOCK_NAMESPACE,
+                    "tryout_id": tryout_id,
+                },
+            ).scalars()
+        )
+
+
+# ✅ 원장을 비우면 advisory lock도 해제되어 풀에 돌아간 연결에 잠금이 남지 않음
+def test_ledger_reset_releases_advisory_locks(
+    pending_reservations: tuple[int, list[int]],
+) -> None:
+    # Given: 원장이 관리 중인 시험
+    tryout_id, _ = pending_reservations
+    capacity_ledger.confirmed(tryout_id)
+    assert len(_advisory_lock_pids(tryout_id)) == 1
+
+    # When
+    capacity_ledger.reset()
+
+    # Then
+    assert _advisory_lock_pids(tryout_id) == []
+
+
+# ✅ advisory lock 연결이 끊기면 메모리 상태를 버리고 다시 잠금을 잡아 복구
+def test_ledger_recovers_after_owner_connection_is_lost(
+    pending_reservations: tuple[int, list[int]],
+) -> None:
+    # Given: 원장이 배정한 좌석과 advisory lock을 보유한 연결
+    tryout_id, _ = pending_reservations
+    assert capacity_ledger.admit(tryout_id, 3)
+    [pid] = _advisory_lock_pids(tryout_id)
+
+    # When: 잠금을 보유한 연결이 끊김
+    with engine.connect() as conn:
+        conn.execute(text("SELECT pg_terminate_backend(:pid)"), {"pid": pid})
+
+    # Then: 연결 확인에서 감지해 상태를 버리고, 다음 사용 시 잠금을 다시 잡아 복구
+    assert not capacity_ledger.check_owner()
+    assert capacity_ledger.confirmed(tryout_id) == 0
+    [new_pid] = _advisory_lock_pids(tryout_id)
+    assert new_pid != pid
+    assert capacity_ledger.check_owner()
+
+
+# ✅ 롤백된 트랜잭션에서 배정한 좌석은 원장에 반환
+def test_ledger_returns_seats_on_rollback(
+    db: Session, pending_reservations: tuple[int, list[int]]
+) -> None:
+    tryout_id, _ = pending_reservations
+    admission = LedgerAdmissionEngine(db)
+
+    def operation() -> None:
+        tryout = admission.load_tryout(tryout_id)
+        admission.admit(tryout, MAX_CAPACITY)
+        assert capacity_ledger.confirmed(tryout_id) == MAX_CAPACITY
+        raise RuntimeError("rollback")
+
+    with pytest.raises(RuntimeError):
+        TransactionHelper(db).run(operation)
+
+    assert capacity_ledger.confirmed(tryout_id) == 0
+    assert capacity_ledger.flush() == 0
@@ -0,0 +1,149 @@
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, col, func, select
+
+from app.core.cache import idempotency_cache
+from app.core.config import settings
+from app.core.db import get_pool_status
+from app.models.idempotency import IdempotencyRecord
+from app.models.reservations import Reservation
+from app.services.tryouts import TryoutService
+
+
+# ✅ 같은 Idempotency-Key로 재시도하면 저장된 응답을 그대로 반환
+def test_reserve_replays_stored_response(
+    client: TestClient, db: Session, normal_user_token_headers0: dict[str, str]
+) -> None:
+    # Given: 멱등 키와 함께 예약 신청
+    headers = {**normal_user_token_headers0, "Idempotency-Key": "reserve-1"}
+    url = f"{settings.API_V1_STR}/tryouts/2/reserve?reserved_seats=1"
+    first = client.post(url, headers=headers)
+    assert first.status_code == 200
+    assert "idempotent-replayed" not in first.headers
+
+    # When: 같은 키로 다시 요청하면 서비스(트랜잭션, tryout 잠금)를 거치지 않고
+    with patch.object(TryoutService, "reserve_tryout") as reserve_tryout:
+        retry = client.post(url, headers=headers)
+    reserve_tryout.assert_not_called()
+
+    # Then: 첫 응답이 그대로 반환되고 예약은 하나만 생성됨
+    assert retry.status_code == 200
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert retry.json() == first.json()
+    count = db.exec(
+        select(func.count())
+        .select_from(Reservation)
+        .where(col(Reservation.tryout_id) == 2)
+    ).one()
+    assert count == 1
+
+
+# ✅ 프로세스 캐시에 없으면 DB에 저장된 응답으로 재시도에 응답
+@pytest.mark.parametrize("database_mode", ["sync", "async"])
+def test_replay_from_database_after_cache_miss(
+    client: TestClient,
+    db: Session,
+    monkeypatch: pytest.MonkeyPatch,
+    normal_user_token_headers0: dict[str, str],
+    database_mode: str,
+) -> None:
+    monkeypatch.setattr(settings, "DATABASE_MODE", database_mode)
+    headers = {**normal_user_token_headers0, "Idempotency-Key": "reserve-2"}
+    url = f"{settings.API_V1_STR}/tryouts/3/reserve?reserved_seats=1"
+    first = client.post(url, headers=headers)
+    assert first.status_code == 200
+    assert db.exec(
+        select(IdempotencyRecord).where(col(IdempotencyRecord.key) == "reserve-2")
+    ).one()
+
+    # Given: 다른 워커로 재시도가 들어온 상황
+    idempotency_cache.clear()
+
+    retry = client.post(url, headers=headers)
+    assert retry.status_code == 200
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert retry.json() == first.json()
+
+
+# ✅ sync 모드에서는 멱등 키 저장/조회에 async 엔진의 커넥션을 사용하지 않음
+def test_store_does_not_use_async_pool_in_sync_mode(
+    client: TestClient, normal_user_token_headers0: dict[str, str]
+) -> None:
+    # Given
+    assert settings.DATABASE_MODE == "sync"
+    checkouts = get_pool_status()["async"]["checkouts"]
+    headers = {**normal_user_token_headers0, "Idempotency-Key": "reserve-sync"}
+    url = f"{settings.API_V1_STR}/tryouts/3/reserve?reserved_seats=1"
+
+    # When: 저장 후 캐시 없이 DB에서 다시 조회
+    assert client.post(url, headers=headers).status_code == 200
+    idempotency_cache.clear()
+    retry = client.post(url, headers=headers)
+
+    # Then
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert get_pool_status()["async"]["checkouts"] == checkouts
+
+
+# ✅ 오류 응답도 저장되어 재시도 시 같은 결과를 반환
+def test_confirm_retry_does_not_reprocess(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    normal_user_token_headers0: dict[str, str],
+) -> None:
+    reserve = client.post(
+        f"{settings.API_V1_STR}/tryouts/4/reserve?reserved_seats=1",
+        headers=normal_user_token_headers0,
+    )
+    reservation_id = reserve.json()["id"]
+
+    headers = {**superuser_token_headers, "Idempotency-Key": "confirm-1"}
+    url = f"{settings.API_V1_STR}/reservations/{reservation_id}/confirm"
+    first = client.post(url, headers=headers)
+    assert first.status_code == 200
+
+    # 키 없이 다시 확정하면 이미 확정된 예약으로 실패하지만
+    without_key = client.post(url, headers=superuser_token_headers)
+    assert without_key.status_code == 400
+
+    # 같은 키로 재시도하면 첫 확정 결과를 반환
+    retry = client.post(url, headers=headers)
+    assert retry.status_code == 200
+    assert retry.json()["status"] == "confirmed"
+
+
+# ✅ 같은 키로 다른 요청을 보내면 422
+def test_reused_key_with_different_request(
+    client: TestClient, normal_user_token_headers0: dict[str, str]
+) -> None:
+    headers = {**normal_user_token_headers0, "Idempotency-Key": "reserve-3"}
+    first = client.post(
+        f"{settings.API_V1_STR}/tryouts/5/reserve?reserved_seats=1", headers=headers
+    )
+    assert first.status_code == 200
+
+    response = client.post(
+        f"{settings.API_V1_STR}/tryouts/5/reserve?reserved_seats=2", headers=headers
+    )
+    assert response.status_code == 422
+
+
+# ✅ 멱등 키는 사용자별로 구분
+def test_key_is_scoped_per_user(
+    client: TestClient,
+    normal_user_token_headers0: dict[str, str],
+    normal_user_token_headers1: dict[str, str],
+) -> None:
+    url = f"{settings.API_V1_STR}/tryouts/1/reserve?reserved_seats=1"
+    first = client.post(
+        url, headers={**normal_user_token_headers0, "Idempotency-Key": "same"}
+    )
+    second = client.post(
+        url, headers={**normal_user_token_headers1, "Idempotency-Key": "same"}
+    )
+
+    assert first.status_code == second.status_code == 200
+    assert "idempotent-replayed" not in second.headers
+    assert first.json()["id"] != second.json()["id"]
@@ -23,6 +23,39 @@ def test_get_own_reservations(
     assert all(r["tryout_id"] for r in content["items"])
 
 
+# ✅ 커서 방식 예약 목록 조회
+def test_get_reservations_with_cursor(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    normal_user_token_headers0: dict[str, str],
+    normal_user_token_headers1: dict[str, str],
+) -> None:
+    for headers in (normal_user_token_headers0, normal_user_token_headers1):
+        reserve = client.post(
+            f"{settings.API_V1_STR}/tryouts/1/reserve?reserved_seats=1",
+            headers=headers,
+        )
+        assert reserve.status_code == 200
+
+    first = client.get(
+        f"{settings.API_V1_STR}/reservations?limit=1",
+        headers=superuser_token_headers,
+    )
+    assert first.status_code == 200
+    next_cursor = first.json()["next_cursor"]
+    assert next_cursor
+
+    second = client.get(
+        f"{settings.API_V1_STR}/reservations",
+        params={"limit": 1, "cursor": next_cursor},
+        headers=superuser_token_headers,
+    )
+    assert second.status_code == 200
+    content = second.json()
+    assert content["total"] is None
+    assert content["items"][0]["id"] > first.json()["items"][0]["id"]
+
+
 # ✅ 예약 단건 조회 성공
 def test_get_reservation_by_id(
     client: TestClient, normal_user_token_headers0: dict[str, str]
@@ -98,6 +131,57 @@ def test_admin_confirm_reservation(
     assert response.json()["status"] == "confirmed"
 
 
+# ✅ 예약 일괄 확정 처리 (id 목록)
+def test_admin_confirm_reservations_batch(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    normal_user_token_headers0: dict[str, str],
+) -> None:
+    # Given: 대기 중인 예약 하나와 존재하지 않는 예약 id
+    reserve = client.post(
+        f"{settings.API_V1_STR}/tryouts/1/reserve?reserved_seats=2",
+        headers=normal_user_token_headers0,
+    )
+    reservation_id = reserve.json()["id"]
+    missing_id = reservation_id + 1_000_000
+
+    # When
+    response = client.post(
+        f"{settings.API_V1_STR}/reservations/confirm:batch",
+        json={"reservation_ids": [reservation_id, missing_id, reservation_id]},
+        headers=superuser_token_headers,
+    )
+
+    # Then: 요청 순서대로 id별 결과가 반환됨
+    assert response.status_code == 200
+    content = response.json()
+    assert content["confirmed"] == 1
+    assert content["failed"] == 1
+    assert [r["reservation_id"] for r in content["results"]] == [
+        reservation_id,
+        missing_id,
+    ]
+    assert content["results"][1]["detail"] == "예약을 찾을 수 없습니다."
+
+    detail = client.get(
+        f"{settings.API_V1_STR}/reservations/{reservation_id}",
+        headers=normal_user_token_headers0,
+    )
+    assert detail.json()["status"] == "confirmed"
+
+
+# ✅ 일괄 확정은 어드민 전용
+def test_confirm_reservations_batch_requires_admin(
+    client: TestClient, normal_user_token_headers0: dict[str, str]
+) -> None:
+    response = client.post(
+        f"{settings.API_V1_STR}/reservations/confirm:batch",
+        json={"tryout_id": 1},
+        headers=normal_user_token_headers0,
+    )
+    assert response.status_code == 403
+
+
 # ✅ 본인 아닌 예약 조회/수정 시도 차단
 def test_reservation_access_denied(
     client: TestClient,
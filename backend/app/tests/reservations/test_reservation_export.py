@@ -0,0 +1,108 @@
+import csv
+import io
+import json
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+
+EXPORT_URL = f"{settings.API_V1_STR}/reservations/export"
+
+
+@pytest.fixture
+def reservations(
+    client: TestClient,
+    normal_user_token_headers0: dict[str, str],
+    normal_user_token_headers1: dict[str, str],
+    superuser_token_headers: dict[str, str],
+) -> list[dict[str, Any]]:
+    # user0은 시험 1 대기, user1은 시험 1 확정
+    pending = client.post(
+        f"{settings.API_V1_STR}/tryouts/1/reserve?reserved_seats=2",
+        headers=normal_user_token_headers0,
+    ).json()
+    confirmed = client.post(
+        f"{settings.API_V1_STR}/tryouts/1/reserve?reserved_seats=1",
+        headers=normal_user_token_headers1,
+    ).json()
+    client.post(
+        f"{settings.API_V1_STR}/reservations/{confirmed['id']}/confirm",
+        headers=superuser_token_headers,
+    )
+    return [pending, confirmed]
+
+
+# ✅ NDJSON 내보내기: 청크 경계와 무관하게 모든 예약을 id 순으로 반환
+def test_export_ndjson(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    reservations: list[dict[str, Any]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "RESERVATION_EXPORT_CHUNK_SIZE", 1)
+
+    response = client.get(EXPORT_URL, headers=superuser_token_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert "reservations.ndjson" in response.headers["content-disposition"]
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == sorted(r["id"] for r in reservations)
+    assert rows[0] == {
+        "id": reservations[0]["id"],
+        "user_id": reservations[0]["user_id"],
+        "tryout_id": 1,
+        "reserved_seats": 2,
+        "status": "pending",
+    }
+
+
+# ✅ CSV 내보내기: 시험과 상태로 대상을 좁힘
+def test_export_csv_with_filters(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    reservations: list[dict[str, Any]],
+) -> None:
+    response = client.get(
+        EXPORT_URL,
+        params={"format": "csv", "tryout_id": 1, "status": "confirmed"},
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert rows == [
+        {
+            "id": str(reservations[1]["id"]),
+            "user_id": reservations[1]["user_id"],
+            "tryout_id": "1",
+            "reserved_seats": "1",
+            "status": "confirmed",
+        }
+    ]
+
+    # 조건에 맞는 예약이 없어도 헤더 행은 반환
+    response = client.get(
+        EXPORT_URL,
+        params={"format": "csv", "tryout_id": 2},
+        headers=superuser_token_headers,
+    )
+    assert response.text.splitlines() == ["id,user_id,tryout_id,reserved_seats,status"]
+
+
+# ✅ 어드민이 아니거나 지원하지 않는 형식이면 거절
+def test_export_rejects_invalid_request(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    normal_user_token_headers0: dict[str, str],
+) -> None:
+    response = client.get(EXPORT_URL, headers=normal_user_token_headers0)
+    assert response.status_code == 403
+
+    response = client.get(
+        EXPORT_URL, params={"format": "xml"}, headers=superuser_token_headers
+    )
+    assert response.status_code == 422
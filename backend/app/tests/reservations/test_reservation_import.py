@@ -0,0 +1,145 @@
+import json
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, col, select
+
+from app.core.config import settings
+from app.models.reservations import Reservation, ReservationStatus
+from app.repository.users import UserRepository
+
+IMPORT_URL = f"{settings.API_V1_STR}/reservations/import"
+
+
+def parse_results(content: str) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in content.splitlines() if line]
+
+
+# ✅ CSV 일괄 신청: 행별 검증 결과를 스트리밍하고 통과한 행만 예약 생성
+def test_import_csv(
+    client: TestClient,
+    db: Session,
+    superuser_token_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # 배치 경계를 넘는 중복/동시간대 검사도 확인하도록 배치를 작게 설정
+    monkeypatch.setattr(settings, "RESERVATION_IMPORT_BATCH_SIZE", 3)
+    user1 = UserRepository(db).get_user_by_email("user1@example.com")
+    assert user1
+
+    # Given: 시험 1~5는 같은 시간대, 시험 7은 신청 기간이 아님
+    body = "\n".join(
+        [
+            "email,user_id,tryout_id,reserved_seats",
+            "user0@example.com,,1,2",
+            f",{user1.id},1,",
+            "user0@example.com,,1,1",
+            "user0@example.com,,2,1",
+            "nobody@example.com,,1,1",
+            f",{user1.id},7,1",
+            "user0@example.com,,abc,1",
+        ]
+    )
+
+    # When
+    response = client.post(
+        IMPORT_URL,
+        content=body,
+        headers={**superuser_token_headers, "Content-Type": "text/csv"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    results = parse_results(response.text)
+    assert [r["line"] for r in results] == list(range(2, 9))
+    assert [r["status"] for r in results] == ["created"] * 2 + ["failed"] * 5
+    assert [r.get("detail") for r in results[2:6]] == [
+        "이미 신청된 시험입니다.",
+        "동시간대에 이미 예약된 시험이 존재합니다.",
+        "사용자를 찾을 수 없습니다.",
+        "신청 기간이 아닙니다.",
+    ]
+    assert results[6]["detail"].startswith("tryout_id")
+
+    reservations = db.exec(
+        select(Reservation).where(col(Reservation.tryout_id) == 1)
+    ).all()
+    assert {r.id for r in reservations} == {r["reservation_id"] for r in results[:2]}
+    assert sorted(r.reserved_seats for r in reservations) == [1, 2]
+    assert all(r.status == ReservationStatus.pending for r in reservations)
+
+
+# ✅ NDJSON 일괄 신청: 기존 예약과 중복되면 실패, 삭제된 예약은 다시 신청
+def test_import_ndjson(
+    client: TestClient,
+    db: Session,
+    superuser_token_headers: dict[str, str],
+    normal_user_token_headers0: dict[str, str],
+    normal_user_token_headers1: dict[str, str],
+) -> None:
+    reserved = client.post(
+        f"{settings.API_V1_STR}/tryouts/3/reserve?reserved_seats=1",
+        headers=normal_user_token_headers0,
+    ).json()
+    deleted = client.post(
+        f"{settings.API_V1_STR}/tryouts/3/reserve?reserved_seats=1",
+        headers=normal_user_token_headers1,
+    ).json()
+    client.delete(
+        f"{settings.API_V1_STR}/reservations/{deleted['id']}/delete",
+        headers=normal_user_token_headers1,
+    )
+
+    rows = [
+        {"email": "user0@example.com", "tryout_id": 3},
+        {"email": "user1@example.com", "tryout_id": 3, "reserved_seats": 4},
+    ]
+    response = client.post(
+        IMPORT_URL,
+        content="\n".join(json.dumps(row) for row in rows) + "\n\n[1]\n",
+        headers={**superuser_token_headers, "Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    results = parse_results(response.text)
+    assert results[0] == {
+        "line": 1,
+        "status": "failed",
+        "detail": "이미 신청된 시험입니다.",
+    }
+    assert results[1] == {
+        "line": 2,
+        "status": "created",
+        "reservation_id": deleted["id"],
+    }
+    assert results[2]["line"] == 4 and results[2]["status"] == "failed"
+
+    revived = db.get(Reservation, deleted["id"])
+    assert revived
+    db.refresh(revived)
+    assert revived.status == ReservationStatus.pending
+    assert revived.reserved_seats == 4
+    assert reserved["id"] != revived.id
+
+
+# ✅ 지원하지 않는 형식이거나 어드민이 아니면 거절
+def test_import_rejects_invalid_request(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    normal_user_token_headers0: dict[str, str],
+) -> None:
+    response = client.post(
+        IMPORT_URL,
+        content="{}",
+        headers={**superuser_token_headers, "Content-Type": "application/json"},
+    )
+    assert response.status_code == 400
+
+    response = client.post(
+        IMPORT_URL,
+        content="email,tryout_id\n",
+        headers={**normal_user_token_headers0, "Content-Type": "text/csv"},
+    )
+    assert response.status_code == 403
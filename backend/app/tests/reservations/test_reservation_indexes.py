@@ -0,0 +1,166 @@
+import json
+import logging
+import re
+import uuid
+from collections.abc import Generator, Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import Connection, event, text
+from sqlalchemy.sql import ClauseElement
+
+from app.core.db import engine
+from app.repository.reservations import _sum_confirmed_seats_stmt, _user_schedule_stmt
+
+logger = logging.getLogger(__name__)
+
+DELETED_PER_ACTIVE = 50
+USERS = 10_000
+
+
+@pytest.fixture
+def conn() -> Generator[Connection, None, None]:
+    """
+    삭제된 예약이 많이 쌓인 상태를 만들고, 테스트가 끝나면 모두 롤백합니다.
+
+    시험 1에 사용자 USERS명의 예약을 만들고 DELETED_PER_ACTIVE건 중 1건만 확정,
+    나머지는 삭제 상태로 둡니다. 첫 번째 사용자는 나머지 시험 모두를 예약했다가
+    삭제한 상태입니다.
+    """
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        connection.execute(
+            text(
+                "INSERT INTO users (id, email, is_active, is_superuser, hashed_password) "
+                "SELECT gen_random_uuid(), 'explain-' || i || '@example.com', "
+                "true, false, '' FROM generate_series(1, :users) AS i"
+            ),
+            {"users": USERS},
+        )
+        connection.execute(
+            text(
+                "INSERT INTO reservations (user_id, tryout_id, reserved_seats, status) "
+                "SELECT id, 1, 1, CASE WHEN row_number() OVER (ORDER BY email) "
+                "% :ratio = 1 THEN 'confirmed' ELSE 'deleted' END::reservation_status "
+                "FROM users WHERE email LIKE 'explain-%'"
+            ),
+            {"ratio": DELETED_PER_ACTIVE},
+        )
+        connection.execute(
+            text(
+                "INSERT INTO reservations (user_id, tryout_id, reserved_seats, status) "
+                "SELECT users.id, tryouts.id, 1, 'deleted' FROM users, tryouts "
+                "WHERE users.email = 'explain-1@example.com' AND tryouts.id <> 1"
+            )
+        )
+        connection.execute(text("ANALYZE reservations"))
+        yield connection
+        transaction.rollback()
+
+
+def _index_names(node: dict[str, Any]) -> Iterator[str]:
+    if "Index Name" in node:
+        yield node["Index Name"]
+    for child in node.get("Plans", []):
+        yield from _index_names(child)
+
+
+def _explain(conn: Connection, stmt: ClauseElement) -> dict[str, Any]:
+    sql = stmt.compile(bind=conn, compile_kwargs={"literal_binds": True})
+    row = conn.execute(
+        text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")
+    ).scalar_one()
+    plan = (row if isinstance(row, list) else json.loads(row))[0]
+    return {
+        "indexes": set(_index_names(plan["Plan"])),
+        "buffers": plan["Plan"]["Shared Hit Blocks"]
+        + plan["Plan"]["Shared Read Blocks"],
+        "time": plan["Execution Time"],
+    }
+
+
+# ✅ 사용자 시간표는 uq_user_tryout을, 확정 좌석 합계는 부분 인덱스를 사용하고
+# 부분 인덱스가 없던 이전보다 읽는 블록이 적음
+def test_active_reservation_queries_use_indexes(conn: Connection) -> None:
+    # 사용자별 예약은 (user_id, tryout_id)당 한 건이므로 일반적인 사용자로 측정합니다.
+    user_id = conn.execute(
+        text("SELECT id FROM users WHERE email = 'explain-2@example.com'")
+    ).scalar_one()
+    assert isinstance(user_id, uuid.UUID)
+    queries: dict[str, tuple[ClauseElement, str]] = {
+        "user_schedule": (
+            _user_schedule_stmt(user_id),
+            "uq_user_tryout",
+        ),
+        "sum_confirmed_seats": (
+            _sum_confirmed_seats_stmt(1),
+            "ix_reservations_tryout_id_status_active",
+        ),
+    }
+
+    # When: 부분 인덱스가 있을 때(after)와 마이그레이션 이전 인덱스 구성(before)
+    after = {name: _explain(conn, stmt) for name, (stmt, _) in queries.items()}
+    with conn.begin_nested() as savepoint:
+        conn.execute(text("DROP INDEX ix_reservations_tryout_id_status_active"))
+        conn.execute(
+            text(
+                "CREATE INDEX ix_reservations_user_id_status "
+                "ON reservations (user_id, status)"
+            )
+        )
+        conn.execute(text("ANALYZE reservations"))
+        before = {name: _explain(conn, stmt) for name, (stmt, _) in queries.items()}
+        savepoint.rollback()
+
+    for name in queries:
+        logger.info(
+            "%s: before %d blocks %.2fms -> after %d blocks %.2fms",
+            name,
+            before[name]["buffers"],
+            before[name]["time"],
+            after[name]["buffers"],
+            after[name]["time"],
+        )
+
+    # Then
+    for name, (_, index) in queries.items():
+        assert index in after[name]["indexes"]
+    assert (
+        "ix_reservations_tryout_id_status_active"
+        not in before["sum_confirmed_seats"]["indexes"]
+    )
+    assert (
+        after["sum_confirmed_seats"]["buffers"]
+        < before["sum_confirmed_seats"]["buffers"]
+    )
+
+
+# ✅ 상태를 상수로 렌더링해 generic plan에서도 부분 인덱스를 사용
+def test_sum_confirmed_seats_generic_plan_uses_partial_index(conn: Connection) -> None:
+    # Given: 실제로 실행되는 SQL과 파라미터
+    executed: list[tuple[str, dict[str, Any]]] = []
+
+    def on_execute(*args: Any) -> None:
+        executed.append((args[2], args[3]))
+
+    event.listen(conn, "before_cursor_execute", on_execute)
+    conn.execute(_sum_confirmed_seats_stmt(1))
+    event.remove(conn, "before_cursor_execute", on_execute)
+    [(sql, params)] = executed
+
+    # When: 파라미터를 $n으로 바꿔 prepared statement의 generic plan을 확인
+    names = re.findall(r"%\((\w+)\)s", sql)
+    for i, name in enumerate(names, start=1):
+        sql = sql.replace(f"%({name})s", f"${i}", 1)
+    conn.execute(text("SET LOCAL plan_cache_mode = force_generic_plan"))
+    conn.exec_driver_sql(f"PREPARE sum_confirmed_seats AS {sql}")
+    args = ", ".join(repr(params[name]) for name in names)
+    row = conn.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) EXECUTE sum_confirmed_seats({args})"
+    ).scalar_one()
+    conn.exec_driver_sql("DEALLOCATE sum_confirmed_seats")
+    plan = (row if isinstance(row, list) else json.loads(row))[0]
+
+    # Then
+    assert "'confirmed'" in sql
+    assert "ix_reservations_tryout_id_status_active" in set(_index_names(plan["Plan"]))
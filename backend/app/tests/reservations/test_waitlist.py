@@ -0,0 +1,247 @@
+import time
+import uuid
+from collections.abc import Generator
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, col, delete, select
+
+from app.core.config import settings
+from app.models.reservations import Reservation, ReservationStatus
+from app.models.tryouts import Tryout
+from app.models.users import User
+from app.models.waitlist import WaitlistEntry, WaitlistStatus
+from app.services.waitlist import WaitlistService
+
+
+@pytest.fixture()
+def full_tryout(db: Session) -> Generator[tuple[int, int], None, None]:
+    """정원 2명이 모두 확정된 시험과 그 확정 예약 id."""
+    now = datetime.now()
+    tryout = Tryout(
+        name="Waitlist Tryout",
+        start_time=now + timedelta(days=30),
+        end_time=now + timedelta(days=30, hours=2),
+        registration_start_time=now - timedelta(days=1),
+        registration_end_time=now + timedelta(days=20),
+        max_capacity=2,
+        confirmed_reserved_count=2,
+    )
+    holder = User(email=f"waitlist-{uuid.uuid4()}@example.com", hashed_password="")
+    db.add_all([tryout, holder])
+    db.commit()
+
+    reservation = Reservation(
+        user_id=holder.id,
+        tryout_id=tryout.id,
+        reserved_seats=2,
+        status=ReservationStatus.confirmed,
+    )
+    db.add(reservation)
+    db.commit()
+
+    yield tryout.id, reservation.id
+
+    db.execute(delete(WaitlistEntry).where(col(WaitlistEntry.tryout_id) == tryout.id))
+    db.execute(delete(Reservation).where(col(Reservation.tryout_id) == tryout.id))
+    db.execute(delete(Tryout).where(col(Tryout.id) == tryout.id))
+    db.commit()
+
+
+def add_waiting_users(db: Session, tryout_id: int, seats: list[int]) -> list[int]:
+    users = [
+        User(email=f"waitlist-{uuid.uuid4()}@example.com", hashed_password="")
+        for _ in seats
+    ]
+    db.add_all(users)
+    db.commit()
+
+    entries = [
+        WaitlistEntry(user_id=user.id, tryout_id=tryout_id, reserved_seats=n)
+        for user, n in zip(users, seats, strict=True)
+    ]
+    db.add_all(entries)
+    db.commit()
+    return [entry.id for entry in entries]
+
+
+def waitlist_statuses(db: Session, entry_ids: list[int]) -> list[str]:
+    db.expire_all()
+    entries = db.exec(
+        select(WaitlistEntry)
+        .where(col(WaitlistEntry.id).in_(entry_ids))
+        .order_by(col(WaitlistEntry.id))
+    ).all()
+    return [entry.status for entry in entries]
+
+
+# ✅ 정원이 가득 찬 시험에 대기 등록 시 대기 순번 반환
+def test_join_waitlist(
+    client: TestClient,
+    normal_user_token_headers0: dict[str, str],
+    normal_user_token_headers1: dict[str, str],
+    full_tryout: tuple[int, int],
+) -> None:
+    tryout_id, _ = full_tryout
+
+    first = client.post(
+        f"{settings.API_V1_STR}/tryouts/{tryout_id}/waitlist?reserved_seats=1",
+        headers=normal_user_token_headers0,
+    )
+    second = client.post(
+        f"{settings.API_V1_STR}/tryouts/{tryout_id}/waitlist?reserved_seats=1",
+        headers=normal_user_token_headers1,
+    )
+
+    assert first.status_code == 200
+    assert first.json()["status"] == WaitlistStatus.waiting
+    assert first.json()["position"] == 1
+    assert second.json()["position"] == 2
+
+    # 같은 시험에 다시 등록할 수 없습니다.
+    duplicated = client.post(
+        f"{settings.API_V1_STR}/tryouts/{tryout_id}/waitlist?reserved_seats=1",
+        headers=normal_user_token_headers0,
+    )
+    assert duplicated.status_code == 400
+
+
+# ✅ 남은 좌석이 있는 시험은 대기 등록 불가
+def test_join_waitlist_with_available_seats(
+    client: TestClient, normal_user_token_headers0: dict[str, str]
+) -> None:
+    response = client.post(
+        f"{settings.API_V1_STR}/tryouts/1/waitlist?reserved_seats=1",
+        headers=normal_user_token_headers0,
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "남은 좌석이 있어 바로 예약할 수 있습니다."
+
+
+# ✅ 확정 예약 삭제 시 대기자가 백그라운드에서 자동 승격
+def test_delete_confirmed_reservation_promotes_waitlist(
+    client: TestClient,
+    db: Session,
+    superuser_token_headers: dict[str, str],
+    full_tryout: tuple[int, int],
+) -> None:
+    # Given: 1명, 1명, 1명 순서의 대기자
+    tryout_id, reservation_id = full_tryout
+    entry_ids = add_waiting_users(db, tryout_id, [1, 1, 1])
+
+    # When: 2석을 가진 확정 예약이 삭제됨
+    response = client.delete(
+        f"{settings.API_V1_STR}/reservations/{reservation_id}/delete",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+
+    # Then: 앞의 두 명만 순서대로 대기(pending) 예약으로 승격되고, 좌석은 어드민이
+    # 확정할 때 차지함
+    deadline = time.monotonic() + 10
+    while waitlist_statuses(db, entry_ids)[:2] != [WaitlistStatus.promoted] * 2:
+        assert time.monotonic() < deadline, "대기자가 승격되지 않았습니다."
+        time.sleep(0.05)
+
+    assert waitlist_statuses(db, entry_ids)[2] == WaitlistStatus.waiting
+    promoted = db.exec(
+        select(Reservation).where(
+            col(Reservation.tryout_id) == tryout_id,
+            col(Reservation.status) == ReservationStatus.pending,
+        )
+    ).all()
+    assert len(promoted) == 2
+    tryout = db.get(Tryout, tryout_id)
+    assert tryout is not None
+    assert tryout.confirmed_reserved_count == 0
+
+    response = client.post(
+        f"{settings.API_V1_STR}/reservations/{promoted[0].id}/confirm",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    db.refresh(tryout)
+    assert tryout.confirmed_reserved_count == 1
+
+
+# ✅ 앞선 대기자가 들어갈 좌석이 없으면 뒤의 대기자도 승격하지 않음 (FIFO)
+def test_promote_keeps_fifo_order(db: Session, full_tryout: tuple[int, int]) -> None:
+    # Given: 2명, 1명 순서의 대기자와 1석의 빈 좌석
+    tryout_id, _ = full_tryout
+    entry_ids = add_waiting_users(db, tryout_id, [2, 1])
+    tryout = db.get(Tryout, tryout_id)
+    assert tryout is not None
+    tryout.confirmed_reserved_count = 1
+    db.add(tryout)
+    db.commit()
+
+    # When
+    with Session(db.get_bind()) as session:
+        WaitlistService(session).promote(tryout_id, limit=10)
+
+    # Then
+    assert waitlist_statuses(db, entry_ids) == [WaitlistStatus.waiting] * 2
+    db.refresh(tryout)
+    assert tryout.confirmed_reserved_count == 1
+
+
+# ✅ 대기 중 같은 시험을 예약한 대기자는 승격하지 않고 취소
+def test_promote_cancels_entry_with_existing_reservation(
+    db: Session, full_tryout: tuple[int, int]
+) -> None:
+    tryout_id, _ = full_tryout
+    entry_ids = add_waiting_users(db, tryout_id, [1, 1])
+    first = db.get(WaitlistEntry, entry_ids[0])
+    assert first is not None
+    db.add(Reservation(user_id=first.user_id, tryout_id=tryout_id, reserved_seats=1))
+    tryout = db.get(Tryout, tryout_id)
+    assert tryout is not None
+    tryout.confirmed_reserved_count = 1
+    db.add(tryout)
+    db.commit()
+
+    with Session(db.get_bind()) as session:
+        WaitlistService(session).promote(tryout_id, limit=10)
+
+    assert waitlist_statuses(db, entry_ids) == [
+        WaitlistStatus.cancelled,
+        WaitlistStatus.promoted,
+    ]
+    db.refresh(tryout)
+    assert tryout.confirmed_reserved_count == 1
+
+
+# ✅ 승격 중 잠금과 함께 다시 읽은 tryout은 이미 로드된 이전 확정 인원을 사용하지 않음
+def test_promote_reloads_tryout_under_row_lock(
+    db: Session, full_tryout: tuple[int, int], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Given: 빈 좌석 2석이 로드된 세션과 2명의 대기자
+    monkeypatch.setattr(settings, "ADMISSION_ENGINE", "row_lock")
+    tryout_id, _ = full_tryout
+    entry_ids = add_waiting_users(db, tryout_id, [1, 1])
+    tryout = db.get(Tryout, tryout_id)
+    assert tryout is not None
+    tryout.confirmed_reserved_count = 0
+    db.add(tryout)
+    db.commit()
+
+    with Session(db.get_bind()) as session:
+        service = WaitlistService(session)
+        # promote의 첫 조회처럼 잠금 없이 읽은 tryout이 세션에 남아 있음
+        loaded = service.admission.load_tryout(tryout_id, for_update=False)
+        assert loaded.confirmed_reserved_count == 0
+
+        # When: 다른 트랜잭션이 1석을 확정한 뒤 승격
+        tryout.confirmed_reserved_count = 1
+        db.add(tryout)
+        db.commit()
+        service.promote(tryout_id, limit=10)
+
+    # Then: 남은 1석만큼만 승격됨
+    assert waitlist_statuses(db, entry_ids) == [
+        WaitlistStatus.promoted,
+        WaitlistStatus.waiting,
+    ]
+    db.refresh(tryout)
+    assert tryout.confirmed_reserved_count == 1
@@ -0,0 +1,96 @@
+import uuid
+from collections.abc import Generator
+from datetime import datetime, timedelta
+
+import pytest
+from sqlmodel import Session, col, delete
+
+from app.core.db import engine
+from app.models.reservations import Reservation, ReservationStatus
+from app.models.tryouts import Tryout
+from app.models.users import User
+from app.services.reconciliation import CountDrift, ReconciliationService
+
+
+@pytest.fixture()
+def drifted_tryout(db: Session) -> Generator[int, None, None]:
+    """확정 예약 좌석 합계는 3인데 확정 인원이 5로 기록된 시험."""
+    now = datetime.now()
+    tryout = Tryout(
+        name="Reconcile Tryout",
+        start_time=now + timedelta(days=10),
+        end_time=now + timedelta(days=10, hours=2),
+        registration_start_time=now - timedelta(days=1),
+        registration_end_time=now + timedelta(days=7),
+        max_capacity=10,
+        confirmed_reserved_count=5,
+    )
+    users = [
+        User(email=f"reconcile-{uuid.uuid4()}@example.com", hashed_password="")
+        for _ in range(3)
+    ]
+    db.add_all([tryout, *users])
+    db.commit()
+
+    db.add_all(
+        [
+            Reservation(
+                user_id=users[0].id,
+                tryout_id=tryout.id,
+                reserved_seats=1,
+                status=ReservationStatus.confirmed,
+            ),
+            Reservation(
+                user_id=users[1].id,
+                tryout_id=tryout.id,
+                reserved_seats=2,
+                status=ReservationStatus.confirmed,
+            ),
+            Reservation(user_id=users[2].id, tryout_id=tryout.id, reserved_seats=4),
+        ]
+    )
+    db.commit()
+
+    yield tryout.id
+
+    db.execute(delete(Reservation).where(col(Reservation.tryout_id) == tryout.id))
+    db.execute(delete(Tryout).where(col(Tryout.id) == tryout.id))
+    db.commit()
+
+
+# ✅ 확정 인원과 확정 예약 좌석 합계의 차이를 보고하고 보정
+def test_reconcile_reports_and_repairs_drift(db: Session, drifted_tryout: int) -> None:
+    with Session(engine) as session:
+        service = ReconciliationService(session)
+
+        # 보정 없이 실행하면 차이만 보고합니다.
+        report = service.reconcile(chunk_size=2)
+        assert CountDrift(drifted_tryout, 5, 3) in report.drifts
+        assert report.repaired == []
+
+        assert service.repair(drifted_tryout)
+
+    tryout = db.get(Tryout, drifted_tryout)
+    assert tryout is not None
+    db.refresh(tryout)
+    assert tryout.confirmed_reserved_count == 3
+
+    with Session(engine) as session:
+        report = ReconciliationService(session).reconcile()
+    assert drifted_tryout not in [drift.tryout_id for drift in report.drifts]
+
+
+# ✅ 다른 트랜잭션이 잠근 tryout은 기다리지 않고 건너뜀
+def test_repair_skips_locked_tryout(db: Session, drifted_tryout: int) -> None:
+    with Session(engine) as holder:
+        holder.get(Tryout, drifted_tryout, with_for_update=True)
+
+        with Session(engine) as session:
+            assert not ReconciliationService(session).repair(drifted_tryout)
+
+        holder.rollback()
+
+    tryout = db.get(Tryout, drifted_tryout)
+    assert tryout is not None
+    db.refresh(tryout)
+    assert tryout.confirmed_reserved_count == 5
@@ -0,0 +1,103 @@
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.cache import tryout_page_cache
+from app.core.config import settings
+from app.models.tryouts import Tryout, TryoutCreate
+from app.repository.tryouts import TryoutRepository
+from app.services.registration_window import (
+    RegistrationWindowScheduler,
+    registration_windows,
+)
+from app.services.tryouts import TryoutService
+
+
+def create_tryout(db: Session, registration_start: datetime) -> Tryout:
+    tryout = TryoutRepository(db).create(
+        TryoutCreate(
+            name="Window Tryout",
+            start_time=registration_start + timedelta(days=5),
+            end_time=registration_start + timedelta(days=5, hours=2),
+            registration_start_time=registration_start,
+            registration_end_time=registration_start + timedelta(days=1),
+            max_capacity=10,
+        )
+    )
+    db.commit()
+    return tryout
+
+
+# ✅ 신청 기간이 아닌 시험은 대기열/트랜잭션에 들어가기 전에 거절
+def test_reserve_rejects_closed_tryout_before_locking(
+    client: TestClient, normal_user_token_headers0: dict[str, str]
+) -> None:
+    # Given: 신청 기간이 지난 시험 7과 신청 기간인 시험 1의 상태를 읽어 둠
+    registration_windows.load(datetime.now())
+    assert 1 in registration_windows.open_ids
+
+    # When
+    with patch.object(TryoutService, "_reserve") as reserve:
+        response = client.post(
+            f"{settings.API_V1_STR}/tryouts/7/reserve?reserved_seats=1",
+            headers=normal_user_token_headers0,
+        )
+
+    # Then
+    reserve.assert_not_called()
+    assert response.status_code == 400
+    assert "신청 기간이 아닙니다." in response.text
+
+
+# ✅ 신청 시작/마감 시각에 상태가 바뀌고, 바뀌기 직전에도 열린 시험은 거절하지 않음
+def test_scheduler_flips_state_at_window_boundaries(db: Session) -> None:
+    now = datetime.now()
+    tryout = create_tryout(db, registration_start=now + timedelta(hours=1))
+    window_start = tryout.registration_start_time
+    window_end = tryout.registration_end_time
+    scheduler = RegistrationWindowScheduler(refresh_seconds=60)
+
+    # Given: 신청 시작 전
+    scheduler.load(now)
+    assert scheduler.is_closed(tryout.id, now)
+    assert scheduler.next_boundary(now) == min(
+        b for b in scheduler._boundaries if b > now
+    )
+    assert window_start in scheduler._boundaries
+
+    # 신청 시작 시각이 되었지만 아직 상태가 바뀌기 전이어도 거절하지 않음
+    assert not scheduler.is_closed(tryout.id, window_start)
+
+    # When: 신청 시작 시각에 상태가 바뀌면 목록 캐시도 무효화됨
+    version = tryout_page_cache.version
+    scheduler.flip(window_start)
+    assert tryout.id in scheduler.open_ids
+    assert tryout_page_cache.version > version
+
+    # 마감 직후 상태가 바뀌기 전에는 DB 검증에 맡김
+    after_end = window_end + timedelta(microseconds=1)
+    assert not scheduler.is_closed(tryout.id, after_end)
+    scheduler.flip(after_end)
+    assert scheduler.is_closed(tryout.id, after_end)
+
+    # 스케줄러가 모르는 시험은 거절하지 않음
+    assert not scheduler.is_closed(tryout.id + 1, now)
+
+
+# ✅ 백그라운드 스레드는 다음 경계 시각에 깨어나 상태를 바꿈
+def test_scheduler_thread_wakes_at_next_boundary(db: Session) -> None:
+    tryout = create_tryout(db, registration_start=datetime.now() + timedelta(seconds=1))
+    scheduler = RegistrationWindowScheduler(refresh_seconds=60)
+
+    scheduler.start()
+    try:
+        deadline = time.monotonic() + 5
+        while tryout.id not in scheduler.open_ids and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        scheduler.stop()
+
+    assert tryout.id in scheduler.open_ids
@@ -1,6 +1,16 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
 from fastapi.testclient import TestClient
+from sqlmodel import Session
 
 from app.core.config import settings
+from app.core.schedule import UserSchedule
+from app.models.tryouts import TryoutCreate
+from app.repository.reservations import ReservationRepository
+from app.repository.tryouts import TryoutRepository
+from app.services.reservations import ReservationService
+from app.services.tryouts import TryoutService
 
 
 def test_get_tryout_list(
@@ -113,3 +123,254 @@ def test_tryout_reservation_admin_forbidden(
     # Then: 금지됨
     assert response.status_code == 403
     assert "Admin은 시험 신청이 불가합니다." in response.text
+
+
+# ✅ 커서 방식 페이지네이션
+def test_get_tryout_list_with_cursor(
+    client: TestClient, normal_user_token_headers0: dict[str, str]
+) -> None:
+    # Given: 첫 페이지 조회 결과의 next_cursor
+    first = client.get(
+        f"{settings.API_V1_STR}/tryouts?limit=2",
+        headers=normal_user_token_headers0,
+    )
+    assert first.status_code == 200
+    first_content = first.json()
+    assert first_content["total"] is not None
+    assert first_content["next_cursor"]
+
+    # When: next_cursor로 다음 페이지 조회
+    second = client.get(
+        f"{settings.API_V1_STR}/tryouts",
+        params={"limit": 2, "cursor": first_content["next_cursor"]},
+        headers=normal_user_token_headers0,
+    )
+
+    # Then: 겹치지 않는 다음 일정이 시작 시간 순으로 반환되고, total은 계산하지 않음
+    assert second.status_code == 200
+    second_content = second.json()
+    assert second_content["total"] is None
+    first_ids = {t["id"] for t in first_content["items"]}
+    assert all(t["id"] not in first_ids for t in second_content["items"])
+    assert (
+        first_content["items"][-1]["start_time"]
+        <= second_content["items"][0]["start_time"]
+    )
+
+
+# ✅ 잘못된 커서는 400
+def test_get_tryout_list_with_invalid_cursor(
+    client: TestClient, normal_user_token_headers0: dict[str, str]
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/tryouts?cursor=invalid",
+        headers=normal_user_token_headers0,
+    )
+    assert response.status_code == 400
+    assert "잘못된 커서입니다." in response.text
+
+
+# ✅ 목록은 캐시되지만, 예약/확정 이후에는 isApplied와 확정 인원이 바로 반영됨
+def test_tryout_list_cache_reflects_reservation_and_confirmation(
+    client: TestClient,
+    db: Session,
+    normal_user_token_headers0: dict[str, str],
+    superuser_token_headers: dict[str, str],
+) -> None:
+    # Given: 곧 시작하는 시험 (목록 맨 앞에 위치)
+    now = datetime.now()
+    tryout = TryoutRepository(db).create(
+        TryoutCreate(
+            name="Cached Tryout",
+            start_time=now + timedelta(hours=1),
+            end_time=now + timedelta(hours=2),
+            registration_start_time=now - timedelta(days=1),
+            registration_end_time=now + timedelta(minutes=30),
+            max_capacity=10,
+        )
+    )
+    db.commit()
+    url = f"{settings.API_V1_STR}/tryouts?limit=100"
+
+    def find_tryout() -> dict[str, object]:
+        response = client.get(url, headers=normal_user_token_headers0)
+        assert response.status_code == 200
+        return next(t for t in response.json()["items"] if t["id"] == tryout.id)
+
+    assert find_tryout()["isApplied"] is False
+
+    # When: 예약 신청 후 어드민이 확정
+    reserve = client.post(
+        f"{settings.API_V1_STR}/tryouts/{tryout.id}/reserve?reserved_seats=3",
+        headers=normal_user_token_headers0,
+    )
+    assert reserve.status_code == 200
+    assert find_tryout()["isApplied"] is True
+
+    confirm = client.post(
+        f"{settings.API_V1_STR}/reservations/{reserve.json()['id']}/confirm",
+        headers=superuser_token_headers,
+    )
+    assert confirm.status_code == 200
+
+    # Then: 캐시된 목록에도 확정 인원이 반영됨
+    assert find_tryout()["confirmed_reserved_count"] == 3
+
+
+# ✅ 목록 조회로 캐시된 시간표로 중복/동시간대 신청을 DB 조회 없이 거절하고, 삭제 후 다시 신청 가능
+def test_reserve_checks_use_cached_user_schedule(
+    client: TestClient, normal_user_token_headers0: dict[str, str]
+) -> None:
+    # Given: 시험 1 예약 후 목록 조회로 시간표가 캐시됨
+    reserve = client.post(
+        f"{settings.API_V1_STR}/tryouts/1/reserve?reserved_seats=1",
+        headers=normal_user_token_headers0,
+    )
+    assert reserve.status_code == 200
+    client.get(f"{settings.API_V1_STR}/tryouts", headers=normal_user_token_headers0)
+
+    # When: 같은 시험 / 같은 시간대의 다른 시험 신청
+    with patch.object(ReservationRepository, "get_user_schedule") as get_schedule:
+        duplicate = client.post(
+            f"{settings.API_V1_STR}/tryouts/1/reserve?reserved_seats=1",
+            headers=normal_user_token_headers0,
+        )
+        overlapping = client.post(
+            f"{settings.API_V1_STR}/tryouts/2/reserve?reserved_seats=1",
+            headers=normal_user_token_headers0,
+        )
+    get_schedule.assert_not_called()
+
+    # Then
+    assert "이미 신청된 시험입니다." in duplicate.text
+    assert "동시간대에 이미 예약된 시험이 존재합니다." in overlapping.text
+
+    # 예약을 삭제하면 시간표가 무효화되어 같은 시간대에 다시 신청할 수 있음
+    client.delete(
+        f"{settings.API_V1_STR}/reservations/{reserve.json()['id']}/delete",
+        headers=normal_user_token_headers0,
+    )
+    retry = client.post(
+        f"{settings.API_V1_STR}/tryouts/2/reserve?reserved_seats=1",
+        headers=normal_user_token_headers0,
+    )
+    assert retry.status_code == 200
+
+
+# ✅ 시간표 캐시에 없는 기존 예약이나 동시 신청은 500이 아닌 중복 신청으로 거절
+def test_reserve_duplicate_with_stale_schedule(
+    client: TestClient, normal_user_token_headers0: dict[str, str]
+) -> None:
+    # Given: 시험 1 예약
+    url = f"{settings.API_V1_STR}/tryouts/1/reserve?reserved_seats=1"
+    assert client.post(url, headers=normal_user_token_headers0).status_code == 200
+
+    # When: 다른 워커에서 예약되어 캐시된 시간표에 없는 상태로 다시 신청
+    with patch.object(
+        ReservationService, "get_user_schedule", return_value=UserSchedule([])
+    ):
+        stale = client.post(url, headers=normal_user_token_headers0)
+        # 동시 신청: 기존 예약/동시간대 조회 이후 다른 요청이 먼저 INSERT한 경우
+        with (
+            patch.object(
+                ReservationRepository, "get_by_user_and_tryout", return_value=None
+            ),
+            patch.object(
+                ReservationRepository, "has_overlapping_reservation", return_value=False
+            ),
+        ):
+            concurrent = client.post(url, headers=normal_user_token_headers0)
+
+    # Then
+    for response in (stale, concurrent):
+        assert response.status_code == 400
+        assert "이미 신청된 시험입니다." in response.text
+
+
+# ✅ 정원이 찬 시험과 중복 신청은 tryout 행 잠금 전에 스냅샷으로 거절하고, 시험이 바뀌면 다시 검증
+def test_reserve_prechecks_snapshot_before_locking(
+    client: TestClient, db: Session, normal_user_token_headers0: dict[str, str]
+) -> None:
+    # Given: 정원이 가득 찬 시험
+    now = datetime.now()
+    tryout = TryoutRepository(db).create(
+        TryoutCreate(
+            name="Full Tryout",
+            start_time=now + timedelta(days=30),
+            end_time=now + timedelta(days=30, hours=1),
+            registration_start_time=now - timedelta(days=1),
+            registration_end_time=now + timedelta(days=7),
+            max_capacity=1,
+            confirmed_reserved_count=1,
+        )
+    )
+    db.commit()
+    url = f"{settings.API_V1_STR}/tryouts/{tryout.id}/reserve?reserved_seats=1"
+
+    # When: 신청
+    with patch.object(TryoutService, "_reserve") as reserve:
+        full = client.post(url, headers=normal_user_token_headers0)
+    reserve.assert_not_called()
+
+    # Then: 잠금 없이 정원 초과로 거절
+    assert full.status_code == 400
+    assert "정원이 가득 찼습니다." in full.text
+
+    # 좌석이 반환되면 커밋 직후 스냅샷이 무효화되어 신청할 수 있고,
+    # 같은 시험을 다시 신청하면 잠금 없이 중복으로 거절됨
+    tryout.confirmed_reserved_count = 0
+    db.add(tryout)
+    db.commit()
+    assert client.post(url, headers=normal_user_token_headers0).status_code == 200
+    with patch.object(TryoutService, "_reserve") as reserve:
+        duplicate = client.post(url, headers=normal_user_token_headers0)
+    reserve.assert_not_called()
+    assert "이미 신청된 시험입니다." in duplicate.text
+
+
+# ✅ 잠금 후 검증은 캐시된 시간표가 아닌 DB 기준으로 동시간대 예약을 확인
+def test_reserve_revalidates_overlap_without_cache(
+    client: TestClient, normal_user_token_headers0: dict[str, str]
+) -> None:
+    # Given: 시험 1 예약
+    reserve = client.post(
+        f"{settings.API_V1_STR}/tryouts/1/reserve?reserved_seats=1",
+        headers=normal_user_token_headers0,
+    )
+    assert reserve.status_code == 200
+
+    # When: 캐시된 시간표에 예약이 없는 상태로 같은 시간대의 시험 2 신청
+    with patch.object(
+        ReservationService, "get_user_schedule", return_value=UserSchedule([])
+    ):
+        overlapping = client.post(
+            f"{settings.API_V1_STR}/tryouts/2/reserve?reserved_seats=1",
+            headers=normal_user_token_headers0,
+        )
+
+    # Then: 사전 검증은 통과하지만 잠금 후 검증에서 거절
+    assert overlapping.status_code == 400
+    assert "동시간대에 이미 예약된 시험이 존재합니다." in overlapping.text
+
+
+# ✅ open_now=true이면 현재 신청 기간인 시험만 조회
+def test_get_tryout_list_open_now(
+    client: TestClient, normal_user_token_headers0: dict[str, str]
+) -> None:
+    url = f"{settings.API_V1_STR}/tryouts?limit=100"
+    all_upcoming = client.get(url, headers=normal_user_token_headers0).json()
+    response = client.get(f"{url}&open_now=true", headers=normal_user_token_headers0)
+
+    assert response.status_code == 200
+    content = response.json()
+    now = datetime.now()
+    assert content["items"]
+    assert not {item["id"] for item in content["items"]} & {6, 7, 8, 9, 10}
+    assert all(
+        datetime.fromisoformat(item["registration_start_time"])
+        <= now
+        <= datetime.fromisoformat(item["registration_end_time"])
+        for item in content["items"]
+    )
+    # 신청 기간이 지난 시험 6~10은 목록에는 있지만 open_now 목록에서는 빠짐
+    assert content["total"] <= all_upcoming["total"] - 5
@@ -0,0 +1,101 @@
+from collections.abc import Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.error_handler import register_error_handlers
+from app.main import custom_generate_unique_id, lifespan
+from app.routers.main import build_api_router
+
+
+@pytest.fixture(scope="module")
+def async_client() -> Generator[TestClient, None, None]:
+    app = FastAPI(
+        generate_unique_id_function=custom_generate_unique_id, lifespan=lifespan
+    )
+    register_error_handlers(app)
+    app.include_router(build_api_router("async"), prefix=settings.API_V1_STR)
+    with TestClient(app) as c:
+        yield c
+
+
+def test_async_routes_replace_sync_routes() -> None:
+    # Given: async 모드 라우터
+    api_router = build_api_router("async")
+
+    # Then: 경로/메서드마다 라우트는 하나만 등록되고, 조회 API는 async 핸들러를 사용
+    routes = [r for r in api_router.routes if isinstance(r, APIRoute)]
+    keys = [(r.path, tuple(sorted(r.methods))) for r in routes]
+    assert len(keys) == len(set(keys))
+    endpoints = {r.path: r.endpoint for r in routes}
+    assert endpoints["/tryouts"].__module__ == "app.routers.tryouts_async"
+    assert (
+        endpoints["/reservations/{reservation_id}/confirm"].__module__
+        == "app.routers.reservations"
+    )
+
+
+def test_async_get_tryout_list(
+    async_client: TestClient, normal_user_token_headers0: dict[str, str]
+) -> None:
+    response = async_client.get(
+        f"{settings.API_V1_STR}/tryouts?limit=2",
+        headers=normal_user_token_headers0,
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert len(content["items"]) == 2
+    assert "isApplied" in content["items"][0]
+    assert content["next_cursor"]
+
+
+def test_async_reserve_and_confirm(
+    async_client: TestClient,
+    superuser_token_headers: dict[str, str],
+    normal_user_token_headers0: dict[str, str],
+) -> None:
+    # Given: async 라우터로 예약 신청
+    reserve = async_client.post(
+        f"{settings.API_V1_STR}/tryouts/1/reserve?reserved_seats=2",
+        headers=normal_user_token_headers0,
+    )
+    assert reserve.status_code == 200
+    reservation_id = reserve.json()["id"]
+
+    # When: 중복 신청 / 단건 조회 / (동기 라우터로 대체되는) 확정 처리
+    duplicate = async_client.post(
+        f"{settings.API_V1_STR}/tryouts/1/reserve?reserved_seats=2",
+        headers=normal_user_token_headers0,
+    )
+    detail = async_client.get(
+        f"{settings.API_V1_STR}/reservations/{reservation_id}",
+        headers=normal_user_token_headers0,
+    )
+    confirm = async_client.post(
+        f"{settings.API_V1_STR}/reservations/{reservation_id}/confirm",
+        headers=superuser_token_headers,
+    )
+
+    # Then
+    assert duplicate.status_code == 400
+    assert "이미 신청된 시험입니다." in duplicate.text
+    assert detail.status_code == 200
+    assert detail.json()["reserved_seats"] == 2
+    assert confirm.status_code == 200
+    assert confirm.json()["status"] == "confirmed"
+
+
+# ✅ async 모드에서도 동기 라우터의 고정 경로가 경로 변수 라우트에 가려지지 않음
+def test_async_mode_serves_sync_static_routes(
+    async_client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    response = async_client.get(
+        f"{settings.API_V1_STR}/reservations/export?format=csv",
+        headers=superuser_token_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.text.startswith("id,user_id,tryout_id,reserved_seats,status")
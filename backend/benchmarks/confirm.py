@@ -0,0 +1,120 @@
+"""
+예약 확정 처리량 벤치마크: 단건 확정(`confirm_reservation`) vs 일괄 확정(`confirm_reservations`).
+
+같은 크기의 대기 예약을 경로마다 새로 생성해 모두 확정하고, 걸린 시간과 초당 확정 건수를
+비교합니다. 생성한 데이터는 경로마다 실행 후 삭제됩니다.
+
+    python -m benchmarks.confirm --size 10000 --workers 8
+"""
+
+import argparse
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.db import engine
+from app.models.reservations import ReservationBatchConfirmRequest
+from app.services.reservations import ReservationService
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def seed(size: int) -> tuple[int, list[int]]:
+    with Session(engine) as session:
+        tryout_id = session.execute(
+            text(
+                "INSERT INTO tryouts (name, start_time, end_time, "
+                "registration_start_time, registration_end_time, max_capacity, "
+                "confirmed_reserved_count) "
+                "VALUES ('bench confirm', now() + interval '10 days', "
+                "now() + interval '10 days 2 hours', now() - interval '1 day', "
+                "now() + interval '7 days', :capacity, 0) RETURNING id"
+            ),
+            {"capacity": size},
+        ).scalar_one()
+        session.execute(
+            text(
+                "INSERT INTO users (id, email, is_active, is_superuser, hashed_password) "
+                "SELECT gen_random_uuid(), 'bench-confirm-' || :tryout_id || '-' || g "
+                "|| '@example.com', true, false, '' FROM generate_series(1, :size) g"
+            ),
+            {"tryout_id": tryout_id, "size": size},
+        )
+        reservation_ids = list(
+            session.execute(
+                text(
+                    "INSERT INTO reservations (user_id, tryout_id, reserved_seats, status) "
+                    "SELECT id, :tryout_id, 1, 'pending' FROM users "
+                    "WHERE email LIKE 'bench-confirm-' || :tryout_id || '-%' "
+                    "RETURNING id"
+                ),
+                {"tryout_id": tryout_id},
+            ).scalars()
+        )
+        session.commit()
+    return tryout_id, sorted(reservation_ids)
+
+
+def cleanup(tryout_id: int) -> None:
+    with Session(engine) as session:
+        session.execute(
+            text("DELETE FROM reservations WHERE tryout_id = :id"), {"id": tryout_id}
+        )
+        session.execute(text("DELETE FROM tryouts WHERE id = :id"), {"id": tryout_id})
+        session.execute(
+            text("DELETE FROM users WHERE email LIKE 'bench-confirm-' || :id || '-%'"),
+            {"id": tryout_id},
+        )
+        session.commit()
+
+
+def confirm_one(reservation_id: int) -> None:
+    with Session(engine) as session:
+        ReservationService(session).confirm_reservation(reservation_id)
+
+
+def run_single(reservation_ids: list[int], workers: int) -> None:
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(confirm_one, reservation_ids))
+
+
+def run_batch(tryout_id: int) -> None:
+    with Session(engine) as session:
+        ReservationService(session).confirm_reservations(
+            ReservationBatchConfirmRequest(tryout_id=tryout_id)
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    logger.info("%10s %10s %12s %12s", "path", "size", "elapsed(s)", "confirms/s")
+    for path in ("single", "batch"):
+        tryout_id, reservation_ids = seed(args.size)
+        try:
+            started = time.perf_counter()
+            if path == "single":
+                run_single(reservation_ids, args.workers)
+            else:
+                run_batch(tryout_id)
+            elapsed = time.perf_counter() - started
+        finally:
+            cleanup(tryout_id)
+        logger.info(
+            "%10s %10d %12.2f %12.1f",
+            path,
+            args.size,
+            elapsed,
+            args.size / elapsed,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+벤치마크용 데이터 생성기.
+
+N명의 사용자, M개의 시험, K개의 대기(pending) 예약과 어드민 한 명을 생성합니다.
+생성한 데이터는 `bench-` 접두어로 구분되어 기존 데이터와 섞이지 않으며, 다시 실행하면
+이전 벤치마크 데이터를 지우고 새로 만듭니다.
+
+- 사용자: `bench-user-{n}@example.com` / `password123`, 어드민: `bench-admin@example.com`
+- 시험: 모두 신청 기간 중이며 서로 시간이 겹치지 않습니다. 예약은 앞쪽 절반의
+  시험에만 생성되어, 뒤쪽 절반은 예약 신청 시나리오에서 사용합니다.
+
+    python -m benchmarks.datagen --users 1000 --tryouts 200 --reservations 5000
+"""
+
+import argparse
+import logging
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.db import engine
+from app.core.security import get_password_hash
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+USER_PASSWORD = "password123"
+ADMIN_EMAIL = "bench-admin@example.com"
+
+
+@dataclass
+class Dataset:
+    admin_id: uuid.UUID
+    user_ids: list[uuid.UUID]
+    tryout_ids: list[int]
+    # (reservation_id, user_id) - id 순
+    pending_reservations: list[tuple[int, uuid.UUID]]
+
+    @property
+    def open_tryout_ids(self) -> list[int]:
+        """예약이 생성되지 않은 뒤쪽 절반의 시험."""
+        return self.tryout_ids[len(self.tryout_ids) // 2 :]
+
+
+def reset(session: Session) -> None:
+    session.execute(
+        text(
+            "DELETE FROM reservations WHERE tryout_id IN "
+            "(SELECT id FROM tryouts WHERE name LIKE 'bench tryout %')"
+        )
+    )
+    session.execute(text("DELETE FROM tryouts WHERE name LIKE 'bench tryout %'"))
+    session.execute(text("DELETE FROM users WHERE email LIKE 'bench-%@example.com'"))
+
+
+def generate(users: int, tryouts: int, reservations: int) -> Dataset:
+    seeded_tryouts = tryouts // 2
+    if reservations > users * seeded_tryouts:
+        raise ValueError("reservations must be <= users * (tryouts // 2)")
+
+    # 모든 사용자가 같은 비밀번호를 쓰므로 해시는 한 번만 계산합니다.
+    hashed_password = get_password_hash(USER_PASSWORD)
+
+    with Session(engine) as session:
+        reset(session)
+        session.execute(
+            text(
+                "INSERT INTO users (id, email, is_active, is_superuser, hashed_password) "
+                "VALUES (gen_random_uuid(), :email, true, true, :password)"
+            ),
+            {"email": ADMIN_EMAIL, "password": hashed_password},
+        )
+        session.execute(
+            text(
+                "INSERT INTO users (id, email, is_active, is_superuser, hashed_password) "
+                "SELECT gen_random_uuid(), 'bench-user-' || g || '@example.com', "
+                "true, false, :password FROM generate_series(0, :users - 1) g"
+            ),
+            {"users": users, "password": hashed_password},
+        )
+        # 2시간짜리 시험을 3시간 간격으로 배치해 서로 겹치지 않게 합니다.
+        session.execute(
+            text(
+                "INSERT INTO tryouts (name, start_time, end_time, "
+                "registration_start_time, registration_end_time, max_capacity, "
+                "confirmed_reserved_count) "
+                "SELECT 'bench tryout ' || g, "
+                "now() + interval '10 days' + g * interval '3 hours', "
+                "now() + interval '10 days' + g * interval '3 hours' "
+                "+ interval '2 hours', "
+                "now() - interval '1 day', now() + interval '7 days', 1000000, 0 "
+                "FROM generate_series(0, :tryouts - 1) g"
+            ),
+            {"tryouts": tryouts},
+        )
+        session.execute(
+            text(
+                "WITH u AS (SELECT id, row_number() OVER (ORDER BY email) - 1 AS n "
+                "FROM users WHERE email LIKE 'bench-user-%'), "
+                "t AS (SELECT id, row_number() OVER (ORDER BY start_time) - 1 AS n "
+                "FROM tryouts WHERE name LIKE 'bench tryout %') "
+                "INSERT INTO reservations (user_id, tryout_id, reserved_seats, status) "
+                "SELECT u.id, t.id, 1, 'pending' "
+                "FROM generate_series(0, :reservations - 1) g "
+                "JOIN u ON u.n = g % :users JOIN t ON t.n = g / :users"
+            ),
+            {"reservations": reservations, "users": users},
+        )
+        session.execute(text("ANALYZE users"))
+        session.execute(text("ANALYZE tryouts"))
+        session.execute(text("ANALYZE reservations"))
+        session.commit()
+        return load(session)
+
+
+def load(session: Session) -> Dataset:
+    admin_id = session.execute(
+        text("SELECT id FROM users WHERE email = :email"), {"email": ADMIN_EMAIL}
+    ).scalar_one()
+    user_ids = list(
+        session.execute(
+            text("SELECT id FROM users WHERE email LIKE 'bench-user-%' ORDER BY email")
+        ).scalars()
+    )
+    tryout_ids = list(
+        session.execute(
+            text(
+                "SELECT id FROM tryouts WHERE name LIKE 'bench tryout %' "
+                "ORDER BY start_time"
+            )
+        ).scalars()
+    )
+    pending = session.execute(
+        text(
+            "SELECT r.id, r.user_id FROM reservations r "
+            "JOIN tryouts t ON t.id = r.tryout_id "
+            "WHERE t.name LIKE 'bench tryout %' AND r.status = 'pending' "
+            "ORDER BY r.id"
+        )
+    ).all()
+    return Dataset(
+        admin_id=admin_id,
+        user_ids=user_ids,
+        tryout_ids=tryout_ids,
+        pending_reservations=[(row[0], row[1]) for row in pending],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--tryouts", type=int, default=200)
+    parser.add_argument("--reservations", type=int, default=5_000)
+    args = parser.parse_args()
+
+    dataset = generate(args.users, args.tryouts, args.reservations)
+    logger.info(
+        "users=%d tryouts=%d pending_reservations=%d",
+        len(dataset.user_ids),
+        len(dataset.tryout_ids),
+        len(dataset.pending_reservations),
+    )
+
+
+if __name__ == "__main__":
+    main()
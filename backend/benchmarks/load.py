@@ -0,0 +1,123 @@
+"""
+동기(sync) / 비동기(async) DB 모드 부하 비교 벤치마크.
+
+모드마다 `DATABASE_MODE`를 바꿔 uvicorn 서버를 띄우고, 동시 접속 클라이언트가
+시험 목록/상세 조회 API를 호출하는 동안의 지연 시간과 처리량을 측정합니다.
+`app/core/initial_data.py`로 생성한 초기 데이터(user0~9@example.com)가 필요합니다.
+
+    python -m benchmarks.load --modes sync async --concurrency 1000 --duration 30
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+import httpx
+
+from app.core.config import settings
+from benchmarks.common import Result, start_server, wait_until_ready
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+USER_PASSWORD = "password123"
+
+
+async def login(client: httpx.AsyncClient, users: int) -> list[dict[str, str]]:
+    headers = []
+    for i in range(users):
+        response = await client.post(
+            f"{settings.API_V1_STR}/utils/login/access-token",
+            data={"username": f"user{i}@example.com", "password": USER_PASSWORD},
+        )
+        response.raise_for_status()
+        token = response.json()["access_token"]
+        headers.append({"Authorization": f"Bearer {token}"})
+    return headers
+
+
+async def worker(
+    client: httpx.AsyncClient,
+    headers: dict[str, str],
+    deadline: float,
+    result: Result,
+) -> None:
+    paths = [f"{settings.API_V1_STR}/tryouts", f"{settings.API_V1_STR}/tryouts/1"]
+    i = 0
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await client.get(paths[i % len(paths)], headers=headers)
+            if response.status_code != 200:
+                result.errors += 1
+        except httpx.HTTPError:
+            result.errors += 1
+        result.latencies.append((time.perf_counter() - started) * 1000)
+        i += 1
+
+
+async def run(base_url: str, concurrency: int, duration: float) -> Result:
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+        await wait_until_ready(client)
+        headers = await login(client, users=10)
+
+        result = Result()
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(
+            *(
+                worker(client, headers[i % len(headers)], deadline, result)
+                for i in range(concurrency)
+            )
+        )
+        return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modes", nargs="+", default=["sync", "async"])
+    parser.add_argument("--concurrency", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    summary = []
+    for mode in args.modes:
+        server = start_server(mode, args.port, args.workers)
+        try:
+            result = asyncio.run(
+                run(f"http://127.0.0.1:{args.port}", args.concurrency, args.duration)
+            )
+        finally:
+            server.terminate()
+            server.wait()
+        summary.append((mode, result))
+
+    logger.info(
+        "%6s %10s %10s %10s %10s %8s",
+        "mode",
+        "req/s",
+        "p50(ms)",
+        "p95(ms)",
+        "p99(ms)",
+        "errors",
+    )
+    for mode, result in summary:
+        logger.info(
+            "%6s %10.1f %10.1f %10.1f %10.1f %8d",
+            mode,
+            len(result.latencies) / args.duration,
+            result.percentile(0.50),
+            result.percentile(0.95),
+            result.percentile(0.99),
+            result.errors,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+예약 신청 시 동시간대 중복 검사(`has_overlapping_reservation`) 지연 시간 벤치마크.
+
+tryouts 테이블 크기를 늘려가며 같은 검사를 반복 실행하고, 테이블이 커져도
+지연 시간이 일정하게 유지되는지 확인합니다. 모든 데이터는 하나의 트랜잭션 안에서
+생성되고 마지막에 롤백되므로 기존 데이터에는 영향을 주지 않습니다.
+
+    python -m benchmarks.overlap --sizes 10 1000 100000 1000000
+"""
+
+import argparse
+import logging
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.core.db import engine
+from app.repository.reservations import ReservationRepository
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+USER_RESERVATIONS = 20
+
+
+def seed(session: Session, user_id: uuid.UUID, size: int, base: datetime) -> None:
+    session.execute(
+        text(
+            "INSERT INTO users (id, email, is_active, is_superuser, hashed_password) "
+            "VALUES (:id, :email, true, false, '')"
+        ),
+        {"id": user_id, "email": f"bench-{user_id}@example.com"},
+    )
+    # 시험은 1시간 간격으로 배치하고, 각 시험은 2시간 동안 진행됩니다.
+    session.execute(
+        text(
+            "INSERT INTO tryouts (name, start_time, end_time, registration_start_time, "
+            "registration_end_time, max_capacity, confirmed_reserved_count) "
+            "SELECT 'bench ' || g, "
+            ":base + g * interval '1 hour', "
+            ":base + g * interval '1 hour' + interval '2 hours', "
+            ":base - interval '10 days', :base, 50000, 0 "
+            "FROM generate_series(1, :size) AS g"
+        ),
+        {"base": base, "size": size},
+    )
+    session.execute(
+        text(
+            "INSERT INTO reservations (user_id, tryout_id, reserved_seats, status) "
+            "SELECT :user_id, id, 1, 'pending' FROM tryouts "
+            "WHERE name LIKE 'bench %' ORDER BY random() LIMIT :limit"
+        ),
+        {"user_id": user_id, "limit": USER_RESERVATIONS},
+    )
+    session.execute(text("ANALYZE tryouts"))
+    session.execute(text("ANALYZE reservations"))
+
+
+def run(size: int, repeat: int) -> list[float]:
+    user_id = uuid.uuid4()
+    base = datetime(2100, 1, 1)
+    horizon = timedelta(hours=size)
+
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            session = Session(bind=connection)
+            seed(session, user_id, size, base)
+            repo = ReservationRepository(session)
+
+            timings = []
+            for i in range(repeat):
+                start_time = base + horizon * (i / repeat)
+                started = time.perf_counter()
+                repo.has_overlapping_reservation(
+                    user_id=user_id,
+                    start_time=start_time,
+                    end_time=start_time + timedelta(hours=2),
+                )
+                timings.append((time.perf_counter() - started) * 1000)
+            return timings
+        finally:
+            transaction.rollback()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 1_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    logger.info("%10s %10s %10s %10s", "tryouts", "p50(ms)", "p95(ms)", "max(ms)")
+    for size in args.sizes:
+        timings = sorted(run(size, args.repeat))
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        logger.info(
+            "%10d %10.3f %10.3f %10.3f",
+            size,
+            statistics.median(timings),
+            p95,
+            timings[-1],
+        )
+
+
+if __name__ == "__main__":
+    main()
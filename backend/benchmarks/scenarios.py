@@ -0,0 +1,273 @@
+"""
+예약 API 핵심 경로 부하 테스트.
+
+`benchmarks.datagen`으로 데이터를 새로 만든 뒤 uvicorn 서버를 띄우고, 시나리오마다
+정해진 수의 요청을 동시에 보내 엔드포인트별 처리량(req/s)과 p50/p95/p99 지연 시간을
+측정합니다.
+
+- login: `POST /utils/login/access-token`
+- list_tryouts: `GET /tryouts`
+- get_tryout: `GET /tryouts/{id}`
+- reserve: `POST /tryouts/{id}/reserve` (예약이 없는 시험에 사용자별로 한 번씩)
+- confirm: `POST /reservations/{id}/confirm` (생성된 대기 예약의 앞쪽 절반)
+- delete: `DELETE /reservations/{id}/delete` (생성된 대기 예약의 뒤쪽 절반, 예약자 본인)
+
+변경 전후 결과를 JSON으로 저장해 비교하면, 허용 범위를 넘은 p95 증가나 처리량 감소를
+회귀로 보고하고 종료 코드 1을 반환합니다.
+
+    python -m benchmarks.scenarios --output before.json
+    python -m benchmarks.scenarios --baseline before.json --output after.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from benchmarks.common import Result, start_server, wait_until_ready
+from benchmarks.datagen import USER_PASSWORD, Dataset, generate
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+API = settings.API_V1_STR
+SCENARIOS = ["login", "list_tryouts", "get_tryout", "reserve", "confirm", "delete"]
+
+Call = Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+
+
+def auth_headers(user_id: uuid.UUID) -> dict[str, str]:
+    # 로그인은 별도 시나리오로 측정하므로, 나머지 시나리오는 토큰을 직접 발급합니다.
+    token = create_access_token(user_id, expires_delta=timedelta(hours=1))
+    return {"Authorization": f"Bearer {token}"}
+
+
+def build_calls(scenario: str, dataset: Dataset, requests: int) -> list[Call]:
+    users = dataset.user_ids
+    headers = [auth_headers(user_id) for user_id in users]
+    half = len(dataset.pending_reservations) // 2
+
+    def call(method: str, url: str, **kwargs: Any) -> Call:
+        return lambda client: client.request(method, url, **kwargs)
+
+    if scenario == "login":
+        return [
+            call(
+                "POST",
+                f"{API}/utils/login/access-token",
+                data={
+                    "username": f"bench-user-{i % len(users)}@example.com",
+                    "password": USER_PASSWORD,
+                },
+            )
+            for i in range(requests)
+        ]
+    if scenario == "list_tryouts":
+        return [
+            call("GET", f"{API}/tryouts", headers=headers[i % len(users)])
+            for i in range(requests)
+        ]
+    if scenario == "get_tryout":
+        tryout_ids = dataset.tryout_ids
+        return [
+            call(
+                "GET",
+                f"{API}/tryouts/{tryout_ids[i % len(tryout_ids)]}",
+                headers=headers[i % len(users)],
+            )
+            for i in range(requests)
+        ]
+    if scenario == "reserve":
+        # (사용자, 시험) 쌍이 겹치지 않도록 사용자를 먼저 순회합니다.
+        open_ids = dataset.open_tryout_ids
+        count = min(requests, len(users) * len(open_ids))
+        return [
+            call(
+                "POST",
+                f"{API}/tryouts/{open_ids[i // len(users)]}/reserve",
+                params={"reserved_seats": 1},
+                headers=headers[i % len(users)],
+            )
+            for i in range(count)
+        ]
+    if scenario == "confirm":
+        admin = auth_headers(dataset.admin_id)
+        return [
+            call("POST", f"{API}/reservations/{reservation_id}/confirm", headers=admin)
+            for reservation_id, _ in dataset.pending_reservations[:half][:requests]
+        ]
+    if scenario == "delete":
+        return [
+            call(
+                "DELETE",
+                f"{API}/reservations/{reservation_id}/delete",
+                headers=auth_headers(user_id),
+            )
+            for reservation_id, user_id in dataset.pending_reservations[half:][
+                :requests
+            ]
+        ]
+    raise ValueError(f"unknown scenario: {scenario}")
+
+
+async def run_calls(
+    client: httpx.AsyncClient, calls: list[Call], concurrency: int
+) -> Result:
+    result = Result()
+    queue: asyncio.Queue[Call] = asyncio.Queue()
+    for c in calls:
+        queue.put_nowait(c)
+
+    async def worker() -> None:
+        while not queue.empty():
+            c = queue.get_nowait()
+            started = time.perf_counter()
+            try:
+                response = await c(client)
+                if response.status_code == 503:
+                    result.rejected += 1
+                elif response.status_code == 202:
+                    result.queued += 1
+                elif response.status_code >= 400:
+                    result.errors += 1
+            except httpx.HTTPError:
+                result.errors += 1
+            result.latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+async def run(
+    base_url: str,
+    dataset: Dataset,
+    scenarios: list[str],
+    requests: int,
+    concurrency: int,
+) -> dict[str, Result]:
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+        await wait_until_ready(client)
+        results = {}
+        for scenario in scenarios:
+            calls = build_calls(scenario, dataset, requests)
+            results[scenario] = await run_calls(client, calls, concurrency)
+            logger.info("%s: %d requests done", scenario, len(calls))
+        return results
+
+
+def compare(
+    current: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    tolerance: float,
+) -> list[str]:
+    regressions = []
+    for scenario, summary in current.items():
+        before = baseline.get(scenario)
+        if not before:
+            continue
+        if summary["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{scenario}: p95 {before['p95_ms']:.1f}ms -> {summary['p95_ms']:.1f}ms"
+            )
+        if summary["rps"] < before["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{scenario}: req/s {before['rps']:.1f} -> {summary['rps']:.1f}"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scenarios", nargs="+", default=SCENARIOS)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--tryouts", type=int, default=200)
+    parser.add_argument("--reservations", type=int, default=5_000)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--mode", choices=["sync", "async"], default="sync")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    dataset = generate(args.users, args.tryouts, args.reservations)
+    server = start_server(args.mode, args.port, args.workers)
+    try:
+        results = asyncio.run(
+            run(
+                f"http://127.0.0.1:{args.port}",
+                dataset,
+                args.scenarios,
+                args.requests,
+                args.concurrency,
+            )
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+    summaries = {scenario: result.summary() for scenario, result in results.items()}
+    logger.info(
+        "%12s %8s %8s %8s %8s %10s %10s %10s %10s",
+        "scenario",
+        "requests",
+        "errors",
+        "rejected",
+        "queued",
+        "req/s",
+        "p50(ms)",
+        "p95(ms)",
+        "p99(ms)",
+    )
+    for scenario, summary in summaries.items():
+        logger.info(
+            "%12s %8d %8d %8d %8d %10.1f %10.1f %10.1f %10.1f",
+            scenario,
+            summary["requests"],
+            summary["errors"],
+            summary["rejected"],
+            summary["queued"],
+            summary["rps"],
+            summary["p50_ms"],
+            summary["p95_ms"],
+            summary["p99_ms"],
+        )
+
+    if args.output:
+        config = {
+            k: v for k, v in vars(args).items() if k not in ("output", "baseline")
+        }
+        args.output.write_text(
+            json.dumps({"config": config, "results": summaries}, indent=2, default=str)
+        )
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = compare(summaries, baseline, args.tolerance)
+        for regression in regressions:
+            logger.warning("regression: %s", regression)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+목록 API 응답 직렬화의 페이지당 CPU 시간 벤치마크.
+
+DB 없이 같은 조회 결과(1000건)로 한 페이지를 만들고, 이전 방식(ORM 엔티티 -> 응답 모델
+생성 -> FastAPI의 response_model 검증/직렬화 -> json.dumps)과 조회 결과 dict를 한 번에
+인코딩하는 현재 방식(orjson)을 비교합니다.
+
+    python -m benchmarks.serialization --size 1000 --repeat 200
+"""
+
+import argparse
+import logging
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.models.common import PaginatedResponse
+from app.models.reservations import Reservation, ReservationStatus
+from app.models.tryouts import Tryout, TryoutPublic
+from app.services.reservations import _reservation_page
+from app.services.tryouts import _catalog_page, _tryout_page
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def tryout_rows(size: int) -> list[dict[str, Any]]:
+    base = datetime(2100, 1, 1, 9, 0, 0, 123456)
+    return [
+        {
+            "name": f"Tryout {i}",
+            "start_time": base + timedelta(hours=i),
+            "end_time": base + timedelta(hours=i + 2),
+            "registration_start_time": base - timedelta(days=10),
+            "registration_end_time": base - timedelta(days=3),
+            "max_capacity": 50000,
+            "confirmed_reserved_count": i,
+            "id": i,
+        }
+        for i in range(1, size + 1)
+    ]
+
+
+def reservation_rows(size: int) -> list[dict[str, Any]]:
+    user_id = uuid.uuid4()
+    return [
+        {
+            "user_id": user_id,
+            "tryout_id": i,
+            "reserved_seats": 1,
+            "status": ReservationStatus.confirmed,
+            "id": i,
+        }
+        for i in range(1, size + 1)
+    ]
+
+
+def fastapi_response(adapter: TypeAdapter[Any], content: Any) -> bytes:
+    # fastapi.routing.serialize_response와 같은 순서: 검증 -> JSON 모드 dump -> json.dumps
+    value = adapter.validate_python(content, from_attributes=True)
+    return bytes(JSONResponse(adapter.dump_python(value, mode="json")).body)
+
+
+def cases(size: int) -> dict[str, Callable[[], bytes]]:
+    tryouts = tryout_rows(size + 1)
+    reservations = reservation_rows(size + 1)
+    tryout_entities = [Tryout.model_validate(row) for row in tryouts]
+    reservation_entities = [Reservation.model_validate(row) for row in reservations]
+    reserved_ids = frozenset(range(1, size + 1, 2))
+    tryout_adapter = TypeAdapter(PaginatedResponse[TryoutPublic])
+    reservation_adapter = TypeAdapter(PaginatedResponse[Reservation])
+    cached_page = _catalog_page(tryouts, size, size)
+
+    def tryouts_before() -> bytes:
+        page = PaginatedResponse[TryoutPublic](
+            total=size,
+            items=[
+                TryoutPublic(**t.model_dump(), isApplied=(t.id in reserved_ids))
+                for t in tryout_entities[:size]
+            ],
+        )
+        return fastapi_response(tryout_adapter, page)
+
+    def reservations_before() -> bytes:
+        page = PaginatedResponse[Reservation](
+            total=size,
+            items=[Reservation.model_validate(r) for r in reservation_entities[:size]],
+        )
+        return fastapi_response(reservation_adapter, page)
+
+    return {
+        "tryouts (before)": tryouts_before,
+        "tryouts (cache miss)": lambda: _tryout_page(
+            _catalog_page(tryouts, size, size), reserved_ids
+        ),
+        "tryouts (cache hit)": lambda: _tryout_page(cached_page, reserved_ids),
+        "reservations (before)": reservations_before,
+        "reservations": lambda: _reservation_page(reservations, size, size),
+    }
+
+
+def measure(fn: Callable[[], bytes], repeat: int) -> float:
+    fn()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    logger.info("%-24s %12s", f"page ({args.size})", "ms")
+    for name, fn in cases(args.size).items():
+        logger.info("%-24s %12.3f", name, measure(fn, args.repeat))
+
+
+if __name__ == "__main__":
+    main()